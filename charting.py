@@ -11,13 +11,16 @@ AdvancedChart component:
 * MACD (12/26/9) sub-panel
 
 Data source: fresh Yahoo history when reachable (up to 1y), falling back to
-the cached ``historical_data`` stored in cache/stock_data.json.
+the cached ``historical_data`` stored in cache/stock_data.json (read from the
+cache/history.parquet sidecar instead when pyarrow is installed and the
+sidecar is current, so only the one ticker's rows are loaded).
 
 API: GET /api/stock/<ticker>/chart?period=6mo
 """
 
 from __future__ import annotations
 
+import importlib.util
 import json
 import os
 from typing import Dict, List, Optional
@@ -26,6 +29,7 @@ import numpy as np
 import pandas as pd
 
 VALID_PERIODS = {"1mo", "3mo", "6mo", "1y", "2y"}
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
 
 
 def build_chart_payload(df: pd.DataFrame, ticker: str) -> Dict:
@@ -126,9 +130,36 @@ def get_chart_data(ticker: str, period: str = "6mo") -> Optional[Dict]:
     return build_chart_payload(df, ticker)
 
 
+def _history_from_sidecar(ticker: str, json_path: str) -> Optional[pd.DataFrame]:
+    """One ticker's bars from history.parquet, or None if absent / stale."""
+    path = os.path.join("cache", "history.parquet")
+    try:
+        if os.path.getmtime(path) < os.path.getmtime(json_path):
+            return None
+        rows = pd.read_parquet(path, filters=[("ticker", "==", ticker)])
+    except Exception:
+        return None
+    if rows.empty:
+        return None
+    return pd.DataFrame(
+        {
+            "Close": rows["close"].to_numpy(),
+            "High": rows["high"].to_numpy(),
+            "Low": rows["low"].to_numpy(),
+            "Volume": rows["volume"].to_numpy(),
+        },
+        index=pd.DatetimeIndex(rows["date"].to_numpy()),
+    )
+
+
 def _history_from_cache(ticker: str) -> Optional[pd.DataFrame]:
+    json_path = os.path.join("cache", "stock_data.json")
+    if _HAS_PYARROW:
+        df = _history_from_sidecar(ticker, json_path)
+        if df is not None:
+            return df
     try:
-        with open(os.path.join("cache", "stock_data.json")) as f:
+        with open(json_path) as f:
             rec = json.load(f).get(ticker) or {}
         hist = rec.get("historical_data")
         if not hist or not hist.get("close"):
@@ -140,7 +171,7 @@ def _history_from_cache(ticker: str) -> Optional[pd.DataFrame]:
                 "Low": hist.get("low", hist["close"]),
                 "Volume": hist.get("volume", [0] * len(hist["close"])),
             },
-            index=pd.to_datetime(hist["dates"]),
+            index=pd.DatetimeIndex(np.asarray(hist["dates"], dtype="datetime64[D]")),
         )
     except (FileNotFoundError, json.JSONDecodeError, KeyError, ValueError):
         return None
@@ -59,6 +59,7 @@
 
 import argparse
 import os
+import sys
 import csv
 import glob
 import json
@@ -74,6 +75,18 @@ from utils import load_scores, save_top_scores_to_csv, ensure_cache_dir, get_nas
 from run_filter import run_filter
 from master_list import MasterListManager
 
+# Status-line prefixes, built once instead of formatted on every call
+_RULE = "\n" + "=" * 60 + "\n"
+_STEP = "\n📋 "
+_OK = "✅ "
+_WARN = "⚠️  "
+_ERR = "❌ "
+
+
+def _write(*parts: str) -> None:
+    """Write pre-formatted status output without print()'s per-call overhead."""
+    sys.stdout.write("".join(parts))
+
 class BuyTheDipCLI:
     """Enhanced CLI interface with clear workflow and file organization."""
     
@@ -103,27 +116,26 @@ class BuyTheDipCLI:
     
     def print_header(self, title: str):
         """Print a clear section header."""
-        print(f"\n{'='*60}")
-        print(f"🤖 {title}")
-        print(f"{'='*60}")
+        _write(_RULE, "🤖 ", title, "\n", _RULE[1:])
     
     def print_step(self, step: str, detail: str = ""):
         """Print a workflow step."""
-        print(f"\n📋 {step}")
         if detail:
-            print(f"   {detail}")
+            _write(_STEP, step, "\n   ", detail, "\n")
+        else:
+            _write(_STEP, step, "\n")
     
     def print_success(self, message: str):
         """Print a success message."""
-        print(f"✅ {message}")
+        _write(_OK, message, "\n")
     
     def print_warning(self, message: str):
         """Print a warning message."""
-        print(f"⚠️  {message}")
+        _write(_WARN, message, "\n")
     
     def print_error(self, message: str):
         """Print an error message."""
-        print(f"❌ {message}")
+        _write(_ERR, message, "\n")
     
     # ═══════════════════════════════════════════════════════════════════════════════
     # 📊 STATUS & MONITORING
@@ -331,8 +343,12 @@ class BuyTheDipCLI:
             import traceback
             traceback.print_exc()
     
-    def score_stocks(self, score_all: bool = False, tickers_to_score: Optional[List[str]] = None):
-        """Apply enhanced 4-layer scoring methodology."""
+    def score_stocks(self, score_all: bool = False, tickers_to_score: Optional[List[str]] = None,
+                     workers: Optional[int] = None):
+        """Apply enhanced 4-layer scoring methodology.
+
+        *workers* is the number of scoring processes (default: one per core).
+        """
         self.print_header("ENHANCED SCORING ENGINE")
         
         # Check if we have data to score
@@ -378,7 +394,8 @@ class BuyTheDipCLI:
                 print(f"   🎯 Scoring all {len(scoring_tickers)} stocks (--all flag)")
             
             # Update scores
-            self.data_collector.update_daily_scores(scoring_tickers)
+            self.data_collector.update_daily_scores(
+                scoring_tickers, max_workers=workers or os.cpu_count() or 1)
             
             scoring_time = time.time() - start_time
             
@@ -773,9 +790,14 @@ class BuyTheDipCLI:
         
         # Tier 3: Recent Analysis
         if self.exports_dir.exists():
-            recent_exports = list(self.exports_dir.glob("*.csv"))
-            if recent_exports:
-                latest = max(recent_exports, key=lambda x: x.stat().st_mtime)
+            # scandir hands back cached stat info from the single directory read
+            with os.scandir(self.exports_dir) as entries:
+                latest = max(
+                    (e for e in entries if e.name.endswith(".csv") and e.is_file()),
+                    key=lambda e: e.stat().st_mtime,
+                    default=None,
+                )
+            if latest is not None:
                 mod_time = datetime.fromtimestamp(latest.stat().st_mtime)
                 print(f"\n🔬 TIER 3 - Latest Deep Analysis: {latest.name}")
                 print(f"   • Created: {mod_time.strftime('%Y-%m-%d %H:%M')}")
@@ -969,8 +991,7 @@ class BuyTheDipCLI:
     def _load_filtered_tickers(self, top_n: int) -> List[str]:
         """Load tickers from existing filter files for backward compatibility."""
         try:
-            all_tickers = run_filter(verbose=False)
-            return all_tickers[:top_n]
+            return run_filter(top_n=top_n, verbose=False)
         except Exception as e:
             print(f"   ⚠️  Error loading existing filters: {e}")
             print("   💡 Try using --fresh flag for smart filtering")
@@ -1076,6 +1097,8 @@ def main():
                        help='Stock ticker for detailed analysis')
     parser.add_argument('--all', action='store_true',
                        help='Score all available stocks (not just filtered list)')
+    parser.add_argument('--workers', type=int,
+                       help='Scoring processes for --score (default: one per CPU core)')
     parser.add_argument('--fresh', action='store_true',
                        help='Use smart filtering from cached ticker universe (6,387 validated tickers)')
     parser.add_argument('--refresh-cache', action='store_true',
@@ -1132,7 +1155,7 @@ def main():
             cli.collect_data(args.top, args.fresh, args.refresh_cache)
         
         if args.score:
-            cli.score_stocks(args.all)
+            cli.score_stocks(args.all, workers=args.workers)
         
         if args.export:
             cli.export_results(args.top)
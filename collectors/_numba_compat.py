@@ -0,0 +1,23 @@
+"""
+Optional Numba support for the collectors' numeric kernels.
+
+``numba`` is not a hard requirement.  When it is installed, kernels decorated
+with :func:`njit` are compiled to machine code on first call (and cached on
+disk); without it the decorator is a no-op and the same plain-Python loops
+run unchanged, so results are identical either way.
+"""
+
+try:
+    from numba import njit  # type: ignore
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit`` (bare or with options)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+__all__ = ['njit', 'NUMBA_AVAILABLE']
@@ -0,0 +1,68 @@
+"""
+Compiled kernel for the legacy ``utils.calculate_score``.
+
+All of its technical factors are reductions over the tail of one close /
+volume history, so they are computed in a single native pass here and the
+point buckets are applied in Python.
+"""
+
+import numpy as np
+
+from ._numba_compat import njit
+# numba's on-disk cache is keyed on this file only, not on the kernels it
+# calls: touch this module whenever those change so stale builds are dropped
+from ._technical_numba import macd_scalars, rsi_last
+
+
+@njit(cache=True)
+def _div(a, b):
+    # pandas semantics for x / 0: +-inf, or NaN for 0 / 0
+    if b != 0.0:
+        return a / b
+    if a > 0.0:
+        return np.inf
+    if a < 0.0:
+        return -np.inf
+    return np.nan
+
+
+@njit(cache=True)
+def _tail_mean(x, window, skipna):
+    n = x.shape[0]
+    total = 0.0
+    count = 0
+    for i in range(max(0, n - window), n):
+        v = x[i]
+        if v == v:
+            total += v
+            count += 1
+        elif not skipna:
+            return np.nan
+    return total / count if count > 0 else np.nan
+
+
+@njit(cache=True)
+def legacy_technicals(close, volume):
+    """Technical inputs of ``utils.calculate_score`` for one history.
+
+    Returns ``(drop_pct, rsi5, vol_ratio, sma200, sma50, macd_hist)`` where
+    ``drop_pct`` is the % drop from the 5-bar closing high, ``vol_ratio`` the
+    last volume as % of the 20-bar mean, and the SMAs are NaN when the
+    history is shorter than the window (or the window has a gap).
+    """
+    n = close.shape[0]
+    current = close[n - 1]
+
+    high_5d = -np.inf
+    for i in range(max(0, n - 5), n):
+        if close[i] > high_5d:
+            high_5d = close[i]
+    if high_5d == -np.inf:
+        high_5d = np.nan
+    drop_pct = _div(high_5d - current, high_5d) * 100.0
+
+    vol_ratio = _div(volume[n - 1], _tail_mean(volume, 20, True)) * 100.0
+    sma200 = _tail_mean(close, 200, False) if n >= 200 else np.nan
+    sma50 = _tail_mean(close, 50, False) if n >= 50 else np.nan
+    macd_hist = macd_scalars(close)[2]
+    return drop_pct, rsi_last(close, 5), vol_ratio, sma200, sma50, macd_hist
@@ -0,0 +1,173 @@
+"""
+Compiled kernels for ``TechnicalIndicators``.
+
+Each kernel works on a plain float64 ndarray and returns only the scalars the
+indicator helpers need, so no intermediate pandas Series are allocated.
+"""
+
+import numpy as np
+
+from ._numba_compat import njit
+
+# EMA smoothing factors for ``span`` = 12 / 26 / 9 (alpha = 2 / (span + 1))
+A12 = 2.0 / 13.0
+A26 = 2.0 / 27.0
+A9 = 2.0 / 10.0
+
+
+@njit(cache=True)
+def _ewm_step(mean, old_wt, v, alpha):
+    # One step of pandas' ewm(adjust=False, ignore_na=False) recurrence:
+    # the mean is seeded by the first non-NaN value, a NaN input keeps the
+    # mean but still decays its weight, so the next value counts for more.
+    if mean == mean:
+        old_wt *= 1.0 - alpha
+        if v == v:
+            if mean != v:
+                mean = (old_wt * mean + alpha * v) / (old_wt + alpha)
+            old_wt = 1.0
+    elif v == v:
+        mean = v
+        old_wt = 1.0
+    return mean, old_wt
+
+
+@njit(cache=True)
+def _ewma_2d(x, alpha):
+    n, k = x.shape
+    out = np.empty_like(x)
+    for j in range(k):
+        mean = np.nan
+        old_wt = 1.0
+        for i in range(n):
+            mean, old_wt = _ewm_step(mean, old_wt, x[i, j], alpha)
+            out[i, j] = mean
+    return out
+
+
+def ewma(x, alpha):
+    """Exponentially weighted mean along axis 0, like ``ewm(adjust=False)``.
+
+    Accepts a 1-D series or a 2-D (dates x tickers) array.  Each column is
+    seeded with its first non-NaN value, so NaN-padded shorter histories in a
+    panel start where their data starts; later NaNs carry the last value
+    (and are weighted like pandas' default ``ignore_na=False``).
+    """
+    arr = np.asarray(x, dtype=np.float64)
+    out = _ewma_2d(np.ascontiguousarray(arr.reshape(arr.shape[0], -1)), alpha)
+    return out.reshape(arr.shape)
+
+
+@njit(cache=True)
+def macd_scalars(close):
+    """Fused MACD(12, 26, 9) over *close* in a single pass.
+
+    Matches ``ewm(span=..., adjust=False)``, including its seeding (first
+    non-NaN price) and NaN gaps (see ``_ewm_step``).  Returns ``(macd, signal, histogram, bullish_cross, above_signal,
+    histogram_positive)`` where ``bullish_cross`` flags a MACD/signal
+    crossover within the last 5 bars.
+    """
+    n = close.shape[0]
+    a12 = A12
+    a26 = A26
+    a9 = A9
+
+    e12 = e26 = sig = np.nan
+    w12 = w26 = w9 = 1.0
+    macd = np.nan
+    # ring buffer of the last 6 (macd - signal) values
+    ring = np.zeros(6)
+    for i in range(n):
+        e12, w12 = _ewm_step(e12, w12, close[i], a12)
+        e26, w26 = _ewm_step(e26, w26, close[i], a26)
+        macd = e12 - e26
+        sig, w9 = _ewm_step(sig, w9, macd, a9)
+        ring[i % 6] = macd - sig
+
+    # Unroll the ring into chronological order, then flag a bullish
+    # crossover in the last 5 bars (diff goes from <= 0 to > 0) with one
+    # vectorized comparison instead of an indexed loop.
+    m = min(6, n)
+    d = np.empty(m)
+    for k in range(m):
+        d[k] = ring[(n - m + k) % 6]
+    bullish_cross = bool(((d[:-1] <= 0.0) & (d[1:] > 0.0)).any())
+
+    hist = macd - sig
+    return macd, sig, hist, bullish_cross, macd > sig, hist > 0.0
+
+
+@njit(cache=True)
+def price_extremes(high, low):
+    """One pass over the bars for the full-range and recent extremes.
+
+    Returns ``(high_max, low_min, high_5, high_20)`` where the last two are
+    the highest high of the final 5 / 20 bars.  NaNs are skipped (like
+    ``np.nanmax``); a window with no valid value yields NaN.
+    """
+    n = high.shape[0]
+    h_all = -np.inf
+    h5 = -np.inf
+    h20 = -np.inf
+    l_all = np.inf
+    for i in range(n):
+        h = high[i]
+        if h == h:
+            if h > h_all:
+                h_all = h
+            if i >= n - 20 and h > h20:
+                h20 = h
+            if i >= n - 5 and h > h5:
+                h5 = h
+        lo = low[i]
+        if lo == lo and lo < l_all:
+            l_all = lo
+    if h_all == -np.inf:
+        h_all = np.nan
+    if h20 == -np.inf:
+        h20 = np.nan
+    if h5 == -np.inf:
+        h5 = np.nan
+    if l_all == np.inf:
+        l_all = np.nan
+    return h_all, l_all, h5, h20
+
+
+@njit(cache=True)
+def _rsi_at(close, end, period):
+    # Same definition as utils.calculate_rsi: simple means of the gains and
+    # losses over the last ``period`` diffs, where the undefined first diff
+    # (and any NaN diff) counts as zero.
+    if end < period - 1:
+        return np.nan
+    gain = 0.0
+    loss = 0.0
+    for i in range(end - period + 1, end + 1):
+        if i == 0:
+            continue
+        d = close[i] - close[i - 1]
+        if d > 0.0:
+            gain += d
+        elif d < 0.0:
+            loss -= d
+    if loss == 0.0:
+        return 100.0 if gain > 0.0 else np.nan
+    rs = gain / loss
+    return 100.0 - 100.0 / (1.0 + rs)
+
+
+@njit(cache=True)
+def rsi_last(close, period):
+    """Latest value of ``utils.calculate_rsi(close, period)``."""
+    return _rsi_at(close, close.shape[0] - 1, period)
+
+
+@njit(cache=True)
+def rsi_tail(close, period, tail):
+    """The last ``tail`` values of ``utils.calculate_rsi(close, period)``."""
+    n = close.shape[0]
+    tail = min(tail, n)
+    out = np.empty(tail)
+    for k in range(tail):
+        out[k] = _rsi_at(close, n - tail + k, period)
+    return out
@@ -0,0 +1,59 @@
+"""
+Compiled kernel for ``VolumeAnalyzer``.
+
+The per-bar loops of the volume analysis (recent spike history, the
+multi-day distribution check and the on-balance-volume tail) run in one pass
+over plain float64 arrays and return primitives; the analyzer assembles the
+result dict in Python.
+"""
+
+from ._numba_compat import njit
+
+
+@njit(cache=True)
+def analyze_core(vol, close, vol_avg_20):
+    """Loop-heavy volume statistics for one ticker (``len(vol) >= 2``).
+
+    Returns ``(recent_spike_count, recent_down_days, recent_volume_avg,
+    obv_trend_recent)``:
+
+    * recent_spike_count - of the last 5 bars, how many traded >= 1.5x the
+      mean of the 20 bars before them (``vol_avg_20`` when fewer exist)
+    * recent_down_days / recent_volume_avg - over the last 3 bars, days that
+      fell more than 1% and their mean volume
+    * obv_trend_recent - signed volume of the last 5 bars (OBV increment)
+    """
+    n = vol.shape[0]
+
+    spikes = 0
+    for i in range(1, min(6, n)):
+        if n - i - 20 >= 0:
+            total = 0.0
+            for j in range(n - i - 20, n - i):
+                total += vol[j]
+            past_avg = total / 20.0
+        else:
+            past_avg = vol_avg_20
+        if past_avg > 0.0 and vol[n - i] / past_avg >= 1.5:
+            spikes += 1
+
+    down_days = 0
+    vol_sum = 0.0
+    days = min(4, n) - 1
+    for i in range(1, days + 1):
+        prev = close[n - i - 1]
+        change = (close[n - i] - prev) / prev * 100.0 if prev > 0.0 else 0.0
+        if change < -1.0:
+            down_days += 1
+        vol_sum += vol[n - i]
+    recent_volume_avg = vol_sum / days if days > 0 else 0.0
+
+    obv = 0.0
+    for i in range(max(1, n - 5), n):
+        diff = close[i] - close[i - 1]
+        if diff > 0.0:
+            obv += vol[i]
+        elif diff < 0.0:
+            obv -= vol[i]
+
+    return spikes, down_days, recent_volume_avg, obv
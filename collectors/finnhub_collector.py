@@ -15,13 +15,17 @@ variable ``FINNHUB_API_KEY`` or pass it explicitly to the constructor.  See
 from __future__ import annotations
 
 import os
+import threading
 import time
-from typing import Any, Dict, List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, List
 
 import pandas as pd
 
 try:
     import finnhub  # type: ignore
+    from finnhub import FinnhubAPIException  # type: ignore
 except ImportError as exc:  # pragma: no cover – handled at runtime
     raise ImportError(
         "Missing dependency: 'finnhub-python'. Add it to requirements.txt and pip install."
@@ -33,6 +37,9 @@ except ImportError as exc:  # pragma: no cover – handled at runtime
 # Free-tier Finnhub limits: 60 req/min.  Give ourselves some headroom.
 MIN_DELAY_SECONDS = 1.1   # ≥1 s between calls keeps well below 60/min
 MAX_CALLS_PER_MIN = 55    # rolling-window upper-bound
+SNAPSHOT_WORKERS = 4      # in-flight requests for get_stock_snapshots
+SNAPSHOT_TTL_SECONDS = 24 * 60 * 60  # profile / fundamentals barely move intraday
+SNAPSHOT_CACHE_SIZE = 5000           # memoised snapshots kept (LRU beyond that)
 
 
 # Custom exception used to signal a hard rate-limit (HTTP 429)
@@ -40,6 +47,16 @@ class RateLimitError(RuntimeError):
     pass
 
 
+def _raise_if_rate_limited(err: FinnhubAPIException) -> None:
+    """Translate an HTTP 429 from the SDK into :class:`RateLimitError`.
+
+    Branches on the response status code rather than ``"429" in str(err)`` so
+    a symbol or URL that merely contains those digits is not misread.
+    """
+    if getattr(err, "status_code", None) == 429:
+        raise RateLimitError(str(err)) from err
+
+
 class FinnhubCollector:
     """Tiny façade over the finnhub SDK providing throttled helper methods."""
 
@@ -54,12 +71,24 @@ class FinnhubCollector:
         self._min_delay = max(min_delay, MIN_DELAY_SECONDS)
         self._last_call_ts = 0.0
         self._rolling_window: List[float] = []  # stores epoch seconds of recent calls (≤60 s)
+        self._throttle_lock = threading.Lock()  # serialises slot booking across worker threads
+        # get_stock_snapshots memo: {symbol: (fetched_at, snapshot)}, oldest first
+        self._snapshots: OrderedDict[str, tuple] = OrderedDict()
+        self._snapshot_lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
     def _throttle(self) -> None:
-        """Apply both fixed delay and rolling-window throttling."""
+        """Apply both fixed delay and rolling-window throttling.
+
+        Thread-safe: the lock is held only while waiting for a slot, so the
+        HTTP request itself overlaps with the next caller's wait.
+        """
+        with self._throttle_lock:
+            self._throttle_locked()
+
+    def _throttle_locked(self) -> None:
         now = time.time()
 
         # 1) Fixed delay between consecutive calls
@@ -87,58 +116,63 @@ class FinnhubCollector:
 
         *None* is returned if any mandatory field is missing so the caller can
         treat the ticker as unsupported – mirroring current yahoo flow.
+        Network / API errors are printed and also give *None*.
+        """
+        try:
+            return self._fetch_snapshot(symbol)[0]
+        except RateLimitError:
+            # Bubble up hard rate-limit so callers can disable Finnhub gracefully
+            raise
+        except Exception as err:  # pragma: no cover – network / API error
+            print(f"! Finnhub error for {symbol}: {err}")
+            return None
+
+    def _fetch_snapshot(self, symbol: str) -> tuple:
+        """``get_stock_snapshot`` without its error handling.
+
+        Returns ``(snapshot, complete)``: *snapshot* is None for an
+        unsupported ticker, *complete* is False when the optional fundamentals
+        call failed.  Network / API errors raise.
         """
         self._throttle()
         try:
             # --- 1) Quote (price, volume) ---
             quote = self._client.quote(symbol)
             profile = self._client.company_profile2(symbol=symbol)
+        except FinnhubAPIException as err:
+            _raise_if_rate_limited(err)
+            raise
 
-            # --- 2) 52-week high/low via /stock/metric (price group) ---
-            hi_52w = lo_52w = None
-            try:
-                if hasattr(self._client, "stock_metric"):
-                    self._throttle()
-                    m_price = self._client.stock_metric(symbol, metric="price")
-                    m_dict = m_price.get("metric", {}) if isinstance(m_price, dict) else {}
-                    hi_52w = m_dict.get("52WeekHigh")
-                    lo_52w = m_dict.get("52WeekLow")
-            except Exception as m_err:
-                if "429" in str(m_err):
-                    raise RateLimitError(str(m_err)) from m_err
-                pass  # fall through to basic financials
-
-            # --- 3) Expanded fundamentals via company_basic_financials ---
-            fundamentals_metric = {}
-            try:
-                if hasattr(self._client, "company_basic_financials"):
-                    self._throttle()
-                    fin_data = self._client.company_basic_financials(symbol, "all")
-                    fundamentals_metric = fin_data.get("metric", {}) if isinstance(fin_data, dict) else {}
-                    # If 52w not obtained yet, attempt from this payload
-                    hi_52w = hi_52w or fundamentals_metric.get("52WeekHigh")
-                    lo_52w = lo_52w or fundamentals_metric.get("52WeekLow")
-            except Exception as f_err:
-                if "429" in str(f_err):
-                    raise RateLimitError(str(f_err)) from f_err
-                pass
-        except Exception as err:  # pragma: no cover – network / API error
-            # Bubble up hard rate-limit so callers can disable Finnhub gracefully
-            if "429" in str(err):
-                raise RateLimitError(str(err)) from err
-            print(f"! Finnhub error for {symbol}: {err}")
-            return None
-
+        # Bail out before the throttled fundamentals call when the ticker
+        # is unusable anyway (delisted / unsupported symbols are common).
         current_price = quote.get("c")  # Current price
         market_cap_mln = profile.get("marketCapitalization")  # in *millions*
-
         if not current_price or not market_cap_mln:
-            return None
+            return None, True
+
+        # --- 2) Expanded fundamentals + 52-week range via company_basic_financials ---
+        # The "all" metric group already carries 52WeekHigh/52WeekLow, so a
+        # separate /stock/metric?metric=price round trip is not needed.
+        hi_52w = lo_52w = None
+        fundamentals_metric = {}
+        complete = True
+        try:
+            if hasattr(self._client, "company_basic_financials"):
+                self._throttle()
+                fin_data = self._client.company_basic_financials(symbol, "all")
+                fundamentals_metric = fin_data.get("metric", {}) if isinstance(fin_data, dict) else {}
+                hi_52w = fundamentals_metric.get("52WeekHigh")
+                lo_52w = fundamentals_metric.get("52WeekLow")
+        except FinnhubAPIException as f_err:
+            _raise_if_rate_limited(f_err)
+            complete = False
+        except Exception:
+            complete = False
 
         # Finnhub sometimes sends volume None pre-market; coerce to 0 for downstream maths
         volume_val = quote.get("v") or 0
         # Try to replace with 10-day average trading volume from fundamentals if available
-        avg_vol = fundamentals_metric.get("10DayAverageTradingVolume") if 'fundamentals_metric' in locals() else None
+        avg_vol = fundamentals_metric.get("10DayAverageTradingVolume")
         if avg_vol is not None:
             # Finnhub returns in millions of shares; convert if value is < 1000
             if avg_vol < 1000:
@@ -170,7 +204,66 @@ class FinnhubCollector:
             "currency": profile.get("currency"),
         }
 
-        return snapshot
+        return snapshot, complete
+
+    def get_stock_snapshots(
+        self, symbols: Iterable[str], max_workers: int = SNAPSHOT_WORKERS
+    ) -> Dict[str, Dict[str, Any] | None]:
+        """``get_stock_snapshot`` for many symbols, memoised for a day.
+
+        Snapshots fetched within ``SNAPSHOT_TTL_SECONDS`` are reused, as are
+        unsupported-symbol misses so those are not asked again; the rest are
+        fetched on a small thread pool, where ``_throttle`` still spaces
+        the request starts, so round-trip latency overlaps the rate-limit wait.
+        Symbols whose fetch failed (network / API error) are left out and not
+        memoised.  After a :class:`RateLimitError` the queued fetches are
+        dropped and the snapshots gathered so far are returned.
+        """
+        now = time.monotonic()
+        results: Dict[str, Dict[str, Any] | None] = {}
+        missing: List[str] = []
+        with self._snapshot_lock:
+            for sym in dict.fromkeys(symbols):
+                cached = self._snapshots.get(sym)
+                if cached is not None and now - cached[0] < SNAPSHOT_TTL_SECONDS:
+                    self._snapshots.move_to_end(sym)
+                    results[sym] = cached[1]
+                else:
+                    missing.append(sym)
+        if not missing:
+            return results
+
+        rate_limited = False
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_symbol = {
+                executor.submit(self._fetch_snapshot, sym): sym for sym in missing
+            }
+            for future in as_completed(future_to_symbol):
+                sym = future_to_symbol[future]
+                if future.cancelled():
+                    continue
+                try:
+                    snapshot, complete = future.result()
+                except RateLimitError:
+                    if not rate_limited:
+                        rate_limited = True
+                        for pending in future_to_symbol:
+                            pending.cancel()
+                    continue
+                except Exception as err:  # pragma: no cover – network / API error
+                    print(f"! Finnhub error for {sym}: {err}")
+                    continue
+                results[sym] = snapshot
+                if not complete:
+                    continue
+                with self._snapshot_lock:
+                    self._snapshots[sym] = (time.monotonic(), snapshot)
+                    self._snapshots.move_to_end(sym)
+                    while len(self._snapshots) > SNAPSHOT_CACHE_SIZE:
+                        self._snapshots.popitem(last=False)
+        if rate_limited:
+            print(f"⚠️  Finnhub rate limit hit – {len(missing) - len(results)} snapshots skipped")
+        return results
 
     def get_month_history(self, symbol: str):
         """Return last-month daily OHLCV as ``pd.DataFrame`` (UTC, tz-naive)."""
@@ -180,12 +273,19 @@ class FinnhubCollector:
         self._throttle()
         try:
             candles = self._client.stock_candles(symbol, "D", start, end)
+        except FinnhubAPIException as err:  # pragma: no cover
+            _raise_if_rate_limited(err)
+            print(f"! Finnhub history error for {symbol}: {err}")
+            return None
         except Exception as err:  # pragma: no cover
-            if "429" in str(err):
-                raise RateLimitError(str(err)) from err
             print(f"! Finnhub history error for {symbol}: {err}")
             return None
 
+        return self._candles_to_frame(candles)
+
+    @staticmethod
+    def _candles_to_frame(candles: Dict[str, Any]) -> pd.DataFrame | None:
+        """Convert a raw ``stock_candles`` payload into an OHLCV DataFrame."""
         if candles.get("s") != "ok":  # Finnhub returns s == 'no_data' on failure
             return None
 
@@ -215,7 +315,8 @@ class FinnhubCollector:
         if hist_df is None or hist_df.empty:
             return None
 
-        avg_volume = hist_df["Volume"].mean() or snapshot.get("volume", 0)
+        vol = hist_df["Volume"].to_numpy(copy=False)
+        avg_volume = (float(vol.mean()) if vol.size else 0.0) or snapshot.get("volume", 0)
 
         return {
             "ticker": symbol,
@@ -227,7 +328,7 @@ class FinnhubCollector:
             "year_low": snapshot.get("52w_low"),
             "historical_data": {
                 "close": hist_df["Close"].tolist(),
-                "volume": hist_df["Volume"].tolist(),
+                "volume": vol.tolist(),
                 "high": hist_df["High"].tolist(),
                 "low": hist_df["Low"].tolist(),
                 "dates": hist_df.index.strftime("%Y-%m-%d").tolist(),
@@ -3,21 +3,47 @@ Fundamental data collector for enhanced dip analysis.
 
 Conservative implementation that builds on the market_data (yfinance) integration
 and avoids API rate limits by using cached data where possible.
+
+Extracted fundamentals are persisted per ticker in cache/fundamentals.json
+(TTL 24h) so re-scoring the universe after a restart does not re-fetch them.
+New fetches are appended to cache/fundamentals.jsonl and folded into the JSON
+snapshot the next time a collector loads the cache.
 """
 
+import json
 import pandas as pd
 import numpy as np
-from typing import Dict, Optional, Any
-import time
-import sys
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Any
 import os
-
-# Add parent directory to path to import existing utils
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import threading
 
 # Use the same API that works throughout the system
 from market_data import Ticker
 
+CACHE_FILE = os.path.join("cache", "fundamentals.json")
+CACHE_TTL_HOURS = 24
+
+
+# Template returned (copied) when no data is available for a ticker
+_EMPTY_FUND = {
+    'free_cash_flow': None, 'operating_cash_flow': None, 'total_cash': None,
+    'pe_ratio': None, 'forward_pe': None, 'peg_ratio': None, 'price_to_book': None,
+    'total_debt': None, 'debt_to_equity': None, 'current_ratio': None, 'quick_ratio': None,
+    'gross_margins': None, 'operating_margins': None, 'profit_margins': None,
+    'return_on_equity': None, 'return_on_assets': None, 'revenue_growth': None,
+    'earnings_growth': None, 'dividend_yield': None, 'payout_ratio': None,
+    'beta': None, 'market_cap': None, 'sector': '', 'industry': '',
+    'shares_outstanding': None, 'float_shares': None, 'short_ratio': None,
+    'short_percent_float': None, 'ticker': '', 'last_updated': '',
+    'debt_to_operating_cf': None, 'fcf_yield': None, 'quality_score': 0,
+    'financial_strength': 0, 'valuation_score': 0
+}
+
+SCORE_COLS = ['quality_score', 'financial_strength', 'valuation_score']
+# Every numeric field defaults to None in the template (strings to '', scores to 0)
+FUND_NUMERIC_COLS = [key for key, value in _EMPTY_FUND.items() if value is None]
+
 
 class FundamentalDataCollector:
     """
@@ -31,10 +57,16 @@ class FundamentalDataCollector:
     - Quality gate fundamentals
     """
     
-    def __init__(self):
+    def __init__(self, cache_file: Optional[str] = CACHE_FILE):
+        # Request pacing lives in market_data (shared rate limit + bounded
+        # concurrent fetches), so no per-collector sleep is needed here.
         self.cache = {}
-        self.rate_limit_delay = 1.0  # 1 second between API calls
-        self.last_api_call = 0
+        # On-disk cache survives restarts; None disables persistence
+        self.cache_file = cache_file
+        self._disk_cache: Optional[Dict] = None  # loaded lazily on first use
+        # append-only journal of fetches since the snapshot was last compacted
+        self.journal_file = (os.path.splitext(cache_file)[0] + ".jsonl"
+                             if cache_file is not None else None)
     
     def get_fundamental_metrics(self, ticker: str, use_cache: bool = True) -> Dict:
         """
@@ -47,148 +79,249 @@ class FundamentalDataCollector:
         Returns:
             Dictionary with fundamental metrics
         """
-        if use_cache and ticker in self.cache:
-            return self.cache[ticker]
+        return self.get_fundamental_metrics_batch([ticker], use_cache=use_cache)[ticker]
+    
+    def get_fundamentals_frame(self, tickers: List[str], use_cache: bool = True) -> pd.DataFrame:
+        """
+        Batch fundamentals as a typed DataFrame (see :func:`fundamentals_frame`).
         
-        try:
-            # Rate limiting
-            current_time = time.time()
-            if current_time - self.last_api_call < self.rate_limit_delay:
-                time.sleep(self.rate_limit_delay - (current_time - self.last_api_call))
+        Prefer this over the dict API when scoring or filtering a whole
+        universe column-wise.
+        """
+        return fundamentals_frame(self.get_fundamental_metrics_batch(tickers, use_cache=use_cache))
+    
+    def get_fundamental_metrics_batch(self, tickers: List[str], use_cache: bool = True) -> Dict[str, Dict]:
+        """
+        Get fundamental metrics for many tickers with one multi-symbol Ticker.
+        
+        The quote-summary modules are pulled once for the whole batch (each
+        returns ``{symbol: dict}``) and merged locally per ticker, instead of
+        building a Ticker and paying the rate-limit delay per symbol.
+        
+        Args:
+            tickers: Stock ticker symbols
+            use_cache: Whether to use cached data if available
             
+        Returns:
+            Dictionary mapping each ticker to its fundamental metrics
+        """
+        results = {}
+        to_fetch = []
+        for ticker in dict.fromkeys(tickers):
+            if use_cache and ticker in self.cache:
+                results[ticker] = self.cache[ticker]
+                continue
+            cached = self._get_disk_cached(ticker) if use_cache else None
+            if cached is not None:
+                self.cache[ticker] = cached
+                results[ticker] = cached
+            else:
+                to_fetch.append(ticker)
+        
+        if not to_fetch:
+            return results
+        
+        try:
             # Use market_data like the rest of the system
-            stock = Ticker(ticker)
+            stock = Ticker(" ".join(to_fetch))
             
             # Get fundamental data from multiple endpoints
-            summary_detail = stock.summary_detail.get(ticker, {})
-            financial_data = stock.financial_data.get(ticker, {})
-            key_stats = stock.key_stats.get(ticker, {})
-            company_info = stock.asset_profile.get(ticker, {})
-            
-            self.last_api_call = time.time()
-            
+            summary_map = stock.summary_detail
+            financial_map = stock.financial_data
+            stats_map = stock.key_stats
+            profile_map = stock.asset_profile
+        except Exception as e:
+            print(f"Error fetching fundamentals for {', '.join(to_fetch)}: {e}")
+            for ticker in to_fetch:
+                results[ticker] = self._empty_fundamentals(ticker)
+            return results
+        
+        fetched = {}
+        last_updated = datetime.now().isoformat()  # one stamp for the whole batch
+        for ticker in to_fetch:
             # Combine all data sources
-            combined_info = {**summary_detail, **financial_data, **key_stats, **company_info}
+            combined_info = {}
+            for module_map in (summary_map, financial_map, stats_map, profile_map):
+                module_data = module_map.get(ticker, {})
+                if isinstance(module_data, dict):
+                    combined_info.update(module_data)
             
             if not combined_info:
-                return self._empty_fundamentals()
+                results[ticker] = self._empty_fundamentals(ticker)
+                continue
             
-            # Extract key fundamental metrics
-            fundamentals = self._extract_key_metrics(combined_info, ticker)
+            # Extract key fundamental metrics (scored below, all at once)
+            fundamentals = self._extract_key_metrics(combined_info, ticker, include_scores=False,
+                                                     last_updated=last_updated)
             
             # Cache the results
             self.cache[ticker] = fundamentals
-            
-            return fundamentals
-            
-        except Exception as e:
-            print(f"Error fetching fundamentals for {ticker}: {e}")
-            return self._empty_fundamentals()
+            results[ticker] = fundamentals
+            fetched[ticker] = fundamentals
+        
+        if fetched:
+            scores = score_frame(pd.DataFrame.from_dict(fetched, orient='index'))
+            for ticker, ticker_scores in scores.to_dict('index').items():
+                fetched[ticker].update(ticker_scores)
+        
+        self._store_disk_cache(fetched)
+        return results
     
-    def _extract_key_metrics(self, info: Dict, ticker: str) -> Dict:
-        """Extract key fundamental metrics from Yahoo quote-summary data."""
+    def _get_disk_cached(self, ticker: str) -> Optional[Dict]:
+        """Return persisted fundamentals for *ticker* if still within the TTL."""
+        if self.cache_file is None:
+            return None
+        if self._disk_cache is None:
+            self._disk_cache = _load_cache(self.cache_file, self.journal_file)
+        entry = self._disk_cache.get(ticker)
+        if not entry:
+            return None
+        try:
+            if datetime.now() - datetime.fromisoformat(entry["fetched"]) \
+                    <= timedelta(hours=CACHE_TTL_HOURS):
+                return entry["data"]
+        except (KeyError, ValueError):
+            pass
+        return None
+    
+    def _store_disk_cache(self, fetched: Dict[str, Dict]):
+        """Persist freshly fetched fundamentals by appending them to the journal.
+
+        The snapshot is not rewritten here, so a cold scan costs one line per
+        ticker instead of one whole-file rewrite per batch.
+        """
+        if self.cache_file is None or not fetched:
+            return
+        if self._disk_cache is None:
+            self._disk_cache = _load_cache(self.cache_file, self.journal_file)
+        now = datetime.now().isoformat()
+        try:
+            lines = [json.dumps({"ticker": ticker, "fetched": now, "data": fundamentals}) + "\n"
+                     for ticker, fundamentals in fetched.items()]
+            os.makedirs(os.path.dirname(self.journal_file) or ".", exist_ok=True)
+            # unbuffered: each line is one append, so concurrent scoring
+            # processes never interleave inside a line
+            with open(self.journal_file, "ab", buffering=0) as f:
+                for line in lines:
+                    f.write(line.encode())
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Warning: could not persist fundamentals cache: {e}")
+        for ticker, fundamentals in fetched.items():
+            self._disk_cache[ticker] = {"fetched": now, "data": fundamentals}
+    
+    def _extract_key_metrics(self, info: Dict, ticker: str, include_scores: bool = True,
+                             last_updated: Optional[str] = None) -> Dict:
+        """Extract key fundamental metrics from Yahoo quote-summary data.
+
+        With ``include_scores=False`` the three 0-100 scores are left for the
+        caller to fill in, e.g. via :func:`score_frame` over a whole batch.
+        Batch callers pass ``last_updated`` so the timestamp is formatted once.
+        """
         try:
+            if last_updated is None:
+                last_updated = datetime.now().isoformat()
+
             # Quality Gate metrics (30-40% of methodology)
             fundamentals = {
                 # Cash flow metrics (from financial_data)
-                'free_cash_flow': self._safe_get(info, 'freeCashflow'),
-                'operating_cash_flow': self._safe_get(info, 'operatingCashflow'),
-                'total_cash': self._safe_get(info, 'totalCash'),
+                'free_cash_flow': self._safe_get_num(info, 'freeCashflow'),
+                'operating_cash_flow': self._safe_get_num(info, 'operatingCashflow'),
+                'total_cash': self._safe_get_num(info, 'totalCash'),
                 
                 # Valuation metrics (from summary_detail)
-                'pe_ratio': self._safe_get(info, 'trailingPE'),
-                'forward_pe': self._safe_get(info, 'forwardPE'),
-                'peg_ratio': self._safe_get(info, 'pegRatio'),
-                'price_to_book': self._safe_get(info, 'priceToBook'),
+                'pe_ratio': self._safe_get_num(info, 'trailingPE'),
+                'forward_pe': self._safe_get_num(info, 'forwardPE'),
+                'peg_ratio': self._safe_get_num(info, 'pegRatio'),
+                'price_to_book': self._safe_get_num(info, 'priceToBook'),
                 
                 # Debt and financial strength (from financial_data)
-                'total_debt': self._safe_get(info, 'totalDebt'),
-                'debt_to_equity': self._safe_get(info, 'debtToEquity'),
-                'current_ratio': self._safe_get(info, 'currentRatio'),
-                'quick_ratio': self._safe_get(info, 'quickRatio'),
+                'total_debt': self._safe_get_num(info, 'totalDebt'),
+                'debt_to_equity': self._safe_get_num(info, 'debtToEquity'),
+                'current_ratio': self._safe_get_num(info, 'currentRatio'),
+                'quick_ratio': self._safe_get_num(info, 'quickRatio'),
                 
                 # Profitability (from financial_data)
-                'gross_margins': self._safe_get(info, 'grossMargins'),
-                'operating_margins': self._safe_get(info, 'operatingMargins'),
-                'profit_margins': self._safe_get(info, 'profitMargins'),
-                'return_on_equity': self._safe_get(info, 'returnOnEquity'),
-                'return_on_assets': self._safe_get(info, 'returnOnAssets'),
+                'gross_margins': self._safe_get_num(info, 'grossMargins'),
+                'operating_margins': self._safe_get_num(info, 'operatingMargins'),
+                'profit_margins': self._safe_get_num(info, 'profitMargins'),
+                'return_on_equity': self._safe_get_num(info, 'returnOnEquity'),
+                'return_on_assets': self._safe_get_num(info, 'returnOnAssets'),
                 
                 # Growth metrics (from financial_data)
-                'revenue_growth': self._safe_get(info, 'revenueGrowth'),
-                'earnings_growth': self._safe_get(info, 'earningsGrowth'),
+                'revenue_growth': self._safe_get_num(info, 'revenueGrowth'),
+                'earnings_growth': self._safe_get_num(info, 'earningsGrowth'),
                 
                 # Dividend metrics (from summary_detail)
-                'dividend_yield': self._safe_get(info, 'dividendYield'),
-                'payout_ratio': self._safe_get(info, 'payoutRatio'),
+                'dividend_yield': self._safe_get_num(info, 'dividendYield'),
+                'payout_ratio': self._safe_get_num(info, 'payoutRatio'),
                 
                 # Market metrics (from summary_detail)
-                'beta': self._safe_get(info, 'beta'),
-                'market_cap': self._safe_get(info, 'marketCap'),
+                'beta': self._safe_get_num(info, 'beta'),
+                'market_cap': self._safe_get_num(info, 'marketCap'),
                 
                 # Sector information (from asset_profile)
                 'sector': info.get('sector', ''),
                 'industry': info.get('industry', ''),
                 
                 # Additional metrics (from key_stats)
-                'shares_outstanding': self._safe_get(info, 'sharesOutstanding'),
-                'float_shares': self._safe_get(info, 'floatShares'),
-                'short_ratio': self._safe_get(info, 'shortRatio'),
-                'short_percent_float': self._safe_get(info, 'shortPercentOfFloat'),
+                'shares_outstanding': self._safe_get_num(info, 'sharesOutstanding'),
+                'float_shares': self._safe_get_num(info, 'floatShares'),
+                'short_ratio': self._safe_get_num(info, 'shortRatio'),
+                'short_percent_float': self._safe_get_num(info, 'shortPercentOfFloat'),
                 
                 # Alternative field names that Yahoo might use
-                'enterprise_value': self._safe_get(info, 'enterpriseValue'),
-                'ebitda': self._safe_get(info, 'ebitda'),
-                'total_revenue': self._safe_get(info, 'totalRevenue'),
+                'enterprise_value': self._safe_get_num(info, 'enterpriseValue'),
+                'ebitda': self._safe_get_num(info, 'ebitda'),
+                'total_revenue': self._safe_get_num(info, 'totalRevenue'),
                 
                 # Metadata
                 'ticker': ticker,
-                'last_updated': pd.Timestamp.now().isoformat()
+                'last_updated': last_updated
             }
             
             # Calculate derived metrics
-            fundamentals.update(self._calculate_derived_metrics(fundamentals))
+            fundamentals.update(self._calculate_derived_metrics(fundamentals, include_scores))
             
             return fundamentals
             
         except Exception as e:
             print(f"Error extracting metrics for {ticker}: {e}")
-            return self._empty_fundamentals()
+            return self._empty_fundamentals(ticker)
     
-    def _calculate_derived_metrics(self, fundamentals: Dict) -> Dict:
+    def _calculate_derived_metrics(self, fundamentals: Dict, include_scores: bool = True) -> Dict:
         """Calculate derived fundamental metrics."""
         derived = {}
         
-        try:
-            # Debt/EBITDA approximation (if EBITDA not available, use operating cash flow)
-            total_debt = fundamentals.get('total_debt')
-            operating_cf = fundamentals.get('operating_cash_flow')
-            
-            if total_debt and operating_cf and operating_cf > 0:
-                derived['debt_to_operating_cf'] = total_debt / operating_cf
-            else:
-                derived['debt_to_operating_cf'] = None
-            
-            # Free Cash Flow yield
-            free_cash_flow = fundamentals.get('free_cash_flow')
-            market_cap = fundamentals.get('market_cap')
-            
-            if free_cash_flow and market_cap and market_cap > 0:
-                derived['fcf_yield'] = free_cash_flow / market_cap
-            else:
-                derived['fcf_yield'] = None
+        # Debt/EBITDA approximation (if EBITDA not available, use operating cash flow)
+        total_debt = _as_float(fundamentals.get('total_debt'))
+        operating_cf = _as_float(fundamentals.get('operating_cash_flow'))
+        
+        if np.isfinite(total_debt) and total_debt and operating_cf > 0:
+            derived['debt_to_operating_cf'] = total_debt / operating_cf
+        else:
+            derived['debt_to_operating_cf'] = None
+        
+        # Free Cash Flow yield
+        free_cash_flow = _as_float(fundamentals.get('free_cash_flow'))
+        market_cap = _as_float(fundamentals.get('market_cap'))
+        
+        if np.isfinite(free_cash_flow) and free_cash_flow and market_cap > 0:
+            derived['fcf_yield'] = free_cash_flow / market_cap
+        else:
+            derived['fcf_yield'] = None
+        
+        if include_scores:
+            # Scores see the derived ratios too (valuation uses fcf_yield)
+            scored = {**fundamentals, **derived}
             
             # Quality Score (0-100) based on methodology
-            derived['quality_score'] = self._calculate_quality_score(fundamentals)
+            derived['quality_score'] = self._calculate_quality_score(scored)
             
             # Financial Strength Score (0-100)
-            derived['financial_strength'] = self._calculate_financial_strength(fundamentals)
+            derived['financial_strength'] = self._calculate_financial_strength(scored)
             
             # Valuation Score (0-100, higher = more attractive)
-            derived['valuation_score'] = self._calculate_valuation_score(fundamentals)
-            
-        except Exception as e:
-            print(f"Error calculating derived metrics: {e}")
+            derived['valuation_score'] = self._calculate_valuation_score(scored)
         
         return derived
     
@@ -197,50 +330,45 @@ class FundamentalDataCollector:
         score = 0
         max_score = 100
         
-        try:
-            # Free cash flow positive (20 points)
-            fcf = fundamentals.get('free_cash_flow')
-            if fcf and fcf > 0:
-                score += 20
-            
-            # Operating margins > 10% (20 points)
-            op_margins = fundamentals.get('operating_margins')
-            if op_margins and op_margins > 0.10:
-                score += 20
-            elif op_margins and op_margins > 0.05:
-                score += 10
-            
-            # Return on equity > 15% (20 points)
-            roe = fundamentals.get('return_on_equity')
-            if roe and roe > 0.15:
-                score += 20
-            elif roe and roe > 0.10:
-                score += 10
-            
-            # Current ratio > 1.5 (15 points)
-            current_ratio = fundamentals.get('current_ratio')
-            if current_ratio and current_ratio > 1.5:
-                score += 15
-            elif current_ratio and current_ratio > 1.0:
-                score += 8
-            
-            # Debt to equity < 0.5 (15 points)
-            debt_equity = fundamentals.get('debt_to_equity')
-            if debt_equity is not None:
-                if debt_equity < 0.3:
-                    score += 15
-                elif debt_equity < 0.5:
-                    score += 10
-                elif debt_equity < 1.0:
-                    score += 5
-            
-            # Revenue growth positive (10 points)
-            rev_growth = fundamentals.get('revenue_growth')
-            if rev_growth and rev_growth > 0:
-                score += 10
-            
-        except Exception:
-            pass
+        # Free cash flow positive (20 points)
+        fcf = _as_float(fundamentals.get('free_cash_flow'))
+        if fcf > 0:
+            score += 20
+        
+        # Operating margins > 10% (20 points)
+        op_margins = _as_float(fundamentals.get('operating_margins'))
+        if op_margins > 0.10:
+            score += 20
+        elif op_margins > 0.05:
+            score += 10
+        
+        # Return on equity > 15% (20 points)
+        roe = _as_float(fundamentals.get('return_on_equity'))
+        if roe > 0.15:
+            score += 20
+        elif roe > 0.10:
+            score += 10
+        
+        # Current ratio > 1.5 (15 points)
+        current_ratio = _as_float(fundamentals.get('current_ratio'))
+        if current_ratio > 1.5:
+            score += 15
+        elif current_ratio > 1.0:
+            score += 8
+        
+        # Debt to equity < 0.5 (15 points)
+        debt_equity = _as_float(fundamentals.get('debt_to_equity'))
+        if debt_equity < 0.3:
+            score += 15
+        elif debt_equity < 0.5:
+            score += 10
+        elif debt_equity < 1.0:
+            score += 5
+        
+        # Revenue growth positive (10 points)
+        rev_growth = _as_float(fundamentals.get('revenue_growth'))
+        if rev_growth > 0:
+            score += 10
         
         return min(score, max_score)
     
@@ -248,56 +376,52 @@ class FundamentalDataCollector:
         """Calculate financial strength score (0-100)."""
         score = 0
         
-        try:
-            # Cash vs debt ratio
-            total_cash = fundamentals.get('total_cash', 0)
-            total_debt = fundamentals.get('total_debt', 0)
-            
-            if total_debt == 0:
-                score += 30  # No debt is excellent
-            elif total_cash > total_debt:
-                score += 25  # More cash than debt
-            elif total_cash > total_debt * 0.5:
-                score += 15  # Decent cash coverage
-            
-            # Profitability consistency
-            profit_margins = fundamentals.get('profit_margins')
-            if profit_margins and profit_margins > 0.10:
-                score += 25
-            elif profit_margins and profit_margins > 0.05:
-                score += 15
-            elif profit_margins and profit_margins > 0:
-                score += 5
-            
-            # Operating efficiency
-            op_margins = fundamentals.get('operating_margins')
-            gross_margins = fundamentals.get('gross_margins')
-            
-            if op_margins and gross_margins:
-                efficiency = op_margins / gross_margins if gross_margins > 0 else 0
-                if efficiency > 0.3:
-                    score += 20
-                elif efficiency > 0.2:
-                    score += 15
-                elif efficiency > 0.1:
-                    score += 10
-            
-            # Growth sustainability
-            rev_growth = fundamentals.get('revenue_growth', 0)
-            earnings_growth = fundamentals.get('earnings_growth', 0)
-            
-            if rev_growth > 0 and earnings_growth > 0:
-                score += 15
-            elif rev_growth > 0 or earnings_growth > 0:
-                score += 8
-            
-            # Dividend sustainability
-            payout_ratio = fundamentals.get('payout_ratio')
-            if payout_ratio is not None and payout_ratio < 0.6:
-                score += 10
-            
-        except Exception:
-            pass
+        # Cash vs debt ratio
+        total_cash = _as_float(fundamentals.get('total_cash', 0))
+        total_debt = _as_float(fundamentals.get('total_debt', 0))
+        
+        if total_debt == 0:
+            score += 30  # No debt is excellent
+        elif total_cash > total_debt:
+            score += 25  # More cash than debt
+        elif total_cash > total_debt * 0.5:
+            score += 15  # Decent cash coverage
+        
+        # Profitability consistency
+        profit_margins = _as_float(fundamentals.get('profit_margins'))
+        if profit_margins > 0.10:
+            score += 25
+        elif profit_margins > 0.05:
+            score += 15
+        elif profit_margins > 0:
+            score += 5
+        
+        # Operating efficiency
+        op_margins = _as_float(fundamentals.get('operating_margins'))
+        gross_margins = _as_float(fundamentals.get('gross_margins'))
+        
+        # Zero or missing margins leave efficiency at 0 / NaN - no points
+        efficiency = op_margins / gross_margins if gross_margins > 0 else 0.0
+        if efficiency > 0.3:
+            score += 20
+        elif efficiency > 0.2:
+            score += 15
+        elif efficiency > 0.1:
+            score += 10
+        
+        # Growth sustainability
+        rev_growth = _as_float(fundamentals.get('revenue_growth', 0))
+        earnings_growth = _as_float(fundamentals.get('earnings_growth', 0))
+        
+        if rev_growth > 0 and earnings_growth > 0:
+            score += 15
+        elif rev_growth > 0 or earnings_growth > 0:
+            score += 8
+        
+        # Dividend sustainability
+        payout_ratio = _as_float(fundamentals.get('payout_ratio'))
+        if payout_ratio < 0.6:
+            score += 10
         
         return min(score, 100)
     
@@ -305,59 +429,66 @@ class FundamentalDataCollector:
         """Calculate valuation attractiveness score (0-100)."""
         score = 0
         
-        try:
-            # P/E ratio scoring
-            pe = fundamentals.get('pe_ratio')
-            if pe:
-                if pe < 10:
-                    score += 30
-                elif pe < 15:
-                    score += 25
-                elif pe < 20:
-                    score += 20
-                elif pe < 25:
-                    score += 10
-            
-            # PEG ratio scoring
-            peg = fundamentals.get('peg_ratio')
-            if peg:
-                if peg < 1.0:
-                    score += 20
-                elif peg < 1.5:
-                    score += 15
-                elif peg < 2.0:
-                    score += 10
-            
-            # Price to book
-            pb = fundamentals.get('price_to_book')
-            if pb:
-                if pb < 1.0:
-                    score += 15
-                elif pb < 2.0:
-                    score += 10
-                elif pb < 3.0:
-                    score += 5
-            
-            # FCF yield
-            fcf_yield = fundamentals.get('fcf_yield')
-            if fcf_yield:
-                if fcf_yield > 0.08:  # 8%+ FCF yield
-                    score += 20
-                elif fcf_yield > 0.05:  # 5%+ FCF yield
-                    score += 15
-                elif fcf_yield > 0.03:  # 3%+ FCF yield
-                    score += 10
-            
-            # Dividend yield bonus
-            div_yield = fundamentals.get('dividend_yield')
-            if div_yield and div_yield > 0.03:  # 3%+ dividend
+        # P/E ratio scoring
+        pe = _as_float(fundamentals.get('pe_ratio'))
+        if pe:
+            if pe < 10:
+                score += 30
+            elif pe < 15:
+                score += 25
+            elif pe < 20:
+                score += 20
+            elif pe < 25:
+                score += 10
+        
+        # PEG ratio scoring
+        peg = _as_float(fundamentals.get('peg_ratio'))
+        if peg:
+            if peg < 1.0:
+                score += 20
+            elif peg < 1.5:
                 score += 15
-            
-        except Exception:
-            pass
+            elif peg < 2.0:
+                score += 10
+        
+        # Price to book
+        pb = _as_float(fundamentals.get('price_to_book'))
+        if pb:
+            if pb < 1.0:
+                score += 15
+            elif pb < 2.0:
+                score += 10
+            elif pb < 3.0:
+                score += 5
+        
+        # FCF yield
+        fcf_yield = _as_float(fundamentals.get('fcf_yield'))
+        if fcf_yield:
+            if fcf_yield > 0.08:  # 8%+ FCF yield
+                score += 20
+            elif fcf_yield > 0.05:  # 5%+ FCF yield
+                score += 15
+            elif fcf_yield > 0.03:  # 3%+ FCF yield
+                score += 10
+        
+        # Dividend yield bonus
+        div_yield = _as_float(fundamentals.get('dividend_yield'))
+        if div_yield > 0.03:  # 3%+ dividend
+            score += 15
         
         return min(score, 100)
     
+    def _safe_get_num(self, data: Dict, key: str) -> Any:
+        """Fast path of ``_safe_get`` for numeric fields (almost always float/None)."""
+        value = data.get(key)
+        if value is None:
+            return None
+        if isinstance(value, float):
+            return value if value == value else None  # NaN -> None
+        if isinstance(value, (int, np.integer)):
+            return value
+        return self._safe_get(data, key)
+    
     def _safe_get(self, data: Dict, key: str) -> Any:
         """Safely get a value from dict, handling various edge cases."""
         try:
@@ -372,18 +503,227 @@ class FundamentalDataCollector:
         except Exception:
             return None
     
-    def _empty_fundamentals(self) -> Dict:
+    def _empty_fundamentals(self, ticker: str = '') -> Dict:
         """Return empty fundamentals structure when data unavailable."""
-        return {
-            'free_cash_flow': None, 'operating_cash_flow': None, 'total_cash': None,
-            'pe_ratio': None, 'forward_pe': None, 'peg_ratio': None, 'price_to_book': None,
-            'total_debt': None, 'debt_to_equity': None, 'current_ratio': None, 'quick_ratio': None,
-            'gross_margins': None, 'operating_margins': None, 'profit_margins': None,
-            'return_on_equity': None, 'return_on_assets': None, 'revenue_growth': None,
-            'earnings_growth': None, 'dividend_yield': None, 'payout_ratio': None,
-            'beta': None, 'market_cap': None, 'sector': '', 'industry': '',
-            'shares_outstanding': None, 'float_shares': None, 'short_ratio': None,
-            'short_percent_float': None, 'ticker': '', 'last_updated': '',
-            'debt_to_operating_cf': None, 'fcf_yield': None, 'quality_score': 0,
-            'financial_strength': 0, 'valuation_score': 0
-        } 
\ No newline at end of file
+        return {**_EMPTY_FUND, 'ticker': ticker} 
+
+
+# Bucket ladders for score_frame: thresholds ascending, one more point value
+# than thresholds.  "value < t" ladders are looked up with side='right',
+# "value > t" ladders with side='left' (see _bucket).
+_OP_THR, _OP_PTS = np.array([0.05, 0.10]), np.array([0, 10, 20])
+_ROE_THR, _ROE_PTS = np.array([0.10, 0.15]), np.array([0, 10, 20])
+_CR_THR, _CR_PTS = np.array([1.0, 1.5]), np.array([0, 8, 15])
+_DE_THR, _DE_PTS = np.array([0.3, 0.5, 1.0]), np.array([15, 10, 5, 0])
+_PROFIT_THR, _PROFIT_PTS = np.array([0.0, 0.05, 0.10]), np.array([0, 5, 15, 25])
+_EFF_THR, _EFF_PTS = np.array([0.1, 0.2, 0.3]), np.array([0, 10, 15, 20])
+_PE_THR, _PE_PTS = np.array([10, 15, 20, 25]), np.array([30, 25, 20, 10, 0])
+_PEG_THR, _PEG_PTS = np.array([1.0, 1.5, 2.0]), np.array([20, 15, 10, 0])
+_PB_THR, _PB_PTS = np.array([1.0, 2.0, 3.0]), np.array([15, 10, 5, 0])
+_FCFY_THR, _FCFY_PTS = np.array([0.03, 0.05, 0.08]), np.array([0, 10, 15, 20])
+
+
+def _bucket(values: np.ndarray, thresholds: np.ndarray, points: np.ndarray,
+            side: str) -> np.ndarray:
+    """Piecewise-constant lookup: one binary search + gather per value.
+
+    ``side='left'`` counts thresholds strictly below the value (``value > t``
+    ladders); ``side='right'`` counts those at or below it (``value < t``).
+    NaN always scores 0, matching the scalar scorers' missing-data rule.
+    """
+    idx = np.searchsorted(thresholds, values, side=side)
+    return np.where(np.isnan(values), 0, points[idx])
+
+
+def _as_float(value: Any) -> float:
+    """Numeric view of a fundamentals field; None / non-numeric become NaN.
+
+    NaN fails every ``<`` / ``>`` threshold, so the scalar scorers need no
+    None checks or exception handling around their comparisons.
+    """
+    if isinstance(value, (int, float, np.number)):
+        return float(value)
+    return np.nan
+
+
+def _num_col(df: pd.DataFrame, name: str) -> np.ndarray:
+    """Column as float64 ndarray with None/missing mapped to NaN."""
+    if name not in df.columns:
+        return np.full(len(df), np.nan)
+    return pd.to_numeric(df[name], errors='coerce').to_numpy(dtype=float)
+
+
+def score_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Vectorized quality / financial-strength / valuation scores.
+
+    Operates on a DataFrame of extracted fundamentals (one row per ticker,
+    columns as produced by ``_extract_key_metrics``) and mirrors the per-ticker
+    ``_calculate_*`` ladders with ``np.searchsorted`` table lookups.  Missing values
+    (None/NaN) simply fail every threshold, so they contribute no points.
+
+    Returns a DataFrame with ``quality_score``, ``financial_strength`` and
+    ``valuation_score`` columns on the same index.
+    """
+    fcf = _num_col(df, 'free_cash_flow')
+    op = _num_col(df, 'operating_margins')
+    gross = _num_col(df, 'gross_margins')
+    profit = _num_col(df, 'profit_margins')
+    roe = _num_col(df, 'return_on_equity')
+    cr = _num_col(df, 'current_ratio')
+    de = _num_col(df, 'debt_to_equity')
+    rev = _num_col(df, 'revenue_growth')
+    eg = _num_col(df, 'earnings_growth')
+    cash = _num_col(df, 'total_cash')
+    debt = _num_col(df, 'total_debt')
+    payout = _num_col(df, 'payout_ratio')
+    pe = _num_col(df, 'pe_ratio')
+    peg = _num_col(df, 'peg_ratio')
+    pb = _num_col(df, 'price_to_book')
+    div = _num_col(df, 'dividend_yield')
+    fcf_yield = _num_col(df, 'fcf_yield')
+    if 'fcf_yield' not in df.columns:
+        mcap = _num_col(df, 'market_cap')
+        fcf_yield = np.where(mcap > 0, fcf / np.where(mcap > 0, mcap, 1.0), np.nan)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # --- Quality (mirrors _calculate_quality_score) ---
+        quality = (
+            np.where(fcf > 0, 20, 0)
+            + _bucket(op, _OP_THR, _OP_PTS, 'left')
+            + _bucket(roe, _ROE_THR, _ROE_PTS, 'left')
+            + _bucket(cr, _CR_THR, _CR_PTS, 'left')
+            + _bucket(de, _DE_THR, _DE_PTS, 'right')
+            + np.where(rev > 0, 10, 0)
+        )
+
+        # --- Financial strength (mirrors _calculate_financial_strength) ---
+        efficiency = np.where(gross > 0, op / gross, 0.0)
+        has_margins = (op != 0) & (gross != 0) & ~np.isnan(op) & ~np.isnan(gross)
+        strength = (
+            np.select([debt == 0, cash > debt, cash > debt * 0.5], [30, 25, 15], 0)
+            + _bucket(profit, _PROFIT_THR, _PROFIT_PTS, 'left')
+            + np.where(has_margins, _bucket(efficiency, _EFF_THR, _EFF_PTS, 'left'), 0)
+            + np.select([(rev > 0) & (eg > 0), (rev > 0) | (eg > 0)], [15, 8], 0)
+            + np.where(payout < 0.6, 10, 0)
+        )
+
+        # --- Valuation (mirrors _calculate_valuation_score) ---
+        # Zero counts as "no data" for the ratio ladders, as in the scalar path
+        valuation = (
+            np.where(pe != 0, _bucket(pe, _PE_THR, _PE_PTS, 'right'), 0)
+            + np.where(peg != 0, _bucket(peg, _PEG_THR, _PEG_PTS, 'right'), 0)
+            + np.where(pb != 0, _bucket(pb, _PB_THR, _PB_PTS, 'right'), 0)
+            + _bucket(fcf_yield, _FCFY_THR, _FCFY_PTS, 'left')
+            + np.where(div > 0.03, 15, 0)
+        )
+
+    return pd.DataFrame({
+        'quality_score': np.minimum(quality, 100).astype(np.int8),
+        'financial_strength': np.minimum(strength, 100).astype(np.int8),
+        'valuation_score': np.minimum(valuation, 100).astype(np.int8),
+    }, index=df.index)
+
+
+def fundamentals_frame(fundamentals: Dict[str, Dict]) -> pd.DataFrame:
+    """Pack per-ticker fundamentals dicts into one compactly typed DataFrame.
+
+    One row per ticker: numeric fields as ``float32`` (None -> NaN), sector /
+    industry as ``category`` and the 0-100 scores as ``int8`` - roughly a
+    tenth of the memory of the equivalent dicts for a large universe.
+    Scores are taken as already computed on float64 inputs, so narrowing
+    here cannot move a value across a scoring threshold.
+    """
+    rows = list(fundamentals.values())
+    columns = {
+        col: np.array([_as_float(row.get(col)) for row in rows], dtype=np.float32)
+        for col in FUND_NUMERIC_COLS
+    }
+    for col in ('sector', 'industry'):
+        columns[col] = pd.Categorical([row.get(col) or '' for row in rows])
+    for col in SCORE_COLS:
+        columns[col] = np.array([row.get(col) or 0 for row in rows], dtype=np.int8)
+    return pd.DataFrame(columns, index=pd.Index(list(fundamentals), name='ticker'))
+
+
+def _load_cache(path: str, journal: Optional[str] = None) -> Dict:
+    """The snapshot at *path* with the *journal* folded in.
+
+    One loader at a time (holding ``<journal>.lock``) also compacts: it claims
+    the journal by renaming it, so appends racing with the compaction start a
+    new journal instead of being lost, rewrites the snapshot and drops the
+    claimed file.  Loaders that find the lock taken only read.
+    """
+    lock = _try_lock(f"{journal}.lock") if journal is not None else None
+    try:
+        try:
+            with open(path) as f:
+                cache = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            cache = {}
+        if journal is None:
+            return cache
+        if lock is None:
+            _fold_journal(cache, journal)
+            return cache
+
+        claimed = f"{journal}.{os.getpid()}.{threading.get_ident()}"
+        try:
+            os.replace(journal, claimed)
+        except OSError:
+            return cache                  # nothing to fold in
+        _fold_journal(cache, claimed)
+        try:
+            _save_cache(path, cache)
+            os.remove(claimed)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Warning: could not compact fundamentals cache: {e}")
+        return cache
+    finally:
+        if lock is not None:
+            os.remove(lock)
+
+
+def _fold_journal(cache: Dict, journal: str):
+    """Apply the journal's entries, in order, onto *cache*."""
+    try:
+        with open(journal) as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    cache[entry["ticker"]] = {"fetched": entry["fetched"], "data": entry["data"]}
+                except (ValueError, KeyError, TypeError):
+                    continue              # torn line from an interrupted append
+    except FileNotFoundError:
+        pass
+
+
+def _try_lock(lock: str, stale_seconds: float = 60.0) -> Optional[str]:
+    """Create *lock* exclusively; None if another live loader holds it."""
+    for _ in range(2):
+        try:
+            os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return lock
+        except FileExistsError:
+            try:
+                # a lock left behind by a crashed process is broken once
+                if datetime.now().timestamp() - os.path.getmtime(lock) < stale_seconds:
+                    return None
+                os.remove(lock)
+            except OSError:
+                pass
+        except OSError:
+            return None
+    return None
+
+
+def _save_cache(path: str, cache: Dict):
+    """Write *cache* to a private temp file that then atomically replaces *path*."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
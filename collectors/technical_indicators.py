@@ -8,13 +8,32 @@ following the methodology from ScoresandMetrics.txt.
 import pandas as pd
 import numpy as np
 from typing import Dict, Optional, Tuple
-import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 
-# Add parent directory to path to import existing utils
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils import calculate_rsi
 
+from ._technical_numba import (
+    A9, A12, A26, ewma, macd_scalars, price_extremes, rsi_last, rsi_tail,
+)
+
+
+# Neutral defaults for short histories / failed calculations (copied per use)
+_EMPTY_IND = {
+    'rsi_14': 50, 'rsi_5': 50, 'rsi_oversold': False,
+    'rsi_extremely_oversold': False, 'rsi_divergence': False,
+    'macd_line': 0, 'macd_signal': 0, 'macd_histogram': 0,
+    'macd_bullish_cross': False, 'macd_above_signal': False,
+    'macd_histogram_positive': False,
+    'sma_20': None, 'sma_50': None, 'sma_200': None,
+    'below_sma_20': False, 'below_sma_50': False, 'below_sma_200': False,
+    'sma_20_distance_pct': 0, 'sma_50_distance_pct': 0, 'sma_200_distance_pct': 0,
+    'high_52w': 0, 'low_52w': 0, 'drop_from_52w_high_pct': 0,
+    'drop_from_5d_high_pct': 0, 'drop_from_20d_high_pct': 0,
+    'range_position_pct': 50, 'in_dip_zone': False,
+    'roc_5d': 0, 'roc_10d': 0, 'momentum_slowing': False
+}
+
 
 class TechnicalIndicators:
     """
@@ -45,22 +64,28 @@ class TechnicalIndicators:
             return self._empty_indicators()
         
         try:
+            # Unbox the columns once; the helpers work on plain ndarrays
+            close = stock_data["Close"].to_numpy(dtype=float)
+            high = stock_data["High"].to_numpy(dtype=float)
+            low = stock_data["Low"].to_numpy(dtype=float)
+            open_ = stock_data["Open"].to_numpy(dtype=float)
+            
             indicators = {}
             
             # Use existing RSI calculation from utils.py
-            indicators.update(self._calculate_rsi_indicators(stock_data))
+            indicators.update(self._calculate_rsi_indicators(close))
             
             # Enhanced MACD analysis
-            indicators.update(self._calculate_macd_indicators(stock_data))
+            indicators.update(self._calculate_macd_indicators(close))
             
             # SMA position analysis (key for dip detection)
-            indicators.update(self._calculate_sma_indicators(stock_data))
+            indicators.update(self._calculate_sma_indicators(close))
             
             # Price position analysis
-            indicators.update(self._calculate_price_position(stock_data))
+            indicators.update(self._calculate_price_position(close, high, low))
             
             # Momentum indicators
-            indicators.update(self._calculate_momentum_indicators(stock_data))
+            indicators.update(self._calculate_momentum_indicators(close, open_))
             
             return indicators
             
@@ -68,214 +93,275 @@ class TechnicalIndicators:
             print(f"Error calculating technical indicators for {ticker}: {e}")
             return self._empty_indicators()
     
-    def _calculate_rsi_indicators(self, stock_data: pd.DataFrame) -> Dict:
-        """Calculate RSI-based indicators using existing function."""
-        try:
-            # Use existing RSI function from utils.py
-            rsi_14 = calculate_rsi(stock_data["Close"], period=14)
-            rsi_5 = calculate_rsi(stock_data["Close"], period=5)
-            
-            current_rsi_14 = rsi_14.iloc[-1] if not rsi_14.empty else 50
-            current_rsi_5 = rsi_5.iloc[-1] if not rsi_5.empty else 50
+    def batch(self, stock_data: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+        """
+        Calculate indicators for many tickers into one DataFrame.
+        
+        The per-ticker dicts are collected first and assembled with a single
+        ``DataFrame.from_records`` call; callers should use this rather than
+        appending each result to a DataFrame in a loop (quadratic copying).
+        
+        Args:
+            stock_data: mapping of ticker -> OHLCV DataFrame
             
-            return {
-                'rsi_14': current_rsi_14,
-                'rsi_5': current_rsi_5,
-                'rsi_oversold': current_rsi_14 < 30,  # Classic oversold
-                'rsi_extremely_oversold': current_rsi_14 < 25,  # Extreme oversold
-                'rsi_divergence': self._check_rsi_divergence(stock_data, rsi_14)
-            }
-        except Exception:
-            return {
-                'rsi_14': 50, 'rsi_5': 50, 'rsi_oversold': False,
-                'rsi_extremely_oversold': False, 'rsi_divergence': False
-            }
+        Returns:
+            DataFrame indexed by ticker, one column per indicator
+        """
+        tickers = list(stock_data)
+        records = [self.calculate_all_indicators(stock_data[t], t) for t in tickers]
+        return pd.DataFrame.from_records(records, index=pd.Index(tickers, name='ticker'))
     
-    def _calculate_macd_indicators(self, stock_data: pd.DataFrame) -> Dict:
-        """Enhanced MACD analysis for dip detection."""
-        try:
-            # Calculate MACD components
-            ema_12 = stock_data["Close"].ewm(span=12, adjust=False).mean()
-            ema_26 = stock_data["Close"].ewm(span=26, adjust=False).mean()
-            macd_line = ema_12 - ema_26
-            signal_line = macd_line.ewm(span=9, adjust=False).mean()
-            histogram = macd_line - signal_line
-            
-            # Current values
-            current_macd = macd_line.iloc[-1]
-            current_signal = signal_line.iloc[-1]
-            current_histogram = histogram.iloc[-1]
+    def batch_parallel(self, stock_data: Dict[str, pd.DataFrame],
+                       max_workers: Optional[int] = None) -> pd.DataFrame:
+        """
+        Same result as ``batch`` but spread across worker processes.
+        
+        Each ticker's calculation is independent CPU work, so a process pool
+        sidesteps the GIL; ``chunksize`` batches the frames sent to each
+        worker to amortise pickling.  Worth it for large scans only - pool
+        start-up costs more than a few dozen tickers take serially.
+        
+        Args:
+            stock_data: mapping of ticker -> OHLCV DataFrame
+            max_workers: process count (default: ``os.cpu_count()``)
             
-            # Bullish crossover detection (last 5 days)
-            bullish_cross_recent = False
-            for i in range(1, min(6, len(macd_line))):
-                if (macd_line.iloc[-i-1] <= signal_line.iloc[-i-1] and 
-                    macd_line.iloc[-i] > signal_line.iloc[-i]):
-                    bullish_cross_recent = True
-                    break
+        Returns:
+            DataFrame indexed by ticker, one column per indicator
+        """
+        tickers = list(stock_data)
+        workers = max_workers or os.cpu_count() or 1
+        if workers <= 1 or len(tickers) < 2:
+            return self.batch(stock_data)
+        
+        chunksize = max(1, len(tickers) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            records = list(executor.map(_indicators_worker, stock_data.values(),
+                                        tickers, chunksize=chunksize))
+        return pd.DataFrame.from_records(records, index=pd.Index(tickers, name='ticker'))
+    
+    def calculate_all_indicators_panel(self, closes: pd.DataFrame, highs: pd.DataFrame,
+                                       lows: pd.DataFrame, opens: pd.DataFrame) -> pd.DataFrame:
+        """
+        Calculate indicators for many tickers at once from wide OHLC panels.
+        
+        Each panel has one row per date and one column per ticker, aligned on
+        the most recent date (shorter histories are NaN-padded at the top).
+        Every indicator becomes a column-wise pandas/NumPy reduction, so the
+        per-ticker Python overhead of ``calculate_all_indicators`` disappears.
+        
+        Args:
+            closes, highs, lows, opens: date x ticker price panels
             
-            return {
-                'macd_line': current_macd,
-                'macd_signal': current_signal,
-                'macd_histogram': current_histogram,
-                'macd_bullish_cross': bullish_cross_recent,
-                'macd_above_signal': current_macd > current_signal,
-                'macd_histogram_positive': current_histogram > 0
-            }
-        except Exception:
-            return {
-                'macd_line': 0, 'macd_signal': 0, 'macd_histogram': 0,
-                'macd_bullish_cross': False, 'macd_above_signal': False,
-                'macd_histogram_positive': False
-            }
+        Returns:
+            DataFrame indexed by ticker with the same columns as
+            ``calculate_all_indicators`` except ``rsi_divergence`` (a per-ticker
+            local-minimum scan). Missing SMAs are NaN rather than None.
+        """
+        closes = closes.astype(float)
+        highs = highs.astype(float)
+        lows = lows.astype(float)
+        opens = opens.astype(float)
+        counts = closes.notna().sum()
+        current_price = closes.iloc[-1]
+        out = {}
+        
+        # RSI - utils.calculate_rsi is already column-wise on a DataFrame
+        rsi_14 = calculate_rsi(closes, period=14).iloc[-1]
+        out['rsi_14'] = rsi_14
+        out['rsi_5'] = calculate_rsi(closes, period=5).iloc[-1]
+        out['rsi_oversold'] = rsi_14 < 30
+        out['rsi_extremely_oversold'] = rsi_14 < 25
+        
+        # MACD (same ewm seeding as the per-ticker kernel)
+        close_arr = closes.to_numpy()
+        macd_line = ewma(close_arr, A12) - ewma(close_arr, A26)
+        signal_line = ewma(macd_line, A9)
+        diff_tail = (macd_line - signal_line)[-6:]
+        out['macd_line'] = pd.Series(macd_line[-1], index=closes.columns)
+        out['macd_signal'] = pd.Series(signal_line[-1], index=closes.columns)
+        out['macd_histogram'] = out['macd_line'] - out['macd_signal']
+        out['macd_bullish_cross'] = pd.Series(
+            ((diff_tail[:-1] <= 0) & (diff_tail[1:] > 0)).any(axis=0), index=closes.columns)
+        out['macd_above_signal'] = out['macd_line'] > out['macd_signal']
+        out['macd_histogram_positive'] = out['macd_histogram'] > 0
+        
+        # SMA position
+        for window in (20, 50, 200):
+            sma = closes.rolling(window=window).mean().iloc[-1].where(counts >= window)
+            out[f'sma_{window}'] = sma
+            out[f'below_sma_{window}'] = current_price < sma
+            out[f'sma_{window}_distance_pct'] = ((current_price - sma) / sma * 100).fillna(0)
+        
+        # Price position
+        high_52w = highs.max()
+        low_52w = lows.min()
+        high_5d = highs.iloc[-5:].max()
+        high_20d = highs.iloc[-20:].max()
+        drop_from_52w_high = (high_52w - current_price) / high_52w * 100
+        out['high_52w'] = high_52w
+        out['low_52w'] = low_52w
+        out['drop_from_52w_high_pct'] = drop_from_52w_high
+        out['drop_from_5d_high_pct'] = (high_5d - current_price) / high_5d * 100
+        out['drop_from_20d_high_pct'] = (high_20d - current_price) / high_20d * 100
+        out['range_position_pct'] = (current_price - low_52w) / (high_52w - low_52w) * 100
+        out['in_dip_zone'] = (drop_from_52w_high >= 15) & (drop_from_52w_high <= 40)
+        
+        # Momentum
+        out['roc_5d'] = ((current_price / closes.iloc[-6] - 1) * 100).where(counts > 5, 0)
+        out['roc_10d'] = ((current_price / closes.iloc[-11] - 1) * 100).where(counts > 10, 0)
+        ranges = (closes - opens).abs().to_numpy()[-5:]
+        out['momentum_slowing'] = pd.Series(
+            (ranges[:-1] <= ranges[1:]).all(axis=0), index=closes.columns)
+        
+        # Tickers with too little history get the same defaults as the scalar path
+        valid = counts >= 20
+        for key, values in out.items():
+            default = _EMPTY_IND[key]
+            out[key] = values.where(valid, np.nan if default is None else default)
+        
+        return pd.DataFrame(out, index=closes.columns)
+    
+    def _calculate_rsi_indicators(self, close: np.ndarray) -> Dict:
+        """Calculate RSI-based indicators using existing function."""
+        # Same RSI as utils.calculate_rsi, but only the values actually used
+        current_rsi_14 = rsi_last(close, 14)
+        current_rsi_5 = rsi_last(close, 5)
+        
+        return {
+            'rsi_14': current_rsi_14,
+            'rsi_5': current_rsi_5,
+            'rsi_oversold': current_rsi_14 < 30,  # Classic oversold
+            'rsi_extremely_oversold': current_rsi_14 < 25,  # Extreme oversold
+            'rsi_divergence': self._check_rsi_divergence(close, rsi_tail(close, 14, 10))
+        }
+    
+    def _calculate_macd_indicators(self, close: np.ndarray) -> Dict:
+        """Enhanced MACD analysis for dip detection."""
+        # Single fused pass over the closes - no intermediate Series
+        (current_macd, current_signal, current_histogram,
+         bullish_cross_recent, above_signal, histogram_positive) = macd_scalars(close)
+        
+        return {
+            'macd_line': current_macd,
+            'macd_signal': current_signal,
+            'macd_histogram': current_histogram,
+            'macd_bullish_cross': bullish_cross_recent,
+            'macd_above_signal': above_signal,
+            'macd_histogram_positive': histogram_positive
+        }
     
-    def _calculate_sma_indicators(self, stock_data: pd.DataFrame) -> Dict:
+    def _calculate_sma_indicators(self, close: np.ndarray) -> Dict:
         """SMA position analysis - key for dip identification."""
-        try:
-            current_price = stock_data["Close"].iloc[-1]
-            
-            # Calculate SMAs
-            sma_20 = stock_data["Close"].rolling(window=20).mean().iloc[-1] if len(stock_data) >= 20 else None
-            sma_50 = stock_data["Close"].rolling(window=50).mean().iloc[-1] if len(stock_data) >= 50 else None
-            sma_200 = stock_data["Close"].rolling(window=200).mean().iloc[-1] if len(stock_data) >= 200 else None
-            
-            # Position relative to SMAs
-            below_sma_20 = sma_20 and current_price < sma_20
-            below_sma_50 = sma_50 and current_price < sma_50
-            below_sma_200 = sma_200 and current_price < sma_200
-            
-            # Distance from SMAs (percentage)
-            sma_20_distance = ((current_price - sma_20) / sma_20 * 100) if sma_20 else 0
-            sma_50_distance = ((current_price - sma_50) / sma_50 * 100) if sma_50 else 0
-            sma_200_distance = ((current_price - sma_200) / sma_200 * 100) if sma_200 else 0
-            
-            return {
-                'sma_20': sma_20,
-                'sma_50': sma_50,
-                'sma_200': sma_200,
-                'below_sma_20': below_sma_20,
-                'below_sma_50': below_sma_50,
-                'below_sma_200': below_sma_200,
-                'sma_20_distance_pct': sma_20_distance,
-                'sma_50_distance_pct': sma_50_distance,
-                'sma_200_distance_pct': sma_200_distance
-            }
-        except Exception:
-            return {
-                'sma_20': None, 'sma_50': None, 'sma_200': None,
-                'below_sma_20': False, 'below_sma_50': False, 'below_sma_200': False,
-                'sma_20_distance_pct': 0, 'sma_50_distance_pct': 0, 'sma_200_distance_pct': 0
-            }
+        current_price = close[-1]
+        
+        # Calculate SMAs - only the latest value is needed, so average the
+        # tail directly instead of building a full rolling series
+        sma_20 = close[-20:].mean() if len(close) >= 20 else None
+        sma_50 = close[-50:].mean() if len(close) >= 50 else None
+        sma_200 = close[-200:].mean() if len(close) >= 200 else None
+        
+        # Position relative to SMAs
+        below_sma_20 = sma_20 and current_price < sma_20
+        below_sma_50 = sma_50 and current_price < sma_50
+        below_sma_200 = sma_200 and current_price < sma_200
+        
+        # Distance from SMAs (percentage)
+        sma_20_distance = ((current_price - sma_20) / sma_20 * 100) if sma_20 else 0
+        sma_50_distance = ((current_price - sma_50) / sma_50 * 100) if sma_50 else 0
+        sma_200_distance = ((current_price - sma_200) / sma_200 * 100) if sma_200 else 0
+        
+        return {
+            'sma_20': sma_20,
+            'sma_50': sma_50,
+            'sma_200': sma_200,
+            'below_sma_20': below_sma_20,
+            'below_sma_50': below_sma_50,
+            'below_sma_200': below_sma_200,
+            'sma_20_distance_pct': sma_20_distance,
+            'sma_50_distance_pct': sma_50_distance,
+            'sma_200_distance_pct': sma_200_distance
+        }
     
-    def _calculate_price_position(self, stock_data: pd.DataFrame) -> Dict:
+    def _calculate_price_position(self, close: np.ndarray, high: np.ndarray,
+                                  low: np.ndarray) -> Dict:
         """Analyze price position relative to recent highs/lows."""
-        try:
-            current_price = stock_data["Close"].iloc[-1]
-            
-            # 52-week high/low (or available data)
-            high_52w = stock_data["High"].max()
-            low_52w = stock_data["Low"].min()
-            
-            # Recent highs (different timeframes)
-            high_5d = stock_data["High"].tail(5).max()
-            high_20d = stock_data["High"].tail(20).max()
-            
-            # Calculate drops from highs
-            drop_from_52w_high = ((high_52w - current_price) / high_52w) * 100
-            drop_from_5d_high = ((high_5d - current_price) / high_5d) * 100
-            drop_from_20d_high = ((high_20d - current_price) / high_20d) * 100
-            
-            # Position in 52-week range
-            range_position = ((current_price - low_52w) / (high_52w - low_52w)) * 100
-            
-            return {
-                'high_52w': high_52w,
-                'low_52w': low_52w,
-                'drop_from_52w_high_pct': drop_from_52w_high,
-                'drop_from_5d_high_pct': drop_from_5d_high,
-                'drop_from_20d_high_pct': drop_from_20d_high,
-                'range_position_pct': range_position,
-                'in_dip_zone': 15 <= drop_from_52w_high <= 40  # Sweet spot per methodology
-            }
-        except Exception:
-            return {
-                'high_52w': 0, 'low_52w': 0, 'drop_from_52w_high_pct': 0,
-                'drop_from_5d_high_pct': 0, 'drop_from_20d_high_pct': 0,
-                'range_position_pct': 50, 'in_dip_zone': False
-            }
+        current_price = close[-1]
+        
+        # 52-week high/low (or available data) and recent 5/20-day highs,
+        # all from a single scan of the bars
+        high_52w, low_52w, high_5d, high_20d = price_extremes(high, low)
+        
+        # Calculate drops from highs
+        drop_from_52w_high = ((high_52w - current_price) / high_52w) * 100
+        drop_from_5d_high = ((high_5d - current_price) / high_5d) * 100
+        drop_from_20d_high = ((high_20d - current_price) / high_20d) * 100
+        
+        # Position in 52-week range
+        range_position = ((current_price - low_52w) / (high_52w - low_52w)) * 100
+        
+        return {
+            'high_52w': high_52w,
+            'low_52w': low_52w,
+            'drop_from_52w_high_pct': drop_from_52w_high,
+            'drop_from_5d_high_pct': drop_from_5d_high,
+            'drop_from_20d_high_pct': drop_from_20d_high,
+            'range_position_pct': range_position,
+            'in_dip_zone': 15 <= drop_from_52w_high <= 40  # Sweet spot per methodology
+        }
     
-    def _calculate_momentum_indicators(self, stock_data: pd.DataFrame) -> Dict:
+    def _calculate_momentum_indicators(self, close: np.ndarray, open_: np.ndarray) -> Dict:
         """Additional momentum indicators for dip analysis."""
-        try:
-            # Rate of change
-            roc_5 = ((stock_data["Close"].iloc[-1] / stock_data["Close"].iloc[-6]) - 1) * 100 if len(stock_data) > 5 else 0
-            roc_10 = ((stock_data["Close"].iloc[-1] / stock_data["Close"].iloc[-11]) - 1) * 100 if len(stock_data) > 10 else 0
-            
-            # Momentum slowing (smaller red candles)
-            recent_ranges = []
-            for i in range(1, min(6, len(stock_data))):
-                day_range = abs(stock_data["Close"].iloc[-i] - stock_data["Open"].iloc[-i])
-                recent_ranges.append(day_range)
-            
-            momentum_slowing = len(recent_ranges) > 2 and all(
-                recent_ranges[i] <= recent_ranges[i-1] for i in range(1, len(recent_ranges))
-            )
-            
-            return {
-                'roc_5d': roc_5,
-                'roc_10d': roc_10,
-                'momentum_slowing': momentum_slowing
-            }
-        except Exception:
-            return {
-                'roc_5d': 0,
-                'roc_10d': 0,
-                'momentum_slowing': False
-            }
+        # Rate of change
+        roc_5 = ((close[-1] / close[-6]) - 1) * 100 if len(close) > 5 else 0
+        roc_10 = ((close[-1] / close[-11]) - 1) * 100 if len(close) > 10 else 0
+        
+        # Momentum slowing (smaller red candles) - body sizes of the last
+        # five sessions, oldest first, each no larger than the next
+        recent_ranges = np.abs(close[-5:] - open_[-5:])
+        momentum_slowing = len(recent_ranges) > 2 and bool(
+            (recent_ranges[:-1] <= recent_ranges[1:]).all()
+        )
+        
+        return {
+            'roc_5d': roc_5,
+            'roc_10d': roc_10,
+            'momentum_slowing': momentum_slowing
+        }
     
-    def _check_rsi_divergence(self, stock_data: pd.DataFrame, rsi_series: pd.Series) -> bool:
-        """Check for RSI divergence - price making lower lows while RSI makes higher lows."""
-        try:
-            if len(stock_data) < 10 or len(rsi_series) < 10:
-                return False
-            
-            # Look at last 10 periods for divergence
-            recent_prices = stock_data["Close"].tail(10)
-            recent_rsi = rsi_series.tail(10)
-            
-            # Find recent low points
-            price_lows = recent_prices.rolling(window=3, center=True).min()
-            rsi_lows = recent_rsi.rolling(window=3, center=True).min()
+    def _check_rsi_divergence(self, close: np.ndarray, rsi_recent: np.ndarray) -> bool:
+        """Check for RSI divergence - price making lower lows while RSI makes higher lows.
+        
+        ``rsi_recent`` holds the RSI values for the last (up to) 10 bars.
+        """
+        if len(close) < 10 or len(rsi_recent) < 10:
+            return False
+        
+        # Look at last 10 periods for divergence
+        p = close[-10:]
+        r = rsi_recent[-10:]
+        
+        # Local lows: interior points no higher than either neighbour
+        is_low = (p[1:-1] <= p[:-2]) & (p[1:-1] <= p[2:])
+        low_idx = np.flatnonzero(is_low) + 1
+        
+        # Simple divergence check: if we have 2+ lows
+        if low_idx.size >= 2:
+            first_low_idx = low_idx[0]
+            last_low_idx = low_idx[-1]
             
-            # Simple divergence check: if we have 2+ lows
-            price_low_indices = price_lows[price_lows == recent_prices].index
-            if len(price_low_indices) >= 2:
-                first_low_idx = price_low_indices[0]
-                last_low_idx = price_low_indices[-1]
-                
-                # Bullish divergence: price lower low, RSI higher low
-                price_lower = recent_prices[last_low_idx] < recent_prices[first_low_idx]
-                rsi_higher = recent_rsi[last_low_idx] > recent_rsi[first_low_idx]
-                
-                return price_lower and rsi_higher
+            # Bullish divergence: price lower low, RSI higher low
+            price_lower = p[last_low_idx] < p[first_low_idx]
+            rsi_higher = r[last_low_idx] > r[first_low_idx]
             
-            return False
-        except Exception:
-            return False
+            return bool(price_lower and rsi_higher)
+        
+        return False
     
     def _empty_indicators(self) -> Dict:
         """Return empty indicators structure when calculation fails."""
-        return {
-            'rsi_14': 50, 'rsi_5': 50, 'rsi_oversold': False,
-            'rsi_extremely_oversold': False, 'rsi_divergence': False,
-            'macd_line': 0, 'macd_signal': 0, 'macd_histogram': 0,
-            'macd_bullish_cross': False, 'macd_above_signal': False,
-            'macd_histogram_positive': False,
-            'sma_20': None, 'sma_50': None, 'sma_200': None,
-            'below_sma_20': False, 'below_sma_50': False, 'below_sma_200': False,
-            'sma_20_distance_pct': 0, 'sma_50_distance_pct': 0, 'sma_200_distance_pct': 0,
-            'high_52w': 0, 'low_52w': 0, 'drop_from_52w_high_pct': 0,
-            'drop_from_5d_high_pct': 0, 'drop_from_20d_high_pct': 0,
-            'range_position_pct': 50, 'in_dip_zone': False,
-            'roc_5d': 0, 'roc_10d': 0, 'momentum_slowing': False
-        } 
\ No newline at end of file
+        return _EMPTY_IND.copy()
+
+
+def _indicators_worker(stock_data: pd.DataFrame, ticker: str) -> Dict:
+    """Process-pool entry point for ``TechnicalIndicators.batch_parallel``."""
+    return TechnicalIndicators().calculate_all_indicators(stock_data, ticker)
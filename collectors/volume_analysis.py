@@ -5,11 +5,35 @@ Builds on existing volume logic in data_collector.py and utils.py
 to provide sophisticated volume spike analysis and pattern detection.
 """
 
+import os
 import pandas as pd
 import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 
+from ._volume_numba import analyze_core
+
+
+# Neutral defaults for short histories / failed calculations (copied per use)
+_EMPTY_VOLUME = {
+    'current_volume': 0, 'volume_avg_5d': 0, 'volume_avg_10d': 0,
+    'volume_avg_20d': 0, 'volume_avg_50d': 0, 'volume_ratio_5d': 1,
+    'volume_ratio_10d': 1, 'volume_ratio_20d': 1, 'volume_ratio_50d': 1,
+    'volume_spike_ratio': 1.0, 'volume_spike_classification': 'normal',
+    'volume_spike_score': 0, 'recent_spike_count': 0,
+    'in_spike_sweet_spot': False, 'extreme_volume': False, 'low_volume': False,
+    'volume_trend_5d': 0, 'volume_trend_10d': 0, 'volume_trend_20d': 0,
+    'volume_consistency_20d': 0, 'volume_momentum': 0,
+    'volume_increasing': False, 'volume_decreasing': False,
+    'capitulation_signal': False, 'accumulation_signal': False,
+    'distribution_signal': False, 'volume_exhaustion': False,
+    'forced_selling_likely': False, 'volume_price_correlation': 0,
+    'volume_confirms_trend': False, 'obv_trend_recent': 0,
+    'volume_leads_price': False
+}
+
 
 class VolumeAnalyzer:
     """
@@ -22,8 +46,11 @@ class VolumeAnalyzer:
     - Capitulation and accumulation signals
     """
     
+    CACHE_SIZE = 4096
+    
     def __init__(self):
-        self.cache = {}
+        # (ticker, last bar, length, last close/volume) -> analysis, LRU-bounded
+        self.cache = OrderedDict()
     
     def analyze_volume_patterns(self, stock_data: pd.DataFrame, ticker: str = "") -> Dict:
         """
@@ -39,283 +66,460 @@ class VolumeAnalyzer:
         if stock_data is None or len(stock_data) < 10:
             return self._empty_volume_analysis()
         
+        # The scorers analyse the same frame more than once per scan; the
+        # result only depends on the bars, so reuse it while the history
+        # for this ticker is unchanged
+        key = self._cache_key(stock_data, ticker)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.cache.move_to_end(key)
+                return dict(cached)
+        
         try:
+            # Unbox the columns once and share the common tail statistics
+            # with every sub-analyzer instead of re-slicing the DataFrame
+            raw_volume = stock_data["Volume"].to_numpy()
+            vol = raw_volume.astype(float, copy=False)
+            close = stock_data["Close"].to_numpy(dtype=float)
+            vol_avg_20 = vol[-20:].mean()
+            recent_spikes, down_days, recent_volume_avg, obv_trend = analyze_core(
+                vol, close, vol_avg_20)
+            ctx = {
+                'current_volume': raw_volume[-1],
+                'current_close': close[-1],
+                'prev_close': close[-2],
+                'vol_avg_5': vol[-5:].mean(),
+                'vol_avg_10': vol[-10:].mean(),
+                'vol_avg_20': vol_avg_20,
+                'vol_avg_50': vol[-50:].mean() if len(vol) >= 50 else vol_avg_20,
+                'recent_spike_count': recent_spikes,
+                'recent_down_days': down_days,
+                'recent_volume_avg': recent_volume_avg,
+                'obv_trend_recent': obv_trend,
+            }
+            
             analysis = {}
             
             # Basic volume metrics
-            analysis.update(self._calculate_basic_volume_metrics(stock_data))
+            analysis.update(self._calculate_basic_volume_metrics(ctx))
             
             # Volume spike detection (enhanced from existing logic)
-            analysis.update(self._detect_volume_spikes(stock_data))
+            analysis.update(self._detect_volume_spikes(ctx))
             
             # Volume trend analysis
-            analysis.update(self._analyze_volume_trends(stock_data))
+            analysis.update(self._analyze_volume_trends(vol, ctx))
             
             # Capitulation/accumulation signals
-            analysis.update(self._detect_volume_signals(stock_data))
+            analysis.update(self._detect_volume_signals(vol, ctx))
             
             # Volume vs price relationship
-            analysis.update(self._analyze_volume_price_relationship(stock_data))
+            analysis.update(self._analyze_volume_price_relationship(vol, close, ctx))
             
+            if key is not None:
+                self._remember(key, analysis)
+                return dict(analysis)
             return analysis
             
         except Exception as e:
             print(f"Error analyzing volume patterns for {ticker}: {e}")
             return self._empty_volume_analysis()
     
-    def _calculate_basic_volume_metrics(self, stock_data: pd.DataFrame) -> Dict:
-        """Calculate basic volume statistics."""
-        try:
-            current_volume = stock_data["Volume"].iloc[-1]
+    def analyze_many(self, stock_data: Dict[str, pd.DataFrame],
+                     max_workers: Optional[int] = None) -> Dict[str, Dict]:
+        """
+        ``analyze_volume_patterns`` for many tickers across worker processes.
+        
+        Tickers already in ``self.cache`` are answered locally; the rest are
+        analysed in a process pool and their results merged back into the
+        cache, since each worker only fills its own copy.
+        
+        Args:
+            stock_data: mapping of ticker -> OHLCV DataFrame
+            max_workers: process count (default: ``os.cpu_count()``)
             
-            # Various volume averages
-            vol_avg_5 = stock_data["Volume"].tail(5).mean()
-            vol_avg_10 = stock_data["Volume"].tail(10).mean()
-            vol_avg_20 = stock_data["Volume"].tail(20).mean()
-            vol_avg_50 = stock_data["Volume"].tail(50).mean() if len(stock_data) >= 50 else vol_avg_20
+        Returns:
+            Dictionary of ticker -> volume analysis
+        """
+        results = {}
+        pending = []
+        for ticker, frame in stock_data.items():
+            key = self._cache_key(frame, ticker)
+            if key is not None and key in self.cache:
+                self.cache.move_to_end(key)
+                results[ticker] = dict(self.cache[key])
+            else:
+                pending.append((ticker, frame))
+        
+        workers = max_workers or os.cpu_count() or 1
+        if workers <= 1 or len(pending) < 2:
+            for ticker, frame in pending:
+                results[ticker] = self.analyze_volume_patterns(frame, ticker)
+        else:
+            chunksize = max(1, len(pending) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                analyses = executor.map(_analyze_one, pending, chunksize=chunksize)
+                for (ticker, frame), analysis in zip(pending, analyses):
+                    key = self._cache_key(frame, ticker)
+                    if key is not None:
+                        self._remember(key, analysis)
+                    results[ticker] = dict(analysis)
+        
+        return {ticker: results[ticker] for ticker in stock_data}
+    
+    def _cache_key(self, stock_data: pd.DataFrame, ticker: str) -> Optional[Tuple]:
+        """Memo key for one ticker's history, or None when it is not cacheable."""
+        if not ticker or stock_data is None or len(stock_data) < 10:
+            return None
+        last = stock_data.index[-1]
+        return (ticker, getattr(last, 'value', last), len(stock_data),
+                stock_data['Close'].iat[-1], stock_data['Volume'].iat[-1])
+    
+    def _remember(self, key: Tuple, analysis: Dict) -> None:
+        self.cache[key] = analysis
+        if len(self.cache) > self.CACHE_SIZE:
+            self.cache.popitem(last=False)
+    
+    def analyze_volume_patterns_batch(self, volumes: pd.DataFrame,
+                                      closes: pd.DataFrame) -> pd.DataFrame:
+        """
+        Volume analysis for many tickers at once from wide panels.
+        
+        Both panels have one row per date and one column per ticker, aligned
+        on the most recent date (shorter histories NaN-padded at the top).
+        Every statistic of ``analyze_volume_patterns`` becomes an axis-0
+        reduction over the stacked arrays, so there is no per-ticker Python
+        dispatch.  Arithmetic stays in float64 so results match the
+        per-ticker path.
+        
+        Args:
+            volumes, closes: date x ticker panels
             
-            # Volume ratios
-            vol_ratio_5 = current_volume / vol_avg_5 if vol_avg_5 > 0 else 1
-            vol_ratio_10 = current_volume / vol_avg_10 if vol_avg_10 > 0 else 1
-            vol_ratio_20 = current_volume / vol_avg_20 if vol_avg_20 > 0 else 1
-            vol_ratio_50 = current_volume / vol_avg_50 if vol_avg_50 > 0 else 1
+        Returns:
+            DataFrame indexed by ticker with the ``analyze_volume_patterns``
+            columns; tickers with under 10 bars get the empty defaults, and
+            the volume/price relationship needs 20 bars (else defaults).
+        """
+        V = volumes.to_numpy(dtype=float)
+        C = closes.to_numpy(dtype=float)
+        counts = (~np.isnan(V)).sum(axis=0)
+        out = {}
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            def tail_mean(k):
+                return np.nanmean(V[-k:], axis=0)
             
-            return {
-                'current_volume': current_volume,
-                'volume_avg_5d': vol_avg_5,
-                'volume_avg_10d': vol_avg_10,
-                'volume_avg_20d': vol_avg_20,
-                'volume_avg_50d': vol_avg_50,
-                'volume_ratio_5d': vol_ratio_5,
-                'volume_ratio_10d': vol_ratio_10,
-                'volume_ratio_20d': vol_ratio_20,
-                'volume_ratio_50d': vol_ratio_50
-            }
-        except Exception:
-            return {
-                'current_volume': 0, 'volume_avg_5d': 0, 'volume_avg_10d': 0,
-                'volume_avg_20d': 0, 'volume_avg_50d': 0, 'volume_ratio_5d': 1,
-                'volume_ratio_10d': 1, 'volume_ratio_20d': 1, 'volume_ratio_50d': 1
-            }
+            # Basic volume metrics
+            cur = V[-1]
+            avg = {k: tail_mean(k) for k in (5, 10, 20)}
+            avg[50] = np.where(counts >= 50, tail_mean(50), avg[20])
+            out['current_volume'] = cur
+            for k in (5, 10, 20, 50):
+                out[f'volume_avg_{k}d'] = avg[k]
+            for k in (5, 10, 20, 50):
+                out[f'volume_ratio_{k}d'] = np.where(avg[k] > 0, cur / avg[k], 1.0)
+            
+            # Volume spikes
+            ratio = out['volume_ratio_20d']
+            out['volume_spike_ratio'] = ratio
+            out['volume_spike_classification'] = np.select(
+                [ratio >= 3.0, ratio >= 2.0, ratio >= 1.5, ratio >= 1.2],
+                ['extreme_spike', 'strong_spike', 'moderate_spike', 'mild_increase'], 'normal')
+            out['volume_spike_score'] = np.minimum(100, np.trunc((ratio - 1) * 50)).astype(int)
+            recent_spikes = np.zeros(V.shape[1], dtype=int)
+            for i in range(1, 6):
+                # Each of the last 5 days against the 20 days before it
+                past_avg = avg[20]
+                if V.shape[0] >= i + 20:
+                    past_avg = np.where(counts >= i + 20, V[-i - 20:-i].mean(axis=0), avg[20])
+                recent_spikes += (past_avg > 0) & (V[-i] / past_avg >= 1.5)
+            out['recent_spike_count'] = recent_spikes
+            out['in_spike_sweet_spot'] = (ratio >= 1.5) & (ratio <= 3.0)
+            out['extreme_volume'] = ratio >= 3.0
+            out['low_volume'] = ratio < 0.5
+            
+            # Volume trends
+            for k in (5, 10, 20):
+                out[f'volume_trend_{k}d'] = _trend_cols(V[-k:])
+            out['volume_consistency_20d'] = np.where(
+                avg[20] > 0, 1 / (1 + np.nanstd(V[-20:], axis=0, ddof=1) / avg[20]), 0)
+            older_avg = np.where(counts >= 15, V[-15:-10].mean(axis=0), avg[20])
+            out['volume_momentum'] = np.where(older_avg > 0, (avg[5] - older_avg) / older_avg, 0)
+            out['volume_increasing'] = out['volume_trend_10d'] > 0.02
+            out['volume_decreasing'] = out['volume_trend_10d'] < -0.02
+            
+            # Capitulation / accumulation / distribution signals
+            prev = C[-2]
+            price_change_pct = np.where(prev > 0, (C[-1] - prev) / prev * 100, 0)
+            signal_ratio = cur / avg[20]
+            out['capitulation_signal'] = (signal_ratio >= 2.0) & (price_change_pct <= -3.0)
+            out['accumulation_signal'] = ((signal_ratio >= 1.3) & (price_change_pct >= -1.0)
+                                          & (price_change_pct <= 2.0))
+            down_days = sum(
+                np.where(C[-i - 1] > 0, (C[-i] - C[-i - 1]) / C[-i - 1] * 100, 0) < -1
+                for i in range(1, 4))
+            out['distribution_signal'] = (down_days >= 2) & (V[-3:].mean(axis=0) > avg[20] * 1.5)
+            out['volume_exhaustion'] = (V[-2] > avg[20] * 2.5) & (cur < avg[20] * 1.2)
+            out['forced_selling_likely'] = (signal_ratio >= 2.5) & (price_change_pct <= -5.0)
+            
+            # Volume vs price relationship (last 20 bars)
+            rc, rv = C[-20:], V[-20:]
+            correlation = _pearson_cols(np.abs(rc[1:] / rc[:-1] - 1), rv[1:] / rv[:-1] - 1)
+            recent_trend = (rc[-1] - rc[0]) / rc[0]
+            early_volume = rv[:5].mean(axis=0)
+            recent_volume_trend = (rv[-5:].mean(axis=0) - early_volume) / early_volume
+            diff = np.diff(rc[-6:], axis=0)
+            out['volume_price_correlation'] = correlation
+            out['volume_confirms_trend'] = (((recent_trend > 0) | (recent_trend < 0))
+                                            & (recent_volume_trend > 0))
+            out['obv_trend_recent'] = np.where(diff > 0, rv[-5:], np.where(diff < 0, -rv[-5:], 0)).sum(axis=0)
+            out['volume_leads_price'] = correlation > 0.3
+        
+        frame = pd.DataFrame(out, index=volumes.columns)
+        empty = _EMPTY_VOLUME
+        relationship = ['volume_price_correlation', 'volume_confirms_trend',
+                        'obv_trend_recent', 'volume_leads_price']
+        for key in relationship:
+            frame[key] = frame[key].where(counts >= 20, empty[key])
+        short = counts < 10
+        if short.any():
+            frame.loc[short] = pd.DataFrame([empty] * int(short.sum()),
+                                            index=frame.index[short])
+        return frame
+    
+    def _calculate_basic_volume_metrics(self, ctx: Dict) -> Dict:
+        """Calculate basic volume statistics."""
+        current_volume = ctx['current_volume']
+        
+        # Various volume averages
+        vol_avg_5 = ctx['vol_avg_5']
+        vol_avg_10 = ctx['vol_avg_10']
+        vol_avg_20 = ctx['vol_avg_20']
+        vol_avg_50 = ctx['vol_avg_50']
+        
+        # Volume ratios
+        vol_ratio_5 = current_volume / vol_avg_5 if vol_avg_5 > 0 else 1
+        vol_ratio_10 = current_volume / vol_avg_10 if vol_avg_10 > 0 else 1
+        vol_ratio_20 = current_volume / vol_avg_20 if vol_avg_20 > 0 else 1
+        vol_ratio_50 = current_volume / vol_avg_50 if vol_avg_50 > 0 else 1
+        
+        return {
+            'current_volume': current_volume,
+            'volume_avg_5d': vol_avg_5,
+            'volume_avg_10d': vol_avg_10,
+            'volume_avg_20d': vol_avg_20,
+            'volume_avg_50d': vol_avg_50,
+            'volume_ratio_5d': vol_ratio_5,
+            'volume_ratio_10d': vol_ratio_10,
+            'volume_ratio_20d': vol_ratio_20,
+            'volume_ratio_50d': vol_ratio_50
+        }
     
-    def _detect_volume_spikes(self, stock_data: pd.DataFrame) -> Dict:
+    def _detect_volume_spikes(self, ctx: Dict) -> Dict:
         """Enhanced volume spike detection based on methodology."""
-        try:
-            current_volume = stock_data["Volume"].iloc[-1]
-            vol_avg_20 = stock_data["Volume"].tail(20).mean()
-            vol_ratio = current_volume / vol_avg_20 if vol_avg_20 > 0 else 1
-            
-            # Classification based on methodology (1.5x-3x is sweet spot)
-            spike_classification = "normal"
-            if vol_ratio >= 3.0:
-                spike_classification = "extreme_spike"
-            elif vol_ratio >= 2.0:
-                spike_classification = "strong_spike"
-            elif vol_ratio >= 1.5:
-                spike_classification = "moderate_spike"
-            elif vol_ratio >= 1.2:
-                spike_classification = "mild_increase"
-            
-            # Recent spike history (last 5 days)
-            recent_spikes = 0
-            for i in range(1, min(6, len(stock_data))):
-                past_vol = stock_data["Volume"].iloc[-i]
-                past_avg = stock_data["Volume"].iloc[-i-20:-i].mean() if i <= len(stock_data) - 20 else vol_avg_20
-                if past_avg > 0 and (past_vol / past_avg) >= 1.5:
-                    recent_spikes += 1
-            
-            # Volume spike score (0-100)
-            spike_score = min(100, int((vol_ratio - 1) * 50))
-            
-            # In sweet spot for dip hunting
-            in_spike_sweet_spot = 1.5 <= vol_ratio <= 3.0
-            
-            return {
-                'volume_spike_ratio': vol_ratio,
-                'volume_spike_classification': spike_classification,
-                'volume_spike_score': spike_score,
-                'recent_spike_count': recent_spikes,
-                'in_spike_sweet_spot': in_spike_sweet_spot,
-                'extreme_volume': vol_ratio >= 3.0,
-                'low_volume': vol_ratio < 0.5
-            }
-        except Exception:
-            return {
-                'volume_spike_ratio': 1.0, 'volume_spike_classification': 'normal',
-                'volume_spike_score': 0, 'recent_spike_count': 0,
-                'in_spike_sweet_spot': False, 'extreme_volume': False, 'low_volume': False
-            }
+        current_volume = ctx['current_volume']
+        vol_avg_20 = ctx['vol_avg_20']
+        vol_ratio = current_volume / vol_avg_20 if vol_avg_20 > 0 else 1
+        
+        # Classification based on methodology (1.5x-3x is sweet spot)
+        spike_classification = "normal"
+        if vol_ratio >= 3.0:
+            spike_classification = "extreme_spike"
+        elif vol_ratio >= 2.0:
+            spike_classification = "strong_spike"
+        elif vol_ratio >= 1.5:
+            spike_classification = "moderate_spike"
+        elif vol_ratio >= 1.2:
+            spike_classification = "mild_increase"
+        
+        # Recent spike history (last 5 days, from the compiled core)
+        recent_spikes = ctx['recent_spike_count']
+        
+        # Volume spike score (0-100)
+        spike_score = min(100, int((vol_ratio - 1) * 50))
+        
+        # In sweet spot for dip hunting
+        in_spike_sweet_spot = 1.5 <= vol_ratio <= 3.0
+        
+        return {
+            'volume_spike_ratio': vol_ratio,
+            'volume_spike_classification': spike_classification,
+            'volume_spike_score': spike_score,
+            'recent_spike_count': recent_spikes,
+            'in_spike_sweet_spot': in_spike_sweet_spot,
+            'extreme_volume': vol_ratio >= 3.0,
+            'low_volume': vol_ratio < 0.5
+        }
     
-    def _analyze_volume_trends(self, stock_data: pd.DataFrame) -> Dict:
+    def _analyze_volume_trends(self, vol: np.ndarray, ctx: Dict) -> Dict:
         """Analyze volume trends over different timeframes."""
-        try:
-            # Volume trend over last 5, 10, 20 days
-            vol_5d = stock_data["Volume"].tail(5)
-            vol_10d = stock_data["Volume"].tail(10)
-            vol_20d = stock_data["Volume"].tail(20)
-            
-            # Calculate trends (using linear regression slope)
-            def calculate_trend(values):
-                if len(values) < 3:
-                    return 0
-                x = np.arange(len(values))
-                y = values.values
-                slope = np.polyfit(x, y, 1)[0]
-                return slope / values.mean() if values.mean() > 0 else 0
-            
-            volume_trend_5d = calculate_trend(vol_5d)
-            volume_trend_10d = calculate_trend(vol_10d)
-            volume_trend_20d = calculate_trend(vol_20d)
-            
-            # Volume consistency (lower standard deviation = more consistent)
-            volume_consistency_20d = 1 / (1 + vol_20d.std() / vol_20d.mean()) if vol_20d.mean() > 0 else 0
-            
-            # Volume momentum (acceleration)
-            recent_avg = vol_5d.mean()
-            older_avg = vol_20d.tail(15).head(5).mean() if len(vol_20d) >= 15 else vol_20d.mean()
-            volume_momentum = (recent_avg - older_avg) / older_avg if older_avg > 0 else 0
-            
-            return {
-                'volume_trend_5d': volume_trend_5d,
-                'volume_trend_10d': volume_trend_10d,
-                'volume_trend_20d': volume_trend_20d,
-                'volume_consistency_20d': volume_consistency_20d,
-                'volume_momentum': volume_momentum,
-                'volume_increasing': volume_trend_10d > 0.02,  # 2% daily increase
-                'volume_decreasing': volume_trend_10d < -0.02   # 2% daily decrease
-            }
-        except Exception:
-            return {
-                'volume_trend_5d': 0, 'volume_trend_10d': 0, 'volume_trend_20d': 0,
-                'volume_consistency_20d': 0, 'volume_momentum': 0,
-                'volume_increasing': False, 'volume_decreasing': False
-            }
+        # Volume trend over last 5, 10, 20 days
+        vol_5d = vol[-5:]
+        vol_10d = vol[-10:]
+        vol_20d = vol[-20:]
+        
+        # Calculate trends (least-squares slope, normalised by the mean)
+        def calculate_trend(values):
+            n = len(values)
+            if n < 3:
+                return 0
+            # Closed-form OLS slope against x = 0..n-1; sum((x - x_mean)**2)
+            # over that range is n(n^2 - 1)/12, so no lstsq call is needed
+            y_mean = values.mean()
+            x_centered = np.arange(n) - (n - 1) / 2.0
+            slope = (x_centered * (values - y_mean)).sum() / (n * (n * n - 1) / 12.0)
+            return slope / y_mean if y_mean > 0 else 0
+        
+        volume_trend_5d = calculate_trend(vol_5d)
+        volume_trend_10d = calculate_trend(vol_10d)
+        volume_trend_20d = calculate_trend(vol_20d)
+        
+        # Volume consistency (lower standard deviation = more consistent)
+        vol_avg_20 = ctx['vol_avg_20']
+        volume_consistency_20d = 1 / (1 + vol_20d.std(ddof=1) / vol_avg_20) if vol_avg_20 > 0 else 0
+        
+        # Volume momentum (acceleration)
+        recent_avg = ctx['vol_avg_5']
+        older_avg = vol_20d[-15:-10].mean() if len(vol_20d) >= 15 else vol_avg_20
+        volume_momentum = (recent_avg - older_avg) / older_avg if older_avg > 0 else 0
+        
+        return {
+            'volume_trend_5d': volume_trend_5d,
+            'volume_trend_10d': volume_trend_10d,
+            'volume_trend_20d': volume_trend_20d,
+            'volume_consistency_20d': volume_consistency_20d,
+            'volume_momentum': volume_momentum,
+            'volume_increasing': volume_trend_10d > 0.02,  # 2% daily increase
+            'volume_decreasing': volume_trend_10d < -0.02   # 2% daily decrease
+        }
     
-    def _detect_volume_signals(self, stock_data: pd.DataFrame) -> Dict:
+    def _detect_volume_signals(self, vol: np.ndarray, ctx: Dict) -> Dict:
         """Detect capitulation and accumulation volume signals."""
-        try:
-            # Capitulation signal: high volume + price drop
-            current_price = stock_data["Close"].iloc[-1]
-            prev_price = stock_data["Close"].iloc[-2] if len(stock_data) > 1 else current_price
-            price_change_pct = ((current_price - prev_price) / prev_price) * 100 if prev_price > 0 else 0
-            
-            vol_ratio = stock_data["Volume"].iloc[-1] / stock_data["Volume"].tail(20).mean()
-            
-            # Capitulation: high volume + significant price drop
-            capitulation_signal = vol_ratio >= 2.0 and price_change_pct <= -3.0
-            
-            # Accumulation: above average volume + price stability/slight increase
-            accumulation_signal = vol_ratio >= 1.3 and -1.0 <= price_change_pct <= 2.0
-            
-            # Distribution: high volume + price drop over multiple days
-            recent_price_changes = []
-            recent_volumes = []
-            for i in range(1, min(4, len(stock_data))):
-                price_today = stock_data["Close"].iloc[-i]
-                price_yesterday = stock_data["Close"].iloc[-i-1] if len(stock_data) > i else price_today
-                change = ((price_today - price_yesterday) / price_yesterday) * 100 if price_yesterday > 0 else 0
-                recent_price_changes.append(change)
-                recent_volumes.append(stock_data["Volume"].iloc[-i])
-            
-            avg_recent_volume = np.mean(recent_volumes) if recent_volumes else 0
-            avg_baseline_volume = stock_data["Volume"].tail(20).mean()
-            distribution_signal = (
-                len(recent_price_changes) >= 2 and
-                sum(1 for x in recent_price_changes if x < -1) >= 2 and
-                avg_recent_volume > avg_baseline_volume * 1.5
-            )
-            
-            # Volume exhaustion: very high volume followed by normal volume
-            volume_exhaustion = False
-            if len(stock_data) >= 3:
-                yesterday_vol = stock_data["Volume"].iloc[-2]
-                today_vol = stock_data["Volume"].iloc[-1]
-                avg_vol = stock_data["Volume"].tail(20).mean()
-                volume_exhaustion = (yesterday_vol > avg_vol * 2.5 and 
-                                   today_vol < avg_vol * 1.2)
-            
-            return {
-                'capitulation_signal': capitulation_signal,
-                'accumulation_signal': accumulation_signal,
-                'distribution_signal': distribution_signal,
-                'volume_exhaustion': volume_exhaustion,
-                'forced_selling_likely': vol_ratio >= 2.5 and price_change_pct <= -5.0
-            }
-        except Exception:
-            return {
-                'capitulation_signal': False, 'accumulation_signal': False,
-                'distribution_signal': False, 'volume_exhaustion': False,
-                'forced_selling_likely': False
-            }
+        # Capitulation signal: high volume + price drop
+        current_price = ctx['current_close']
+        prev_price = ctx['prev_close']
+        price_change_pct = ((current_price - prev_price) / prev_price) * 100 if prev_price > 0 else 0
+        
+        avg_baseline_volume = ctx['vol_avg_20']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            vol_ratio = vol[-1] / avg_baseline_volume
+        
+        # Capitulation: high volume + significant price drop
+        capitulation_signal = vol_ratio >= 2.0 and price_change_pct <= -3.0
+        
+        # Accumulation: above average volume + price stability/slight increase
+        accumulation_signal = vol_ratio >= 1.3 and -1.0 <= price_change_pct <= 2.0
+        
+        # Distribution: high volume + price drop over multiple days
+        # (last 3 sessions, counted in the compiled core)
+        distribution_signal = (
+            ctx['recent_down_days'] >= 2 and
+            ctx['recent_volume_avg'] > avg_baseline_volume * 1.5
+        )
+        
+        # Volume exhaustion: very high volume followed by normal volume
+        volume_exhaustion = False
+        if len(vol) >= 3:
+            volume_exhaustion = (vol[-2] > avg_baseline_volume * 2.5 and
+                                 vol[-1] < avg_baseline_volume * 1.2)
+        
+        return {
+            'capitulation_signal': capitulation_signal,
+            'accumulation_signal': accumulation_signal,
+            'distribution_signal': distribution_signal,
+            'volume_exhaustion': volume_exhaustion,
+            'forced_selling_likely': vol_ratio >= 2.5 and price_change_pct <= -5.0
+        }
     
-    def _analyze_volume_price_relationship(self, stock_data: pd.DataFrame) -> Dict:
+    def _analyze_volume_price_relationship(self, vol: np.ndarray, close: np.ndarray,
+                                           ctx: Dict) -> Dict:
         """Analyze the relationship between volume and price movements."""
-        try:
-            # Volume-price correlation over last 20 days
-            if len(stock_data) < 20:
-                return {'volume_price_correlation': 0, 'volume_confirms_trend': False}
-            
-            recent_data = stock_data.tail(20)
-            price_changes = recent_data["Close"].pct_change().dropna()
-            volume_changes = recent_data["Volume"].pct_change().dropna()
+        # Volume-price correlation over last 20 days
+        if len(close) < 20:
+            return {'volume_price_correlation': 0, 'volume_confirms_trend': False}
+        
+        recent_close = close[-20:]
+        recent_vol = vol[-20:]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            price_changes = recent_close[1:] / recent_close[:-1] - 1
+            volume_changes = recent_vol[1:] / recent_vol[:-1] - 1
             
             # Correlation between volume and absolute price changes
-            abs_price_changes = abs(price_changes)
-            correlation = abs_price_changes.corr(volume_changes) if len(abs_price_changes) > 5 else 0
+            abs_price_changes = np.abs(price_changes)
+            n_price_changes = np.count_nonzero(~np.isnan(price_changes))
+            correlation = _pearson(abs_price_changes, volume_changes) if n_price_changes > 5 else 0
             
             # Volume confirmation of trend
-            recent_trend = (recent_data["Close"].iloc[-1] - recent_data["Close"].iloc[0]) / recent_data["Close"].iloc[0]
-            recent_volume_trend = (recent_data["Volume"].tail(5).mean() - recent_data["Volume"].head(5).mean()) / recent_data["Volume"].head(5).mean()
-            
-            # Volume confirms trend if both are in same direction
-            volume_confirms_trend = (
-                (recent_trend > 0 and recent_volume_trend > 0) or  # Up trend with volume
-                (recent_trend < 0 and recent_volume_trend > 0)     # Down trend with volume (selling)
-            )
-            
-            # On-balance volume approximation
-            obv_changes = []
-            for i in range(1, len(recent_data)):
-                price_change = recent_data["Close"].iloc[i] - recent_data["Close"].iloc[i-1]
-                volume = recent_data["Volume"].iloc[i]
-                if price_change > 0:
-                    obv_changes.append(volume)
-                elif price_change < 0:
-                    obv_changes.append(-volume)
-                else:
-                    obv_changes.append(0)
-            
-            obv_trend = sum(obv_changes[-5:]) if len(obv_changes) >= 5 else 0
-            
-            return {
-                'volume_price_correlation': correlation,
-                'volume_confirms_trend': volume_confirms_trend,
-                'obv_trend_recent': obv_trend,
-                'volume_leads_price': correlation > 0.3
-            }
-        except Exception:
-            return {
-                'volume_price_correlation': 0,
-                'volume_confirms_trend': False,
-                'obv_trend_recent': 0,
-                'volume_leads_price': False
-            }
+            recent_trend = (recent_close[-1] - recent_close[0]) / recent_close[0]
+            early_volume = recent_vol[:5].mean()
+            recent_volume_trend = (recent_vol[-5:].mean() - early_volume) / early_volume
+        
+        # Volume confirms trend if both are in same direction
+        volume_confirms_trend = (
+            (recent_trend > 0 and recent_volume_trend > 0) or  # Up trend with volume
+            (recent_trend < 0 and recent_volume_trend > 0)     # Down trend with volume (selling)
+        )
+        
+        # On-balance volume approximation (last 5 sessions, compiled core)
+        obv_trend = ctx['obv_trend_recent']
+        
+        return {
+            'volume_price_correlation': correlation,
+            'volume_confirms_trend': volume_confirms_trend,
+            'obv_trend_recent': obv_trend,
+            'volume_leads_price': correlation > 0.3
+        }
     
     def _empty_volume_analysis(self) -> Dict:
         """Return empty volume analysis when calculation fails."""
-        return {
-            'current_volume': 0, 'volume_avg_5d': 0, 'volume_avg_10d': 0,
-            'volume_avg_20d': 0, 'volume_avg_50d': 0, 'volume_ratio_5d': 1,
-            'volume_ratio_10d': 1, 'volume_ratio_20d': 1, 'volume_ratio_50d': 1,
-            'volume_spike_ratio': 1.0, 'volume_spike_classification': 'normal',
-            'volume_spike_score': 0, 'recent_spike_count': 0,
-            'in_spike_sweet_spot': False, 'extreme_volume': False, 'low_volume': False,
-            'volume_trend_5d': 0, 'volume_trend_10d': 0, 'volume_trend_20d': 0,
-            'volume_consistency_20d': 0, 'volume_momentum': 0,
-            'volume_increasing': False, 'volume_decreasing': False,
-            'capitulation_signal': False, 'accumulation_signal': False,
-            'distribution_signal': False, 'volume_exhaustion': False,
-            'forced_selling_likely': False, 'volume_price_correlation': 0,
-            'volume_confirms_trend': False, 'obv_trend_recent': 0,
-            'volume_leads_price': False
-        } 
\ No newline at end of file
+        return _EMPTY_VOLUME.copy()
+
+
+def _pearson(a: np.ndarray, b: np.ndarray) -> float:
+    """Pearson correlation over pairs where both values are present.
+
+    Same result as ``pd.Series.corr`` on the aligned series: NaN pairs are
+    dropped and a constant input gives NaN.
+    """
+    mask = ~(np.isnan(a) | np.isnan(b))
+    a = a[mask]
+    b = b[mask]
+    if a.size < 2:
+        return np.nan
+    da = a - a.mean()
+    db = b - b.mean()
+    denom = np.sqrt((da * da).sum() * (db * db).sum())
+    return (da * db).sum() / denom if denom > 0 else np.nan
+
+
+def _trend_cols(window: np.ndarray) -> np.ndarray:
+    """Column-wise ``calculate_trend`` over a NaN-padded (rows x tickers) window.
+
+    Each column's x axis starts at its first valid row, so a short history
+    is fitted over just its own bars, as in the per-ticker path.
+    """
+    valid = ~np.isnan(window)
+    n = valid.sum(axis=0)
+    x = np.cumsum(valid, axis=0) - 1.0  # 0..n-1 over each column's valid rows
+    y_mean = np.nanmean(window, axis=0)
+    x_centered = np.where(valid, x - (n - 1) / 2.0, 0.0)
+    slope = np.nansum(x_centered * (window - y_mean), axis=0) / (n * (n * n - 1) / 12.0)
+    return np.where((n >= 3) & (y_mean > 0), slope / y_mean, 0.0)
+
+
+def _pearson_cols(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Column-wise :func:`_pearson` for (rows x tickers) arrays."""
+    mask = ~(np.isnan(a) | np.isnan(b))
+    count = mask.sum(axis=0)
+    a = np.where(mask, a, 0.0)
+    b = np.where(mask, b, 0.0)
+    da = np.where(mask, a - a.sum(axis=0) / count, 0.0)
+    db = np.where(mask, b - b.sum(axis=0) / count, 0.0)
+    denom = np.sqrt((da * da).sum(axis=0) * (db * db).sum(axis=0))
+    return np.where((count >= 2) & (denom > 0), (da * db).sum(axis=0) / denom, np.nan)
+
+
+def _analyze_one(item: Tuple[str, pd.DataFrame]) -> Dict:
+    """Process-pool entry point for ``VolumeAnalyzer.analyze_many``."""
+    ticker, stock_data = item
+    return VolumeAnalyzer().analyze_volume_patterns(stock_data, ticker)
@@ -1,38 +1,76 @@
 import streamlit as st
 st.set_page_config(page_title="Buy-the-Dip Dashboard", layout="wide", page_icon="💹")
 
+import numpy as np
 import pandas as pd
 import glob
 import os
 import json
 import ast
+import importlib.util
 from datetime import datetime
 from st_aggrid import AgGrid, GridOptionsBuilder, JsCode, GridUpdateMode
 
+try:  # optional C JSON decoder - several times faster on the score_details column
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 """Streamlit dashboard for Buy-the-Dip Bot outputs.
 
 Place this file in the project root and launch with:
 
     streamlit run dashboard.py
 
-The app auto-detects the most recent `output/scan_*.csv` file, then
-builds an interactive dashboard with filters, charts and a detailed
+The app auto-detects the most recent `output/scan_*.parquet` / `scan_*.csv`
+file (Parquet sidecars are written by the tracker when pyarrow is
+installed and load without re-parsing text), then builds an interactive dashboard with filters, charts and a detailed
 score-breakdown table.
 """
 
 OUTPUT_DIR = "output"
 CSV_PATTERN = "scan_*.csv"
+PARQUET_PATTERN = "scan_*.parquet"
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+# Polars hands frames to pandas through Arrow, so it needs pyarrow as well
+_HAS_POLARS = _HAS_PYARROW and importlib.util.find_spec("polars") is not None
 
 # --------------------------- data loader -----------------------------------
 
+@st.cache_data(show_spinner=False)
+def read_scan_csv(path: str, mtime: float) -> pd.DataFrame:
+    """Parse a scan file once per (path, mtime) - reruns reuse the cached frame."""
+    if path.endswith(".parquet"):
+        df = pd.read_parquet(path)
+    elif _HAS_POLARS:
+        import polars as pl
+        # Polars' multithreaded reader; converted once since Streamlit,
+        # AgGrid and the filters below all work on pandas frames
+        df = pl.read_csv(path, infer_schema_length=10000).to_pandas()
+    elif _HAS_PYARROW:
+        # Multithreaded Arrow CSV parser, still producing NumPy-backed columns
+        df = pd.read_csv(path, engine="pyarrow")
+    else:
+        df = pd.read_csv(path)
+    # 32-bit (or smaller) numerics are plenty for display and halve the
+    # bytes every chart / table / rerun copy has to move
+    for c in df.select_dtypes(include=["float64", "int64"]).columns:
+        df[c] = pd.to_numeric(df[c], downcast="float" if df[c].dtype.kind == "f" else "integer")
+    return df
+
+
 def load_latest_csv():
-    """Return (df, path) for the newest scan CSV in *OUTPUT_DIR* or (None, None)."""
+    """Return (df, path) for the newest scan file in *OUTPUT_DIR* or (None, None)."""
     csv_files = glob.glob(os.path.join(OUTPUT_DIR, CSV_PATTERN))
+    if _HAS_PYARROW:
+        csv_files += glob.glob(os.path.join(OUTPUT_DIR, PARQUET_PATTERN))
     if not csv_files:
         return None, None
-    latest_path = max(csv_files, key=os.path.getmtime)
+    # Newest first; a Parquet sidecar wins over its CSV twin from the same scan
+    latest_path = max(csv_files, key=lambda p: (os.path.getmtime(p), p.endswith(".parquet")))
     try:
-        df = pd.read_csv(latest_path)
+        df = read_scan_csv(latest_path, os.path.getmtime(latest_path))
         return df, latest_path
     except Exception as e:
         st.error(f"Failed to read CSV `{latest_path}`: {e}")
@@ -40,36 +78,49 @@ def load_latest_csv():
 
 # --------------------------- helpers ---------------------------------------
 
+def _parse_details(x):
+    """Decode one score_details cell (JSON text, dict repr or already a dict)."""
+    if isinstance(x, dict):
+        return x
+    if not isinstance(x, (str, bytes)):  # NaN / None
+        return {}
+    try:
+        return _json_loads(x)
+    except ValueError:  # includes orjson / json decode errors
+        try:
+            return ast.literal_eval(x)
+        except Exception:
+            return {}
+
+
 def unpack_score_details(df: pd.DataFrame) -> pd.DataFrame:
-    """Expand the *score_details* JSON column into flat numeric columns."""
+    """Expand the *score_details* JSON column into flat numeric columns.
+
+    Returns only the new ``*_pts`` columns (aligned to ``df.index``) so the
+    caller can concat them onto *df* without copying the scan table first.
+    """
     if "score_details" not in df.columns:
-        return df
+        return pd.DataFrame(index=df.index)
+
+    # One normalise call flattens every row's {metric: {"points": ...}} into
+    # "metric.points" columns; rows missing a metric get 0
+    parsed = [_parse_details(x) for x in df["score_details"].to_numpy()]
+    flat = pd.json_normalize(parsed, sep=".")
+    pts_cols = [c for c in flat.columns if c.endswith(".points")]
+    out = flat[pts_cols].fillna(0)
+    out.columns = [c[:-len(".points")] + "_pts" for c in pts_cols]
+    out.index = df.index
+    return out
 
-    def _try_parse(x):
-        if pd.isna(x):
-            return {}
-        if isinstance(x, dict):
-            return x
-        try:
-            return json.loads(x)
-        except Exception:
-            try:
-                return ast.literal_eval(x)
-            except Exception:
-                return {}
-
-    details_series = df["score_details"].apply(_try_parse)
-    metrics = {}
-    for item in details_series:
-        for k, v in item.items():
-            pts = v.get("points", 0)
-            metrics.setdefault(k, []).append(pts)
-    for k, vals in metrics.items():
-        if len(vals) < len(df):
-            # pad if some rows missing
-            vals += [0] * (len(df) - len(vals))
-        df[k + "_pts"] = vals
-    return df
+
+@st.cache_data(show_spinner=False)
+def unpack_score_details_cached(path: str, mtime: float) -> pd.DataFrame:
+    """``unpack_score_details`` for a scan file, cached per (path, mtime).
+
+    Keyed on the file rather than the DataFrame so Streamlit does not have to
+    hash the whole table on every rerun.
+    """
+    return unpack_score_details(read_scan_csv(path, mtime))
 
 # ----------------------------- main ----------------------------------------
 
@@ -82,19 +133,31 @@ if df is None:
 if "timestamp" in df.columns:
     df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce")
 
+# Numeric columns can arrive as object dtype (mixed NaN / Arrow strings);
+# coerce them once so the maths below stays on NumPy arrays
+for c in ("year_high", "price", "score", "market_cap"):
+    if c in df.columns:
+        df[c] = pd.to_numeric(df[c], errors="coerce", downcast="float")
+
 # Add 52-week % drop column if missing
 if "%_below_high" not in df.columns and {"price", "year_high"}.issubset(df.columns):
-    df["%_below_high"] = ((df["year_high"] - df["price"]) / df["year_high"]) * 100
+    yh = df["year_high"].to_numpy(dtype=float)
+    pr = df["price"].to_numpy(dtype=float)
+    df["%_below_high"] = np.divide((yh - pr) * 100, yh, out=np.full(len(df), np.nan), where=yh > 0)
 
-# Unpack score_details for table view
-_df = unpack_score_details(df.copy())
+# Rank once; every view below (header, filters, tabs) keeps this order.
+# Original row labels are kept so the tab-3 breakdown still joins by index.
+df = df.sort_values("score", ascending=False, na_position="last", kind="stable")
+
+# score_details is only expanded for the Breakdown Table (tab 3)
+_df = df
 
 # --------------------------- HEADER / METRICS ------------------------------
 
 last_update = _df["timestamp"].max() if "timestamp" in _df.columns else None
 avg_score = _df["score"].mean()
-max_idx = _df["score"].idxmax()
-min_idx = _df["score"].idxmin()
+max_idx = _df.index[0]
+min_idx = _df["score"].last_valid_index()
 
 top_ticker, top_score = _df.loc[max_idx, ["ticker", "score"]]
 bottom_ticker, bottom_score = _df.loc[min_idx, ["ticker", "score"]]
@@ -120,12 +183,12 @@ score_range = st.sidebar.slider("Score range", min_score, max_score, (min_score,
 
 # TODO: Sector filter when sector column available
 
-# Apply filters
-filtered = _df.copy()
+# Apply filters as one boolean mask and a single slice (no intermediate copies)
+scores = _df["score"].to_numpy()
+mask = (scores >= score_range[0]) & (scores <= score_range[1])
 if search_ticker:
-    filtered = filtered[filtered["ticker"].str.contains(search_ticker.upper(), na=False)]
-
-filtered = filtered[(filtered["score"] >= score_range[0]) & (filtered["score"] <= score_range[1])]
+    mask &= _df["ticker"].str.contains(search_ticker.upper(), regex=False, na=False).to_numpy()
+filtered = _df.loc[mask]
 
 st.caption(f"Showing {len(filtered)}/{len(_df)} tickers after filters")
 
@@ -149,7 +212,8 @@ with tab2:
 # --- Tab 3
 with tab3:
     st.subheader("Score Breakdown")
-    st.dataframe(filtered.sort_values("score", ascending=False))
+    breakdown = unpack_score_details_cached(csv_path, os.path.getmtime(csv_path))
+    st.dataframe(filtered.join(breakdown))
 
 # ------------------------------ FOOTER -------------------------------------
 
@@ -1,18 +1,25 @@
 import pandas as pd
-from market_data import Ticker
+import numpy as np
+from market_data import Ticker, download_history
+import functools
 import json
 import os
+import importlib.util
+import re
+import threading
+from collections import ChainMap
 from utils import (
     get_sp500_tickers,
     get_nasdaq_tickers,
     ensure_cache_dir,
     calculate_score,
+    calculate_score_panel,
     load_valid_tickers,
     clean_data_for_json,
 )
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
 from itertools import islice
 from dotenv import load_dotenv
 
@@ -25,17 +32,210 @@ try:
 except Exception:
     FinnhubCollector = None  # type: ignore – handled at runtime
 
-BULK_PRICE_SIZE = 150   # 1 500 is Yahoo's hard max, 150 keeps responses small
-HISTORY_RATE_LIMIT = 1  # seconds between history calls
+try:  # optional C JSON decoder - the cache files are re-read on every run
+    import orjson
+except ImportError:
+    orjson = None
+
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+BULK_PRICE_SIZE = 50    # larger multi-symbol requests start drawing 429s
+BATCH_WORKERS = 3       # bulk batches in flight at once (each fans out further)
+HISTORY_WORKERS = 4     # concurrent per-symbol fallback history calls
+HISTORY_RETRY_BUDGET = 10  # failed per-symbol history calls retried once, per call
+HISTORY_BULK_SIZE = 50  # symbols per multi-symbol history download
+RATE_LIMIT_BACKOFF = 60  # seconds to wait after a 429 before retrying
+BATCH_FAILURE_LIMIT = 3  # failed bulk batches before a symbol is marked bad
+UPDATE_CHECK_TTL = 60    # seconds a needs_*_update answer is reused
+PROGRESS_INTERVAL = 1.0  # seconds between scoring progress lines
+PRICE_DECIMALS = 4       # stored bar prices; Yahoo quotes sub-dollar stocks to 4 places
+
+
+def _json_loads(raw):
+    """Parse JSON text/bytes, with orjson when it is installed.
+
+    orjson rejects the NaN / Infinity tokens the stdlib encoder writes for
+    missing floats, so such documents go through ``json.loads``.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def _read_json(path):
+    with open(path, "rb") as f:
+        return _json_loads(f.read())
+
+
+def _write_json(path, obj):
+    """Write *obj* as compact JSON in one call, atomically.
+
+    Uses the stdlib encoder (its C fast path needs ``indent=None``) rather
+    than orjson, which would silently turn NaN into null and break the
+    numeric comparisons readers make on these records.  The text goes to a
+    sibling temp file that then replaces *path*, so a crash mid-write leaves
+    the previous file intact instead of a truncated one.  The temp name is
+    unique per process and thread, so the CLI, tracker and Flask app writing
+    the same file at once never share (or truncate) one temp file.
+    """
+    text = json.dumps(obj)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "w") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _append_record_line(path, ticker, record):
+    """Append one ``{"ticker", "record"}`` line to the JSON Lines journal at *path*."""
+    try:
+        with open(path, "a") as f:
+            f.write(json.dumps({"ticker": ticker, "record": record}) + "\n")
+    except Exception:
+        pass
+
+
+def _read_record_lines(path):
+    """Return {ticker: record} from a journal at *path*; a torn last line is skipped."""
+    records = {}
+    if not os.path.exists(path):
+        return records
+    with open(path, "r") as f:
+        for line in f:
+            try:
+                entry = _json_loads(line)
+            except ValueError:
+                continue
+            records[entry["ticker"]] = entry["record"]
+    return records
+
+
+def _narrow_history(hist):
+    """Trim a history frame to OHLCV and store Volume as the smallest integer type.
+
+    Multi-symbol downloads hand back float64 volume (NaN-aligned columns) and
+    extra columns (Adj Close, Dividends, ...) the records never use.  Prices
+    stay float64: records are serialised to JSON as Python floats, where
+    float32 would save nothing and add spurious digits.
+    """
+    hist = hist[[c for c in ("Open", "High", "Low", "Close", "Volume") if c in hist.columns]]
+    volume = hist["Volume"]
+    if volume.notna().all():
+        hist = hist.assign(Volume=pd.to_numeric(volume.astype("int64"), downcast="unsigned"))
+    return hist
+
+
+# lower-case OHLCV names some history sources use -> the Title-case ones records read
+_OHLCV_CASE = {c.lower(): c for c in ("Open", "High", "Low", "Close", "Volume")}
+
+
+def _naive_utc_index(index):
+    """*index* as a tz-naive UTC DatetimeIndex, without re-parsing one that already is."""
+    if isinstance(index, pd.DatetimeIndex):
+        return index.tz_convert(None) if index.tz is not None else index
+    return pd.to_datetime(index, utc=True).tz_convert(None)
+
+
+def _history_long_frame(stock_data):
+    """One row per (ticker, date) bar across all records' ``historical_data``.
+
+    Records whose bar lists disagree in length are left out; readers fall
+    back to stock_data.json for tickers missing here.
+    """
+    tickers, parts = [], {"date": [], "close": [], "high": [], "low": [], "volume": []}
+    for ticker, record in stock_data.items():
+        hist = record.get("historical_data") or {}
+        close = hist.get("close") or []
+        cols = {"date": hist.get("dates") or [], "close": close,
+                "high": hist.get("high", close), "low": hist.get("low", close),
+                "volume": hist.get("volume", [0] * len(close))}
+        if not close or any(len(v) != len(close) for v in cols.values()):
+            continue
+        tickers.append((ticker, len(close)))
+        for name, values in cols.items():
+            parts[name].append(np.asarray(values, dtype="datetime64[D]" if name == "date" else float))
+    names = [t for t, _ in tickers]
+    return pd.DataFrame({
+        "ticker": pd.Categorical(np.repeat(names, [n for _, n in tickers]), categories=names),
+        **{name: (np.concatenate(arrs) if arrs else
+                  np.array([], dtype="datetime64[D]" if name == "date" else float))
+           for name, arrs in parts.items()},
+    })
+
+
+def _stored_history(record):
+    """A record's ``historical_data`` as the frame ``_assemble_record`` takes, or None."""
+    hist = record.get("historical_data") or {}
+    try:
+        frame = pd.DataFrame(
+            {"Close": hist["close"], "High": hist["high"], "Low": hist["low"],
+             "Volume": hist["volume"]},
+            index=pd.DatetimeIndex(np.asarray(hist["dates"], dtype="datetime64[D]")),
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+    return frame if len(frame) else None
+
+
+def _round_prices(series):
+    """*series* as a list of floats rounded to PRICE_DECIMALS.
+
+    Yahoo's raw bars are float32 values widened to float64 (189.9499969482422
+    for a 189.95 quote); rounding restores the quoted price and roughly halves
+    the digits each bar costs in stock_data.json.
+    """
+    return np.round(series.to_numpy(dtype=float), PRICE_DECIMALS).tolist()
+
+
+_SYMBOL_JUNK = re.compile(r"[^A-Z0-9.\-]")
+
+
+@functools.lru_cache(maxsize=8192)
+def _clean_symbol(ticker):
+    """Upper-case *ticker*, map ``^`` (preferred shares) to ``-`` and drop other specials."""
+    return _SYMBOL_JUNK.sub("", ticker.upper().replace("^", "-"))
+
+
+@functools.lru_cache(maxsize=1)
+def _composite_scorer():
+    """The process-wide Phase 2 ``CompositeScorer`` (built on first use).
+
+    Shared by every DataCollector in the process, so its collectors' memo
+    caches survive across instances and scoring workers build it once.
+    """
+    from scoring.composite_scorer import CompositeScorer
+    return CompositeScorer()
+
+
+def _is_rate_limited(exc):
+    """True if *exc* looks like Yahoo's HTTP 429 / rate-limit response."""
+    text = f"{type(exc).__name__} {exc}".lower()
+    return "429" in text or "too many requests" in text or "ratelimit" in text
 
 class DataCollector:
     def __init__(self):
         self.cache_dir = "cache"
         self.data_file = os.path.join(self.cache_dir, "stock_data.json")
+        # append-only progress log written while a collection run is underway
+        self.partial_file = os.path.join(self.cache_dir, "stock_data.jsonl")
+        # optional columnar copy of the bars (see save_stock_data)
+        self.history_file = os.path.join(self.cache_dir, "history.parquet")
+        # records fetched today, one JSON Lines file per day
+        self.fetch_cache_dir = os.path.join(self.cache_dir, "fetched")
         self.tickers_file = os.path.join(self.cache_dir, "filtered_tickers.json")
         self.scores_file = os.path.join(self.cache_dir, "daily_scores.json")
         self.last_update_file = os.path.join(self.cache_dir, "last_update.json")
         self.bad_file = os.path.join(self.cache_dir, "unsupported.json")
+        # marks are appended here and compacted into bad_file after each
+        # process_ticker_batch run
+        self.bad_journal_file = os.path.join(self.cache_dir, "unsupported.jsonl")
+        self.bad_attempts_file = os.path.join(self.cache_dir, "unsupported_attempts.json")
         ensure_cache_dir()
 
         # Optional Finnhub integration (for fundamental *bulk* API calls)
@@ -51,45 +251,60 @@ class DataCollector:
 
         # load previously identified bad tickers
         self.bad_tickers = self._load_bad_tickers()
+        self._bad_pending = False
+        # guards the shared state below while batches run on worker threads
+        self._lock = threading.RLock()
+        # memoised last-update times for needs_*_update: {kind: (read_at, ts)}
+        self._update_times = {}
+
+        # collected records by exchange; dirty ones are rewritten on save
+        self._exchange_groups = {}
+        self._dirty_exchanges = set()
+
+        # consecutive failed bulk batches per symbol (see _record_batch_failure)
+        self.bad_tickers_attempts = self._load_bad_attempts()
     
     def needs_weekly_update(self):
         """Check if weekly data needs to be updated."""
-        try:
-            if not os.path.exists(self.last_update_file):
-                return True
-            
-            with open(self.last_update_file, 'r') as f:
-                last_update = datetime.fromisoformat(json.load(f)['last_weekly_update'])
-            
-            # Update if more than 7 days old
-            return datetime.now() - last_update > timedelta(days=7)
-        except Exception:
-            return True
+        last_update = self._update_time("weekly", self._read_weekly_update_time)
+        # Update if more than 7 days old
+        return last_update is None or time.time() - last_update > timedelta(days=7).total_seconds()
     
     def needs_daily_update(self):
         """Check if daily scores need to be updated."""
+        last_update = self._update_time("daily", self._read_daily_update_time)
+        # Update if more than 24 hours old
+        return last_update is None or time.time() - last_update > timedelta(hours=24).total_seconds()
+    
+    def _update_time(self, kind, loader):
+        """Last *kind* update time (epoch seconds or None), re-read after UPDATE_CHECK_TTL.
+
+        Cleared by the update methods whenever they rewrite the timestamps.
+        """
+        now = time.time()
+        cached = self._update_times.get(kind)
+        if cached is None or now - cached[0] > UPDATE_CHECK_TTL:
+            cached = self._update_times[kind] = (now, loader())
+        return cached[1]
+    
+    def _read_weekly_update_time(self):
         try:
-            if not os.path.exists(self.scores_file):
-                return True
-            
-            with open(self.scores_file, 'r') as f:
-                scores_data = json.load(f)
-                last_update = datetime.fromisoformat(scores_data['last_update'])
-            
-            # Update if more than 24 hours old
-            return datetime.now() - last_update > timedelta(hours=24)
+            with open(self.last_update_file, 'r') as f:
+                return datetime.fromisoformat(json.load(f)['last_weekly_update']).timestamp()
         except Exception:
-            return True
+            return None
+    
+    def _read_daily_update_time(self):
+        # The scores file is rewritten by every update, so its mtime is the
+        # last update time - no need to parse the whole file for it
+        try:
+            return os.path.getmtime(self.scores_file)
+        except OSError:
+            return None
     
     def _clean_ticker(self, ticker):
         """Clean ticker symbol for Yahoo Finance API."""
-        # Remove any special characters and convert to uppercase
-        cleaned = ''.join(c for c in ticker.upper() if c.isalnum() or c == '.')
-        # Handle special cases
-        if '^' in ticker:
-            # Convert ^ to - for preferred shares
-            cleaned = ticker.replace('^', '-')
-        return cleaned
+        return _clean_symbol(ticker)
 
     def _fetch_stock_data(self, ticker):
         """Fetch stock data with proper rate limiting and error handling."""
@@ -120,13 +335,8 @@ class DataCollector:
                 profile_info = raw_profile if isinstance(raw_profile, dict) else {}
 
                 # ENHANCED: Merge all data sources for comprehensive information
-                info = {
-                    **summary,
-                    **price_info,
-                    **financial_info,
-                    **stats_info,
-                    **profile_info,
-                }
+                # (a lookup view - later sources win, nothing is copied)
+                info = ChainMap(profile_info, stats_info, financial_info, price_info, summary)
 
                 # Required: price & market cap > 0
                 if (
@@ -160,9 +370,9 @@ class DataCollector:
                 if isinstance(hist.index, pd.MultiIndex):
                     hist = hist.xs(cleaned_ticker, level=0, drop_level=True)
                 # Convert to UTC then strip timezone to ensure a uniform tz-naive index
-                hist.index = pd.to_datetime(hist.index, utc=True).tz_convert(None)
+                hist.index = _naive_utc_index(hist.index)
                 # Standardise column names (Close/Volume/High/Low)
-                hist.rename(columns=lambda c: c.title(), inplace=True)
+                hist.rename(columns=_OHLCV_CASE, inplace=True)
                 
                 # Calculate average volume
                 avg_volume = hist['Volume'].mean()
@@ -193,7 +403,7 @@ class DataCollector:
                     'volume': hist['Volume'].tolist(),
                     'high': hist['High'].tolist(),
                     'low': hist['Low'].tolist(),
-                    'dates': hist.index.strftime('%Y-%m-%d').tolist()
+                    'dates': np.datetime_as_string(hist.index.values, unit='D').tolist()
                 }
 
                 return {
@@ -213,132 +423,201 @@ class DataCollector:
                 self._mark_bad(ticker)
                 return None
 
-    def process_ticker_batch(self, tickers):
+    def process_ticker_batch(self, tickers, use_fetch_cache=True):
         """
         Bulk-fetch price for many symbols in one request, then
-        serially download history for the survivors.
+        bulk-download history for the survivors (per-symbol fallback
+        only for those missing from the bulk response).
+
+        Records already fetched today are reused without calling Yahoo
+        unless *use_fetch_cache* is False.
         """
         all_stock_data = {}
 
-        for batch_idx, batch in enumerate(self._chunked(tickers, BULK_PRICE_SIZE), 1):
-            print(f"\n🌐 [API] [Bulk {batch_idx}] Fetching price for {len(batch)} symbols…", flush=True)
+        if use_fetch_cache:
+            fetched_today = self._load_fetch_cache()
+            for symbol in tickers:
+                record = fetched_today.get(symbol)
+                if record is not None:
+                    all_stock_data[symbol] = record
+                    self._group_by_exchange(symbol, record)
+            if all_stock_data:
+                print(f"Reusing {len(all_stock_data)} records fetched earlier today.", flush=True)
+                tickers = [t for t in tickers if t not in all_stock_data]
 
+        batches = list(self._chunked(tickers, BULK_PRICE_SIZE))
+        # stored records let unchanged quotes skip the history download
+        existing = {}
+        if batches and os.path.exists(self.data_file):
             try:
-                bulk_tkr = Ticker(" ".join(batch), asynchronous=False,
-                                   progress=False, timeout=8)
-                price_map = bulk_tkr.price
-                summary_map = bulk_tkr.summary_detail or {}
-                stats_map = bulk_tkr.key_stats or {}
-                # ENHANCED: Fetch additional data sources for comprehensive metrics
-                financial_map = bulk_tkr.financial_data or {}
-                profile_map = bulk_tkr.asset_profile or {}
-            except Exception as e:
+                existing = _read_json(self.data_file)
+            except (OSError, ValueError):
+                pass
+        workers = min(BATCH_WORKERS, len(batches))
+        if workers <= 1:
+            for batch_idx, batch in enumerate(batches, 1):
+                all_stock_data.update(self._process_single_batch(batch_idx, batch, existing))
+        else:
+            # Batches overlap their network waits; market_data's shared limiter
+            # still spaces every request start, so no pause between batches
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(self._process_single_batch, batch_idx, batch, existing)
+                           for batch_idx, batch in enumerate(batches, 1)]
+                for future in futures:
+                    all_stock_data.update(future.result())
+
+        # write the collected data (and its per-exchange split) once
+        if all_stock_data:
+            self.save_data(all_stock_data)
+            self._save_by_exchange()
+            self._clear_partial_records(all_stock_data)
+        self._flush_bad_tickers()
+        return all_stock_data
+
+    def _process_single_batch(self, batch_idx, batch, existing=None):
+        """Price, history and records for one BULK_PRICE_SIZE *batch* -> {symbol: record}.
+
+        Symbols whose quote time still matches their record in *existing*
+        reuse its stored bars instead of downloading history again.
+        Safe to run on several threads at once: shared collector state is
+        only touched under ``self._lock``.
+        """
+        existing = existing or {}
+        records = {}
+        print(f"\n🌐 [API] [Bulk {batch_idx}] Fetching price for {len(batch)} symbols…", flush=True)
+
+        try:
+            maps = self._fetch_bulk_info(batch)
+        except Exception as e:
+            if _is_rate_limited(e):
+                # 429: back off longer and retry in two smaller requests
+                print(f"Bulk price request rate-limited ({e}). Retrying in halves after "
+                      f"{RATE_LIMIT_BACKOFF} s…", flush=True)
+                time.sleep(RATE_LIMIT_BACKOFF)
+                half = len(batch) // 2
+                parts = [part for part in (batch[:half], batch[half:]) if part]
+            else:
                 print(f"Bulk price request failed ({e}). Retrying after 15 s…", flush=True)
                 time.sleep(15)
-                try:
-                    bulk_tkr = Ticker(" ".join(batch), asynchronous=False,
-                                       progress=False, timeout=8)
-                    price_map = bulk_tkr.price
-                    summary_map = bulk_tkr.summary_detail or {}
-                    stats_map = bulk_tkr.key_stats or {}
-                    # ENHANCED: Retry with additional data sources
-                    financial_map = bulk_tkr.financial_data or {}
-                    profile_map = bulk_tkr.asset_profile or {}
-                except Exception as e:
-                    print(f"Bulk price retry failed – skipping this batch. ({e})", flush=True)
-                    # Mark all tickers as bad to avoid infinite loops
-                    for sym in batch:
-                        self._mark_bad(sym)
-                    continue
+                parts = [batch]
+            try:
+                maps = ({}, {}, {}, {}, {})
+                for part in parts:
+                    for merged, part_map in zip(maps, self._fetch_bulk_info(part)):
+                        merged.update(part_map)
+            except Exception as e:
+                # Transient failures must not blacklist the whole batch -
+                # a symbol is only marked bad after repeated failed batches
+                print(f"Bulk price retry failed – skipping this batch. ({e})", flush=True)
+                self._record_batch_failure(batch)
+                return {}
+        price_map, summary_map, stats_map, financial_map, profile_map = maps
+        self._clear_batch_failures(batch)
 
-            # iterate batch, build info dict, drop the obvious failures
-            survivors = []
-            for symbol in batch:
-                # Safely handle API responses that might be strings instead of dicts
-                summary_data = summary_map.get(symbol, {})
-                stats_data = stats_map.get(symbol, {})
-                price_data = price_map.get(symbol, {})
-                # ENHANCED: Include additional data sources
-                financial_data = financial_map.get(symbol, {})
-                profile_data = profile_map.get(symbol, {})
-                
-                # Ensure all data sources are dicts before unpacking
-                if not isinstance(summary_data, dict):
-                    summary_data = {}
-                if not isinstance(stats_data, dict):
-                    stats_data = {}
-                if not isinstance(price_data, dict):
-                    price_data = {}
-                if not isinstance(financial_data, dict):
-                    financial_data = {}
-                if not isinstance(profile_data, dict):
-                    profile_data = {}
-                
-                # ENHANCED: Merge all data sources for comprehensive information
-                info = {
-                    **summary_data,
-                    **stats_data,
-                    **price_data,
-                    **financial_data,
-                    **profile_data,
-                }
-                ok = (
-                    info.get("regularMarketPrice", 0) > 0
-                    and info.get("marketCap", 0) > 0
-                )
-                if ok:
-                    survivors.append((symbol, info))
-                else:
-                    self._mark_bad(symbol)
-
-            # for each survivor fetch history (one call / sec)
-            for idx, (symbol, info) in enumerate(survivors, 1):
-                p = info.get("regularMarketPrice")
-                cap = info.get("marketCap")
-                price_str = f"${p:.2f}" if isinstance(p, (int, float)) and p else "n/a"
-                cap_str = f"{cap/1e9:.1f}B" if isinstance(cap, (int, float)) and cap else "n/a"
-                yr_hi = info.get("fiftyTwoWeekHigh")
-                yr_lo = info.get("fiftyTwoWeekLow")
-                hi_str = f"${yr_hi:.2f}" if isinstance(yr_hi, (int, float)) and yr_hi else "n/a"
-                if p and yr_hi:
-                    pct_below = ((yr_hi - p) / yr_hi) * 100
-                    drop_str = f"{pct_below:5.1f}%"
-                else:
-                    drop_str = " n/a "
-                
-                # ENHANCED: Show additional key metrics in progress display
-                fcf = info.get("freeCashflow")
-                pe = info.get("trailingPE")
-                fcf_str = f"FCF:{fcf/1e6:.0f}M" if isinstance(fcf, (int, float)) and fcf else "FCF:n/a"
-                pe_str = f"PE:{pe:.1f}" if isinstance(pe, (int, float)) and pe else "PE:n/a"
-                
-                print(
-                    f"    🌐 [API] [{idx}/{len(survivors)}] {symbol:<6} | Price {price_str:<8} | 52W Hi {hi_str:<8} | Δ {drop_str:<6} | Cap {cap_str:<6} | {fcf_str:<10} | {pe_str:<8} -> history…",
-                    end="",
-                    flush=True,
-                )
-                hist = self._fetch_history(symbol)
-                if hist is None or hist.empty:
-                    # mark missing history so we don't retry endlessly
-                    self._mark_bad(symbol)
-                    print(" FAIL")
-                    time.sleep(HISTORY_RATE_LIMIT)
-                    continue
-                record = self._assemble_record(symbol, info, hist)
-                all_stock_data[symbol] = record
-                print(" OK")
-                time.sleep(HISTORY_RATE_LIMIT)
+        # iterate batch, build info dict, drop the obvious failures
+        survivors = []
+        for symbol in batch:
+            # Safely handle API responses that might be strings instead of dicts
+            summary_data = summary_map.get(symbol, {})
+            stats_data = stats_map.get(symbol, {})
+            price_data = price_map.get(symbol, {})
+            # ENHANCED: Include additional data sources
+            financial_data = financial_map.get(symbol, {})
+            profile_data = profile_map.get(symbol, {})
+            
+            # Ensure all data sources are dicts before unpacking
+            if not isinstance(summary_data, dict):
+                summary_data = {}
+            if not isinstance(stats_data, dict):
+                stats_data = {}
+            if not isinstance(price_data, dict):
+                price_data = {}
+            if not isinstance(financial_data, dict):
+                financial_data = {}
+            if not isinstance(profile_data, dict):
+                profile_data = {}
+            
+            # ENHANCED: Merge all data sources for comprehensive information
+            # (a lookup view - later sources win, nothing is copied)
+            info = ChainMap(profile_data, financial_data, price_data, stats_data, summary_data)
+            ok = (
+                info.get("regularMarketPrice", 0) > 0
+                and info.get("marketCap", 0) > 0
+            )
+            if ok:
+                survivors.append((symbol, info))
+            else:
+                self._mark_bad(symbol)
 
-            # write partial progress & split by exchange
-            if all_stock_data:
-                self.save_data(all_stock_data)
-                self._save_by_exchange(all_stock_data)
+        # quote not moved since the stored record -> its bars are still current
+        stored_hist = {}
+        for symbol, info in survivors:
+            old = existing.get(symbol)
+            epoch = info.get("regularMarketTime")
+            if old is not None and epoch is not None and old.get("last_price_epoch") == epoch:
+                hist = _stored_history(old)
+                if hist is not None:
+                    stored_hist[symbol] = hist
+        stale = [s for s, _ in survivors if s not in stored_hist]
 
-            # polite pause between bulk price calls
-            print("Bulk complete – sleeping 10 s to stay under rate-limit…", flush=True)
-            time.sleep(10)
+        # one history download per HISTORY_BULK_SIZE stale survivors, then
+        # the symbols missing from it fetched concurrently on their own
+        bulk_hist = self._fetch_history_bulk(stale)
+        bulk_hist.update(self._fetch_history_many([s for s in stale if s not in bulk_hist]))
+        bulk_hist.update(stored_hist)
 
-        return all_stock_data
+        # Finnhub fundamentals for the whole batch up front (concurrent, and
+        # memoised by the collector) rather than one blocking call per record
+        snapshots = {}
+        if self._finnhub is not None:
+            try:
+                snapshots = self._finnhub.get_stock_snapshots(
+                    [s for s, _ in survivors if s in bulk_hist])
+            except Exception as e:
+                print(f"⚠️  Finnhub fundamentals fetch failed for batch {batch_idx}: {e}")
+
+        progress = []
+        for idx, (symbol, info) in enumerate(survivors, 1):
+            p = info.get("regularMarketPrice")
+            cap = info.get("marketCap")
+            price_str = f"${p:.2f}" if isinstance(p, (int, float)) and p else "n/a"
+            cap_str = f"{cap/1e9:.1f}B" if isinstance(cap, (int, float)) and cap else "n/a"
+            yr_hi = info.get("fiftyTwoWeekHigh")
+            yr_lo = info.get("fiftyTwoWeekLow")
+            hi_str = f"${yr_hi:.2f}" if isinstance(yr_hi, (int, float)) and yr_hi else "n/a"
+            if p and yr_hi:
+                pct_below = ((yr_hi - p) / yr_hi) * 100
+                drop_str = f"{pct_below:5.1f}%"
+            else:
+                drop_str = " n/a "
+            
+            # ENHANCED: Show additional key metrics in progress display
+            fcf = info.get("freeCashflow")
+            pe = info.get("trailingPE")
+            fcf_str = f"FCF:{fcf/1e6:.0f}M" if isinstance(fcf, (int, float)) and fcf else "FCF:n/a"
+            pe_str = f"PE:{pe:.1f}" if isinstance(pe, (int, float)) and pe else "PE:n/a"
+            
+            line = f"    🌐 [API] [{idx}/{len(survivors)}] {symbol:<6} | Price {price_str:<8} | 52W Hi {hi_str:<8} | Δ {drop_str:<6} | Cap {cap_str:<6} | {fcf_str:<10} | {pe_str:<8} -> history…"
+            hist = bulk_hist.get(symbol)
+            if hist is None or hist.empty:
+                # mark missing history so we don't retry endlessly
+                self._mark_bad(symbol)
+                progress.append(line + " FAIL")
+                continue
+            record = self._assemble_record(symbol, info, hist, snapshots.get(symbol))
+            records[symbol] = record
+            with self._lock:
+                # progress is appended per ticker - no full-blob rewrite per batch
+                self._save_partial_record(symbol, record)
+                self._save_fetch_cache(symbol, record)
+                self._group_by_exchange(symbol, record)
+            progress.append(line + " OK")
+
+        # the batch's lines go out in one write - concurrent batches never
+        # interleave, and stdout is not hit once per ticker
+        if progress:
+            print("\n".join(progress))
+        return records
 
     def initial_filter_tickers(self):
         """Initial filtering of tickers with a test batch first."""
@@ -352,15 +631,19 @@ class DataCollector:
         existing_stock_data = {}
         if os.path.exists(self.data_file):
             try:
-                with open(self.data_file, "r") as f:
-                    existing_stock_data = json.load(f)
+                existing_stock_data = _read_json(self.data_file)
                 print(f"Found existing data for {len(existing_stock_data)} tickers – will skip them.")
             except Exception:
                 print("Warning: could not read existing stock_data.json – will start fresh.")
+        # ... plus tickers an interrupted run collected before its final save
+        partial = self._load_partial_records()
+        if partial:
+            print(f"Recovered {len(partial)} tickers from an interrupted run.")
+            existing_stock_data.update(partial)
 
-        processed_set = set(existing_stock_data.keys())
-        # skip tickers we know are bad
-        remaining_tickers = [t for t in all_tickers if t not in processed_set and t not in self.bad_tickers]
+        # skip tickers already collected or known to be bad (one lookup each)
+        skip = self.bad_tickers.union(existing_stock_data)
+        remaining_tickers = [t for t in dict.fromkeys(all_tickers) if t not in skip]
 
         if not remaining_tickers:
             print("All tickers already processed. Skipping collection.")
@@ -368,6 +651,7 @@ class DataCollector:
             # Still run filtering to ensure downstream files are up-to-date
             filtered = self.filter_tickers(existing_stock_data)
             self.save_data(existing_stock_data)
+            self._clear_partial_records(partial)
             return existing_stock_data
 
         # Process a small test batch first (only from remaining tickers)
@@ -388,6 +672,7 @@ class DataCollector:
         # Filter and save results
         filtered_tickers = self.filter_tickers(all_stock_data)
         self.save_data(all_stock_data)
+        self._clear_partial_records(partial)
         
         return all_stock_data
     
@@ -395,9 +680,8 @@ class DataCollector:
         """Update data for filtered tickers weekly."""
         try:
             # Load filtered tickers
-            with open(self.tickers_file, 'r') as f:
-                ticker_data = json.load(f)
-                filtered_tickers = ticker_data['tickers']
+            ticker_data = _read_json(self.tickers_file)
+            filtered_tickers = ticker_data['tickers']
         except FileNotFoundError:
             print("No filtered tickers found. Performing initial filtering...")
             return self.initial_filter_tickers()
@@ -413,19 +697,24 @@ class DataCollector:
                 'last_weekly_update': datetime.now().isoformat(),
                 'last_daily_update': datetime.now().isoformat()
             }, f)
+        self._update_times.clear()
         
         return stock_data
     
-    def update_daily_scores(self, ticker_subset: list | None = None):
+    def update_daily_scores(self, ticker_subset: list | None = None,
+                            max_workers: int | None = 1):
         """Update daily scores.
 
         If *ticker_subset* is provided, only those tickers are rescored.
         Otherwise the whole ``stock_data.json`` universe is used.
+        *max_workers* sets the scoring process count. The default of 1 scores
+        serially in this process, which is safe inside a threaded host (the
+        Flask app, the tracker). None uses every core. The CLI batch scorer
+        opts in to that.
         """
         try:
             # Load current stock data
-            with open(self.data_file, 'r') as f:
-                stock_data = json.load(f)
+            stock_data = _read_json(self.data_file)
         except FileNotFoundError:
             print("No stock data found. Please run weekly update first.")
             return None
@@ -442,40 +731,73 @@ class DataCollector:
         else:
             tickers_to_process = list(stock_data.keys())
 
-        total = len(tickers_to_process)
+        # Records still carrying the quote time they were last scored at keep
+        # their previous entry; only the changed ones are rescored
+        previous = self._load_previous_scores()
+        entries = {}
+        for t in tickers_to_process:
+            epoch = stock_data[t].get('last_price_epoch')
+            old = previous.get(t)
+            if epoch is not None and old is not None and old.get('last_price_epoch') == epoch:
+                entries[t] = old
+        tickers_to_score = [t for t in tickers_to_process if t not in entries]
+        if entries:
+            print(f"Reusing {len(entries)} unchanged scores; rescoring {len(tickers_to_score)}.")
+
+        # Legacy technical score for the whole universe in one vectorised pass
+        records = {t: stock_data[t] for t in tickers_to_score}
+        closes, volumes = self._history_panels(records)
+        legacy_scores = calculate_score_panel(
+            closes, volumes, {t: self._record_fundamentals(d) for t, d in records.items()})
+
+        total = len(tickers_to_score)
         processed = 0
-        start_time = time.time()
-        
+        start_time = last_print = time.monotonic()
+        items = [(t, records[t], legacy_scores.get(t)) for t in tickers_to_score]
+
+        # Scoring is pure CPU work once the data is cached - callers that own
+        # their process can spread it over workers (results keep ticker order)
+        workers = max_workers or os.cpu_count() or 1
+        executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 and total > 1 else None
+        try:
+            if executor is not None:
+                chunksize = max(1, min(64, total // (workers * 4)))
+                results = executor.map(_score_one, items, chunksize=chunksize)
+            else:
+                results = map(self._score_record, items)
+
+            for ticker, entry in results:
+                processed += 1
+
+                # at most one progress line per PROGRESS_INTERVAL, plus the final one
+                now = time.monotonic()
+                if now - last_print >= PROGRESS_INTERVAL or processed == total:
+                    last_print = now
+                    elapsed = now - start_time
+                    per_ticker = elapsed / processed
+                    remaining = per_ticker * (total - processed)
+                    print(f"\rProcessed {processed}/{total} tickers "
+                          f"({(processed/total*100):.1f}%) | "
+                          f"ETA: {int(remaining/60)}m {int(remaining%60)}s",
+                          end="", flush=True)
+
+                if entry is not None:
+                    entries[ticker] = entry
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
         for ticker in tickers_to_process:
-            data = stock_data[ticker]
-            processed += 1
-            
-            if processed % 10 == 0:
-                elapsed = time.time() - start_time
-                per_ticker = elapsed / processed
-                remaining = per_ticker * (total - processed)
-                print(f"\rProcessed {processed}/{total} tickers "
-                      f"({(processed/total*100):.1f}%) | "
-                      f"ETA: {int(remaining/60)}m {int(remaining%60)}s", 
-                      end="", flush=True)
-            
-            try:
-                score, score_details = self.calculate_score(data)
-                scores['scores'][ticker] = {
-                    'score': score,
-                    'score_details': score_details,
-                    'price': data['current_price'],
-                    'timestamp': datetime.now().isoformat()
-                }
-            except Exception as e:
-                print(f"\nError calculating score for {ticker}: {str(e)}")
+            entry = entries.get(ticker)
+            if entry is not None:
+                entry['timestamp'] = scores['last_update']
+                scores['scores'][ticker] = entry
         
         # Clean the data for JSON serialization before saving
         cleaned_scores = clean_data_for_json(scores)
         
         # Save daily scores
-        with open(self.scores_file, 'w') as f:
-            json.dump(cleaned_scores, f, indent=4)
+        _write_json(self.scores_file, cleaned_scores)
         
         # Update last daily update timestamp
         if os.path.exists(self.last_update_file):
@@ -489,12 +811,90 @@ class DataCollector:
         update_data['last_daily_update'] = datetime.now().isoformat()
         with open(self.last_update_file, 'w') as f:
             json.dump(update_data, f, indent=4)
+        self._update_times.clear()
         
         print("\nDaily scores updated!")
         return scores
     
-    def calculate_score(self, record):
-        """Enhanced scoring using Phase 2 layered scoring engine."""
+    def _load_previous_scores(self):
+        """{ticker: entry} from the last ``daily_scores.json``, or {} if unreadable."""
+        try:
+            return _read_json(self.scores_file).get('scores', {})
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    def _score_record(self, item):
+        """Score one ``(ticker, record, legacy)`` item -> (ticker, scores entry or None).
+
+        The entry's ``timestamp`` is added by the caller so a run shares one.
+        """
+        ticker, data, legacy = item
+        try:
+            score, score_details = self.calculate_score(data, legacy=legacy)
+            return ticker, {
+                'score': score,
+                'score_details': score_details,
+                'price': data['current_price'],
+                'last_price_epoch': data.get('last_price_epoch'),
+            }
+        except Exception as e:
+            print(f"\nError calculating score for {ticker}: {str(e)}")
+            return ticker, None
+
+    def _record_fundamentals(self, record):
+        """Fundamentals dict the legacy ``utils.calculate_score`` expects."""
+        fundamentals = {
+            k: record.get(k)
+            for k in (
+                "pe",
+                "forward_pe",
+                "peg",
+                "dividend_yield",
+                "beta",
+                "short_percent_float",
+                "insider_hold_percent",
+            )
+        }
+        # Merge in any Finnhub-provided fundamentals
+        if record.get("finnhub_fundamentals"):
+            fundamentals.update(record["finnhub_fundamentals"])
+        return fundamentals
+
+    def _history_panels(self, records):
+        """(closes, volumes) date x ticker panels from records' ``historical_data``.
+
+        Histories are aligned on their last bar; shorter ones are NaN-padded
+        at the top (the layout ``utils.calculate_score_panel`` expects).
+        Records without a usable history are left out - they fall through to
+        ``calculate_score``'s per-record path and its error handling.
+        """
+        tickers, series = [], []
+        for t, record in records.items():
+            hist = record.get("historical_data") or {}
+            try:
+                c = np.asarray(hist["close"], dtype=float)
+                v = np.asarray(hist["volume"], dtype=float)
+            except (KeyError, TypeError, ValueError):
+                continue
+            if c.ndim != 1 or v.ndim != 1 or not len(c) or len(c) != len(v):
+                continue
+            tickers.append(t)
+            series.append((c, v))
+        n = max((max(len(c), len(v)) for c, v in series), default=0)
+        closes = np.full((n, len(tickers)), np.nan)
+        volumes = np.full((n, len(tickers)), np.nan)
+        for j, (c, v) in enumerate(series):
+            closes[n - len(c):, j] = c
+            volumes[n - len(v):, j] = v
+        return pd.DataFrame(closes, columns=tickers), pd.DataFrame(volumes, columns=tickers)
+
+    def calculate_score(self, record, legacy=None):
+        """Enhanced scoring using Phase 2 layered scoring engine.
+
+        *legacy* is an optional precomputed ``(score, details)`` from
+        ``utils.calculate_score_panel``; without it the legacy score is
+        calculated for this record alone.
+        """
         try:
             # Build DataFrame from historical data with proper index
             df = pd.DataFrame(
@@ -504,38 +904,27 @@ class DataCollector:
                     "High": record["historical_data"]["high"],
                     "Low": record["historical_data"]["low"],
                 },
-                index=pd.to_datetime(record["historical_data"]["dates"])
+                # NumPy parses the stored ISO days in C; pd.to_datetime
+                # infers a format and goes through strptime per string
+                index=pd.DatetimeIndex(
+                    np.asarray(record["historical_data"]["dates"], dtype="datetime64[D]"))
             )
             
             # Prepare fundamentals dict
-            fundamentals = {
-                k: record.get(k)
-                for k in (
-                    "pe",
-                    "forward_pe",
-                    "peg",
-                    "dividend_yield",
-                    "beta",
-                    "short_percent_float",
-                    "insider_hold_percent",
-                )
-            }
-
-            # Merge in any Finnhub-provided fundamentals
-            if record.get("finnhub_fundamentals"):
-                fundamentals.update(record["finnhub_fundamentals"])
+            fundamentals = self._record_fundamentals(record)
             
             # Get original legacy score for fallback compatibility
-            try:
-                legacy_score, legacy_details = calculate_score(df, fundamentals)
-            except Exception as legacy_error:
-                print(f"Legacy scoring failed for {record.get('ticker', 'UNKNOWN')}: {legacy_error}")
-                legacy_score, legacy_details = 0, {}
+            if legacy is not None:
+                legacy_score, legacy_details = legacy
+            else:
+                try:
+                    legacy_score, legacy_details = calculate_score(df, fundamentals)
+                except Exception as legacy_error:
+                    print(f"Legacy scoring failed for {record.get('ticker', 'UNKNOWN')}: {legacy_error}")
+                    legacy_score, legacy_details = 0, {}
             
             # Initialize Phase 2 layered scoring engine
-            if not hasattr(self, '_composite_scorer'):
-                from scoring.composite_scorer import CompositeScorer
-                self._composite_scorer = CompositeScorer()
+            scorer = _composite_scorer()
             
             # Calculate comprehensive layered score
             ticker = record.get('ticker', 'UNKNOWN')
@@ -552,7 +941,7 @@ class DataCollector:
                     'exchange': record.get('exchange')
                 }
                 
-                layered_score, layered_details = self._composite_scorer.calculate_composite_score(
+                layered_score, layered_details = scorer.calculate_composite_score(
                     df, ticker, pre_computed_data
                 )
                 
@@ -636,34 +1025,27 @@ class DataCollector:
         print(f"✓ Average Volume > {min_volume:,}")
         print(f"✓ Exchanges: {', '.join(exchanges)}")
         
-        filtered_data = {}
+        # One column per criterion, then array masks instead of per-ticker
+        # branches; each rejection is counted against the first failed check
+        tickers = list(stock_data)
+        records = stock_data.values()
+        market_cap = np.array([d['market_cap'] for d in records], dtype=float)
+        avg_volume = np.array([d['avg_volume'] for d in records], dtype=float)
+        exchange = pd.Index([d['exchange'] for d in records], dtype=object)
+
+        low_cap = market_cap < min_market_cap
+        low_volume = ~low_cap & (avg_volume < min_volume)
+        bad_exchange = ~low_cap & ~low_volume & ~exchange.isin(exchanges)
+        keep = ~(low_cap | low_volume | bad_exchange)
+
+        filtered_data = {tickers[i]: stock_data[tickers[i]] for i in np.flatnonzero(keep)}
         filtered_out = {
-            'market_cap': 0,
-            'volume': 0,
-            'exchange': 0,
-            'total': 0
+            'market_cap': int(low_cap.sum()),
+            'volume': int(low_volume.sum()),
+            'exchange': int(bad_exchange.sum()),
+            'total': len(tickers)
         }
         
-        for ticker, data in stock_data.items():
-            filtered_out['total'] += 1
-            
-            # Check market cap
-            if data['market_cap'] < min_market_cap:
-                filtered_out['market_cap'] += 1
-                continue
-                
-            # Check volume
-            if data['avg_volume'] < min_volume:
-                filtered_out['volume'] += 1
-                continue
-                
-            # Check exchange
-            if data['exchange'] not in exchanges:
-                filtered_out['exchange'] += 1
-                continue
-            
-            filtered_data[ticker] = data
-        
         print(f"\nFiltering complete:")
         print(f"✓ {len(filtered_data)} tickers passed filters")
         print(f"✗ {filtered_out['total'] - len(filtered_data)} tickers filtered out")
@@ -694,17 +1076,70 @@ class DataCollector:
             'total_tickers': len(filtered_data)
         }
         
-        with open(self.tickers_file, 'w') as f:
-            json.dump(filtered_tickers, f, indent=4)
+        _write_json(self.tickers_file, filtered_tickers)
         
         # Also save filtered tickers to CSV for easy access
         pd.DataFrame({'ticker': list(filtered_data.keys())}).to_csv('tickers.csv', index=False)
     
     def save_stock_data(self, stock_data):
-        """Save collected stock data."""
-        with open(self.data_file, 'w') as f:
-            json.dump(stock_data, f, indent=4)
+        """Save collected stock data.
+
+        With pyarrow installed a long-format ``history.parquet`` sidecar of
+        the bars is written too, so single-ticker readers (charting) can load
+        one ticker's history without parsing the whole JSON.
+        """
+        _write_json(self.data_file, stock_data)
+        if _HAS_PYARROW:
+            try:
+                _history_long_frame(stock_data).to_parquet(self.history_file, index=False)
+            except Exception as e:
+                print(f"Warning: could not write {self.history_file}: {e}")
     
+    def _save_partial_record(self, ticker, record):
+        """Append one collected ticker to ``partial_file`` (JSON Lines, O(1) per ticker)."""
+        _append_record_line(self.partial_file, ticker, record)
+
+    def _load_partial_records(self):
+        """Return {ticker: record} from ``partial_file``; a torn last line is skipped."""
+        return _read_record_lines(self.partial_file)
+
+    def _fetch_cache_path(self):
+        return os.path.join(self.fetch_cache_dir, f"{date.today().isoformat()}.jsonl")
+
+    def _load_fetch_cache(self):
+        """Return {ticker: record} fetched earlier today; older days' files are deleted."""
+        today = self._fetch_cache_path()
+        if os.path.isdir(self.fetch_cache_dir):
+            for name in os.listdir(self.fetch_cache_dir):
+                path = os.path.join(self.fetch_cache_dir, name)
+                if path != today:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+        return _read_record_lines(today)
+
+    def _save_fetch_cache(self, ticker, record):
+        os.makedirs(self.fetch_cache_dir, exist_ok=True)
+        _append_record_line(self._fetch_cache_path(), ticker, record)
+
+    def _clear_partial_records(self, tickers):
+        """Drop progress lines once their tickers are in ``stock_data.json``."""
+        if not os.path.exists(self.partial_file):
+            return
+        remaining = self._load_partial_records()
+        for ticker in tickers:
+            remaining.pop(ticker, None)
+        try:
+            if not remaining:
+                os.remove(self.partial_file)
+                return
+            with open(self.partial_file, "w") as f:
+                for ticker, record in remaining.items():
+                    f.write(json.dumps({"ticker": ticker, "record": record}) + "\n")
+        except OSError:
+            pass
+
     # Backwards-compatibility wrapper used earlier in the code
     def save_data(self, stock_data):
         """Alias to save_stock_data (kept for legacy calls)."""
@@ -733,27 +1168,114 @@ class DataCollector:
                     "last_weekly_update": datetime.now().isoformat(),
                     "last_daily_update": datetime.now().isoformat(),
                 }, f)
+            self._update_times.clear()
 
     # ---------- bad-ticker helpers ----------
     def _load_bad_tickers(self):
+        """Union of the compacted ``unsupported.json`` and the mark journal."""
+        bad = set()
         try:
             if os.path.exists(self.bad_file):
                 with open(self.bad_file, "r") as f:
-                    return set(json.load(f))
+                    bad.update(json.load(f))
+        except Exception:
+            pass
+        try:
+            if os.path.exists(self.bad_journal_file):
+                with open(self.bad_journal_file, "r") as f:
+                    for line in f:
+                        try:
+                            bad.add(json.loads(line))
+                        except ValueError:
+                            continue
         except Exception:
             pass
-        return set()
+        return bad
 
     def _save_bad_tickers(self):
+        """Compact the journal into the sorted ``unsupported.json``.
+
+        Marks other collectors journaled since this one loaded are read back
+        first, so compacting never drops them.
+        """
         try:
-            with open(self.bad_file, "w") as f:
-                json.dump(sorted(self.bad_tickers), f, indent=2)
+            with self._lock:
+                self.bad_tickers |= self._load_bad_tickers()
+            _write_json(self.bad_file, sorted(self.bad_tickers))
+            if os.path.exists(self.bad_journal_file):
+                os.remove(self.bad_journal_file)
+            self._bad_pending = False
         except Exception:
             pass
 
+    def _flush_bad_tickers(self):
+        """Compact the journal, but only if this instance journaled new marks.
+
+        Skipped runs (an exception mid-batch) lose nothing: the journal is
+        read back by ``_load_bad_tickers`` and compacted next time.
+        """
+        if self._bad_pending:
+            self._save_bad_tickers()
+
     def _mark_bad(self, ticker):
-        self.bad_tickers.add(ticker)
-        self._save_bad_tickers()
+        """Record *ticker* as unsupported - one appended journal line, no rewrite."""
+        with self._lock:
+            if ticker in self.bad_tickers:
+                return
+            self.bad_tickers.add(ticker)
+            try:
+                with open(self.bad_journal_file, "a") as f:
+                    f.write(json.dumps(ticker) + "\n")
+                self._bad_pending = True
+            except Exception:
+                pass
+
+    def _load_bad_attempts(self):
+        try:
+            if os.path.exists(self.bad_attempts_file):
+                with open(self.bad_attempts_file, "r") as f:
+                    return {k: int(v) for k, v in json.load(f).items()}
+        except Exception:
+            pass
+        return {}
+
+    def _save_bad_attempts(self):
+        try:
+            _write_json(self.bad_attempts_file, dict(sorted(self.bad_tickers_attempts.items())))
+        except Exception:
+            pass
+
+    def _record_batch_failure(self, tickers):
+        """Count a failed bulk batch; mark symbols bad after BATCH_FAILURE_LIMIT in a row."""
+        with self._lock:
+            for ticker in tickers:
+                count = self.bad_tickers_attempts.get(ticker, 0) + 1
+                if count >= BATCH_FAILURE_LIMIT:
+                    self._mark_bad(ticker)
+                    self.bad_tickers_attempts.pop(ticker, None)
+                else:
+                    self.bad_tickers_attempts[ticker] = count
+            self._save_bad_attempts()
+
+    def _clear_batch_failures(self, tickers):
+        """Reset the failure streak of symbols whose batch went through."""
+        with self._lock:
+            if any(t in self.bad_tickers_attempts for t in tickers):
+                for ticker in tickers:
+                    self.bad_tickers_attempts.pop(ticker, None)
+                self._save_bad_attempts()
+
+    def _fetch_bulk_info(self, batch):
+        """(price, summary, stats, financial, profile) maps for *batch* in one request."""
+        bulk_tkr = Ticker(" ".join(batch), asynchronous=False, progress=False, timeout=8)
+        return (
+            bulk_tkr.price,
+            bulk_tkr.summary_detail or {},
+            bulk_tkr.key_stats or {},
+            # ENHANCED: additional data sources for comprehensive metrics
+            bulk_tkr.financial_data or {},
+            bulk_tkr.asset_profile or {},
+        )
 
     def _chunked(self, iterable, size):
         it = iter(iterable)
@@ -768,13 +1290,47 @@ class DataCollector:
                 return None
             if isinstance(hist.index, pd.MultiIndex):
                 hist = hist.xs(ticker, level=0, drop_level=True)
-            hist.index = pd.to_datetime(hist.index, utc=True).tz_convert(None)
-            hist.rename(columns=lambda c: c.title(), inplace=True)
-            return hist
+            hist.index = _naive_utc_index(hist.index)
+            hist.rename(columns=_OHLCV_CASE, inplace=True)
+            return _narrow_history(hist)
         except Exception:
             return None
 
-    def _assemble_record(self, ticker, price_info, hist_df):
+    def _fetch_history_bulk(self, tickers):
+        """1-month daily history for many symbols, HISTORY_BULK_SIZE per request.
+
+        Returns {symbol: DataFrame} shaped like ``_fetch_history``; symbols
+        Yahoo returned nothing for are simply absent.
+        """
+        result = {}
+        for chunk in self._chunked(tickers, HISTORY_BULK_SIZE):
+            # yf.download already returns tz-naive, Title-case OHLCV frames
+            for symbol, hist in download_history(chunk, period="1mo").items():
+                result[symbol] = _narrow_history(hist)
+        return result
+
+    def _fetch_history_many(self, tickers):
+        """``_fetch_history`` for several symbols, HISTORY_WORKERS at a time.
+
+        market_data spaces the request starts, so the pool only overlaps
+        response latency instead of sleeping between symbols. Symbols that
+        came back empty get one more try, at most HISTORY_RETRY_BUDGET of
+        them, so a throttled run cannot double its own request count.
+        """
+        result = {}
+        pending = list(tickers)
+        for budget in (len(pending), HISTORY_RETRY_BUDGET):
+            pending = pending[:budget]
+            if not pending:
+                break
+            with ThreadPoolExecutor(max_workers=min(HISTORY_WORKERS, len(pending))) as executor:
+                futures = {executor.submit(self._fetch_history, t): t for t in pending}
+                for future in as_completed(futures):
+                    result[futures[future]] = future.result()
+            pending = [t for t in pending if result[t] is None]
+        return result
+
+    def _assemble_record(self, ticker, price_info, hist_df, fundamentals=None):
         """Build the dict structure stored in stock_data.json."""
         avg_volume = hist_df["Volume"].mean()
         if avg_volume <= 0:
@@ -869,6 +1425,8 @@ class DataCollector:
         record = {
             "ticker": ticker,
             "current_price": current_price,
+            # Yahoo's quote time - a changed value means the record needs rescoring
+            "last_price_epoch": price_info.get("regularMarketTime"),
             "avg_volume": avg_volume,
             "market_cap": market_cap,
             "exchange": exchange,
@@ -933,60 +1491,51 @@ class DataCollector:
             "debt_to_ebitda": debt_to_ebitda,
             
             "historical_data": {
-                "close": hist_df["Close"].tolist(),
+                "close": _round_prices(hist_df["Close"]),
                 "volume": hist_df["Volume"].tolist(),
-                "high": hist_df["High"].tolist(),
-                "low": hist_df["Low"].tolist(),
-                "dates": hist_df.index.strftime("%Y-%m-%d").tolist(),
+                "high": _round_prices(hist_df["High"]),
+                "low": _round_prices(hist_df["Low"]),
+                # vectorised day formatting (strftime runs per element)
+                "dates": np.datetime_as_string(hist_df.index.values, unit="D").tolist(),
             },
         }
 
-        # --- Optional Finnhub fundamentals ---------------------------------
-        if self._finnhub is not None:
-            try:
-                fundamentals = self._finnhub.get_stock_snapshot(ticker)
-                if fundamentals:
-                    record["finnhub_fundamentals"] = fundamentals
-                    
-                    # Extract additional company profile data from Finnhub
-                    if fundamentals.get("company_name"):
-                        record["company_name"] = fundamentals["company_name"]
-                    if fundamentals.get("country"):
-                        record["country"] = fundamentals["country"]
-                    if fundamentals.get("phone"):
-                        record["phone"] = fundamentals["phone"]
-                    if fundamentals.get("website"):
-                        record["website"] = fundamentals["website"]
-                    if fundamentals.get("logo"):
-                        record["logo"] = fundamentals["logo"]
-                    if fundamentals.get("ipo_date"):
-                        record["ipo_date"] = fundamentals["ipo_date"]
-                    if fundamentals.get("finnhub_industry"):
-                        record["finnhub_industry"] = fundamentals["finnhub_industry"]
-                    if fundamentals.get("currency"):
-                        record["currency"] = fundamentals["currency"]
-                    # Note: shares_outstanding might conflict with Yahoo data, so prefix it
-                    if fundamentals.get("shares_outstanding"):
-                        record["finnhub_shares_outstanding"] = fundamentals["shares_outstanding"]
-                        
-            except Exception as e:
-                print(f"⚠️  Finnhub fundamentals fetch failed for {ticker}: {e}")
+        # --- Optional Finnhub fundamentals (prefetched per batch) ----------
+        if fundamentals:
+            record["finnhub_fundamentals"] = fundamentals
+
+            # Extract additional company profile data from Finnhub
+            for key in ("company_name", "country", "phone", "website", "logo",
+                        "ipo_date", "finnhub_industry", "currency"):
+                if fundamentals.get(key):
+                    record[key] = fundamentals[key]
+            # Note: shares_outstanding might conflict with Yahoo data, so prefix it
+            if fundamentals.get("shares_outstanding"):
+                record["finnhub_shares_outstanding"] = fundamentals["shares_outstanding"]
 
         return record
 
-    def _save_by_exchange(self, data, out_dir="cache/exchanges"):
-        """Save interim stock data split by exchange for easier inspection/resume."""
-        os.makedirs(out_dir, exist_ok=True)
+    def _group_by_exchange(self, ticker, record):
+        """Add one record to the per-exchange split and mark its exchange dirty."""
+        ex = record.get("exchange", "UNK")
+        self._exchange_groups.setdefault(ex, {})[ticker] = record
+        self._dirty_exchanges.add(ex)
+
+    def _save_by_exchange(self, data=None, out_dir="cache/exchanges"):
+        """Save interim stock data split by exchange for easier inspection/resume.
 
-        groups = {}
-        for t, d in data.items():
-            ex = d.get("exchange", "UNK")
-            groups.setdefault(ex, {})[t] = d
+        Records accumulate in ``_exchange_groups`` across calls; only the
+        exchanges that gained tickers since the last save are rewritten.
+        """
+        for t, d in (data or {}).items():
+            self._group_by_exchange(t, d)
+        if not self._dirty_exchanges:
+            return
 
-        for ex, tickers in groups.items():
-            path = os.path.join(out_dir, f"{ex}.json")
-            with open(path, "w") as f:
-                json.dump(tickers, f, indent=4)
+        os.makedirs(out_dir, exist_ok=True)
+        for ex in self._dirty_exchanges:
+            _write_json(os.path.join(out_dir, f"{ex}.json"), self._exchange_groups[ex])
+        self._dirty_exchanges.clear()
 
     def update_top_scores(self, top_n=100, recalc_scores: bool = False):
         """Re-fetch price & history for the **top_n** highest-scoring tickers.
@@ -996,8 +1545,7 @@ class DataCollector:
         """
         # Load current scores
         try:
-            with open(self.scores_file, "r") as f:
-                scores_data = json.load(f)
+            scores_data = _read_json(self.scores_file)
         except FileNotFoundError:
             print("No daily scores found. Run update_daily_scores() first.")
             return None
@@ -1020,8 +1568,9 @@ class DataCollector:
                     tickers.append(sym)
 
         print(f"Updating detailed data for {len(tickers)} top-scoring tickers…")
-        # Process tickers – this will update stock_data.json and caches in place
-        self.process_ticker_batch(tickers)
+        # Process tickers – this will update stock_data.json and caches in place.
+        # The same-day fetch cache is bypassed: the point is the latest quotes.
+        self.process_ticker_batch(tickers, use_fetch_cache=False)
 
         # After fresh data, optionally recompute their scores so file stays consistent
         if recalc_scores:
@@ -1042,6 +1591,18 @@ class DataCollector:
         """
         return self.process_ticker_batch(tickers)
 
+_worker_collector = None
+
+
+def _score_one(item):
+    """Process-pool entry point for ``DataCollector.update_daily_scores``."""
+    global _worker_collector
+    if _worker_collector is None:
+        # Scoring only needs the methods - skip __init__'s cache / API setup
+        _worker_collector = DataCollector.__new__(DataCollector)
+    return _worker_collector._score_record(item)
+
+
 if __name__ == "__main__":
     collector = DataCollector()
     collector.update_data() 
\ No newline at end of file
@@ -25,7 +25,11 @@ fully compatible.
 
 Rate limiting: a module-wide minimum delay between Yahoo requests is enforced
 (``YF_RATE_LIMIT_SECONDS`` env var, default 0.5s) to respect the project's
-rule #1: never risk API bans.
+rule #1: never risk API bans.  The delay adapts AIMD-style: every rate-limited
+response doubles it (up to ``YF_MAX_RATE_LIMIT_SECONDS``, default 30s) and
+every successful one eases it 10% back towards the configured floor, which
+it never goes below.  Multi-symbol info lookups overlap up to
+``YF_MAX_WORKERS`` (default 8) requests in flight under that same limit.
 """
 
 from __future__ import annotations
@@ -34,29 +38,59 @@ import logging
 import os
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 
 import pandas as pd
 import yfinance as yf
+from yfinance.exceptions import YFRateLimitError
 
 logging.getLogger("yfinance").setLevel(logging.CRITICAL)
 
 _RATE_LIMIT_SECONDS = float(os.getenv("YF_RATE_LIMIT_SECONDS", "0.5"))
+_MAX_RATE_LIMIT_SECONDS = float(os.getenv("YF_MAX_RATE_LIMIT_SECONDS", "30"))
+# Upper bound on concurrent info requests for multi-symbol Tickers.  Request
+# *starts* are still spaced by _rate_limit(); workers only overlap latency.
+_MAX_INFO_WORKERS = int(os.getenv("YF_MAX_WORKERS", "8"))
 _rate_lock = threading.Lock()
 _last_request_time = 0.0
+# Current spacing between request starts, adapted by _adapt_interval()
+_interval = _RATE_LIMIT_SECONDS
+_interval_lock = threading.Lock()
 
 
 def _rate_limit():
-    """Block until at least _RATE_LIMIT_SECONDS since the last Yahoo request."""
+    """Block until at least the current interval since the last Yahoo request."""
     global _last_request_time
     with _rate_lock:
         now = time.time()
-        wait = _RATE_LIMIT_SECONDS - (now - _last_request_time)
+        wait = _interval - (now - _last_request_time)
         if wait > 0:
             time.sleep(wait)
         _last_request_time = time.time()
 
 
+def _is_throttled(exc: Exception) -> bool:
+    if isinstance(exc, YFRateLimitError):
+        return True
+    text = str(exc).lower()
+    return "429" in text or "too many requests" in text
+
+
+def _adapt_interval(exc: Optional[Exception] = None) -> None:
+    """Feed one request outcome back into the spacing used by _rate_limit().
+
+    Rate-limit errors double the interval; successes shrink it by 10% down to
+    _RATE_LIMIT_SECONDS.  Other failures leave it alone.
+    """
+    global _interval
+    with _interval_lock:
+        if exc is None:
+            _interval = max(_RATE_LIMIT_SECONDS, _interval * 0.9)
+        elif _is_throttled(exc):
+            _interval = min(_MAX_RATE_LIMIT_SECONDS, max(_interval, 0.1) * 2)
+
+
 class Ticker:
     """yahooquery-compatible wrapper around yfinance.
 
@@ -78,9 +112,11 @@ class Ticker:
             try:
                 _rate_limit()
                 info = yf.Ticker(symbol).info or {}
+                _adapt_interval()
                 if not isinstance(info, dict):
                     info = {}
-            except Exception:
+            except Exception as e:
+                _adapt_interval(e)
                 info = {}
             # Normalise a couple of fields yahooquery used to expose
             if "exchangeName" not in info and info.get("fullExchangeName"):
@@ -89,7 +125,16 @@ class Ticker:
         return self._info_cache[symbol]
 
     def _module(self) -> Dict[str, dict]:
-        """Return {symbol: merged info dict} - shared by all module props."""
+        """Return {symbol: merged info dict} - shared by all module props.
+
+        Uncached symbols are fetched on a bounded thread pool so several
+        requests are in flight at once while ``_rate_limit`` keeps their start
+        times spaced - wall time tracks the rate limit, not per-request RTT.
+        """
+        missing = [sym for sym in self.symbols if sym not in self._info_cache]
+        if len(missing) > 1 and _MAX_INFO_WORKERS > 1:
+            with ThreadPoolExecutor(max_workers=min(_MAX_INFO_WORKERS, len(missing))) as executor:
+                list(executor.map(self._get_info, missing))
         return {sym: self._get_info(sym) for sym in self.symbols}
 
     @property
@@ -135,6 +180,7 @@ class Ticker:
             if len(self.symbols) == 1:
                 df = yf.Ticker(self.symbols[0]).history(
                     period=period, interval=interval, auto_adjust=False)
+                _adapt_interval()
                 if df is None or df.empty:
                     return df
                 return df
@@ -143,6 +189,7 @@ class Ticker:
             data = yf.download(self.symbols, period=period, interval=interval,
                                group_by="ticker", auto_adjust=False,
                                progress=False, threads=False)
+            _adapt_interval()
             if data is None or data.empty:
                 return data
             for sym in self.symbols:
@@ -155,7 +202,8 @@ class Ticker:
             if not frames:
                 return pd.DataFrame()
             return pd.concat(frames, names=["symbol", "date"])
-        except Exception:
+        except Exception as e:
+            _adapt_interval(e)
             return None
 
 
@@ -168,11 +216,13 @@ def get_history(symbol: str, period: str = "1y", interval: str = "1d") -> Option
         _rate_limit()
         df = yf.Ticker(symbol).history(period=period, interval=interval,
                                        auto_adjust=False)
+        _adapt_interval()
         if df is None or df.empty:
             return None
         df.index = pd.to_datetime(df.index, utc=True).tz_convert(None)
         return df
-    except Exception:
+    except Exception as e:
+        _adapt_interval(e)
         return None
 
 
@@ -187,6 +237,7 @@ def download_history(symbols: List[str], period: str = "1y",
         data = yf.download(list(symbols), period=period, interval=interval,
                            group_by="ticker", auto_adjust=False,
                            progress=False, threads=False)
+        _adapt_interval()
         if data is None or data.empty:
             return result
         if len(symbols) == 1:
@@ -206,8 +257,8 @@ def download_history(symbols: List[str], period: str = "1y",
                     result[sym] = sub
             except (KeyError, TypeError):
                 continue
-    except Exception:
-        pass
+    except Exception as e:
+        _adapt_interval(e)
     return result
 
 
@@ -220,8 +271,11 @@ def get_option_expirations(symbol: str) -> List[str]:
     """List available option expiration dates for a symbol."""
     try:
         _rate_limit()
-        return list(yf.Ticker(symbol).options or [])
-    except Exception:
+        expirations = list(yf.Ticker(symbol).options or [])
+        _adapt_interval()
+        return expirations
+    except Exception as e:
+        _adapt_interval(e)
         return []
 
 
@@ -230,6 +284,8 @@ def get_option_chain(symbol: str, expiration: Optional[str] = None):
     try:
         _rate_limit()
         chain = yf.Ticker(symbol).option_chain(expiration)
+        _adapt_interval()
         return chain.calls, chain.puts
-    except Exception:
+    except Exception as e:
+        _adapt_interval(e)
         return None, None
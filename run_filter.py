@@ -12,6 +12,7 @@ or it can be imported and the function ``run_filter`` called from the CLI.
 from __future__ import annotations
 
 import csv
+import heapq
 import json
 import os
 from typing import List, Dict, Any
@@ -85,9 +86,8 @@ def run_filter(top_n: int = 500, verbose: bool = False) -> List[str]:
                     }
                 )
 
-    # Sort and keep top_n by market-cap
-    records.sort(key=lambda x: x["market_cap"], reverse=True)
-    top_records = records[:top_n]
+    # Keep top_n by market-cap – partial selection, no need to sort the rest
+    top_records = heapq.nlargest(top_n, records, key=lambda x: x["market_cap"])
 
     # Write CSV for eyeballing
     with open(CSV_PATH_TEMPLATE.format(n=top_n), "w", newline="") as f:
@@ -55,9 +55,11 @@ class Stabilization:
             if df is None or len(df) < 15:
                 return 0, self._empty_details('insufficient_history')
 
-            close = df['Close'].astype(float)
-            low = df['Low'].astype(float) if 'Low' in df else close
-            high = df['High'].astype(float) if 'High' in df else close
+            # Unbox once: every component below is a handful of reductions
+            # over the last few bars, far cheaper on ndarrays than Series
+            close = df['Close'].to_numpy(dtype=float)
+            low = df['Low'].to_numpy(dtype=float) if 'Low' in df else close
+            high = df['High'].to_numpy(dtype=float) if 'High' in df else close
 
             base_score, base_info = self._score_base_formation(low)
             recovery_score, recovery_info = self._score_recovery_traction(close, low)
@@ -85,23 +87,23 @@ class Stabilization:
             return 0, self._empty_details('calculation_error')
 
     # ------------------------------------------------------------------
-    # Components
+    # Components (float64 ndarrays; NaN handling mirrors pandas' skipna)
     # ------------------------------------------------------------------
-    def _score_base_formation(self, low: pd.Series) -> Tuple[float, Dict]:
+    def _score_base_formation(self, low: np.ndarray) -> Tuple[float, Dict]:
         """Higher lows over the last ~10 sessions indicate a base forming."""
         max_score = self.weights['base_formation']
-        window = low.tail(10)
+        window = low[-10:]
         if len(window) < 6:
             return 0, {'higher_lows': False}
 
         # Split the window into thirds and compare their minima
-        thirds = np.array_split(window.values, 3)
+        thirds = np.array_split(window, 3)
         mins = [float(np.min(t)) for t in thirds]
         strictly_rising = mins[0] < mins[1] < mins[2]
         partially_rising = mins[2] > mins[0]
 
         # Also: how many of the last 5 sessions printed a new 10-day low?
-        recent_new_lows = int((window.tail(5) <= window.min() * 1.001).sum())
+        recent_new_lows = int((window[-5:] <= _nanmin(window) * 1.001).sum())
 
         score = 0.0
         if strictly_rising:
@@ -117,8 +119,8 @@ class Stabilization:
             'new_lows_last_5d': recent_new_lows,
         }
 
-    def _score_recovery_traction(self, close: pd.Series,
-                                 low: pd.Series) -> Tuple[float, Dict]:
+    def _score_recovery_traction(self, close: np.ndarray,
+                                 low: np.ndarray) -> Tuple[float, Dict]:
         """Reward a modest, holding bounce off the recent low.
 
         Sweet spot: 3-15% above the 20-day low. Less = still on the floor
@@ -128,8 +130,8 @@ class Stabilization:
         lookback = min(len(close), 20)
         # Compare close-to-close: measuring against the Low column would
         # count ordinary intraday range as a "bounce" even in a free-fall.
-        recent_low = float(close.tail(lookback).min())
-        price = float(close.iloc[-1])
+        recent_low = _nanmin(close[-lookback:])
+        price = float(close[-1])
         if recent_low <= 0:
             return 0, {'pct_above_20d_low': None}
 
@@ -147,7 +149,7 @@ class Stabilization:
             score = 0.0               # sitting on the low - unproven
 
         # Did the bounce hold? (close today >= close 3 sessions ago)
-        held = len(close) >= 4 and price >= float(close.iloc[-4])
+        held = len(close) >= 4 and price >= float(close[-4])
         if score > 0 and held:
             score = min(max_score, score + max_score * 0.25)
 
@@ -156,20 +158,22 @@ class Stabilization:
             'bounce_holding': bool(held),
         }
 
-    def _score_volatility_contraction(self, high: pd.Series, low: pd.Series,
-                                      close: pd.Series) -> Tuple[float, Dict]:
+    def _score_volatility_contraction(self, high: np.ndarray, low: np.ndarray,
+                                      close: np.ndarray) -> Tuple[float, Dict]:
         """ATR(5) cooling below ATR(15) means the panic phase is ending."""
         max_score = self.weights['volatility_contraction']
-        prev_close = close.shift(1)
-        tr = pd.concat([high - low,
-                        (high - prev_close).abs(),
-                        (low - prev_close).abs()], axis=1).max(axis=1)
+        prev_close = np.empty_like(close)
+        prev_close[0] = np.nan
+        prev_close[1:] = close[:-1]
+        # fmax skips a NaN operand, like DataFrame.max(axis=1)
+        tr = np.fmax(np.fmax(high - low, np.abs(high - prev_close)),
+                     np.abs(low - prev_close))
         # Normalise to % of price: in a steep decline the *absolute* range
         # shrinks with the price, which would fake a contraction signal.
         tr = tr / close
 
-        atr5 = tr.rolling(5).mean().iloc[-1]
-        atr15 = tr.rolling(min(len(tr), 15)).mean().iloc[-1]
+        atr5 = _tail_mean(tr, 5)
+        atr15 = _tail_mean(tr, min(len(tr), 15))
         if not np.isfinite(atr5) or not np.isfinite(atr15) or atr15 <= 0:
             return 0, {'atr_ratio': None}
 
@@ -186,19 +190,23 @@ class Stabilization:
         return score, {'atr_ratio': round(ratio, 3),
                        'volatility_contracting': ratio < 1.0}
 
-    def _score_momentum_decay(self, close: pd.Series) -> Tuple[float, Dict]:
+    def _score_momentum_decay(self, close: np.ndarray) -> Tuple[float, Dict]:
         """Down days becoming rarer and shallower vs the prior stretch."""
         max_score = self.weights['momentum_decay']
-        rets = close.pct_change().dropna()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rets = close[1:] / close[:-1] - 1
+        rets = rets[~np.isnan(rets)]
         if len(rets) < 10:
             return 0, {'down_days_last_5': None}
 
-        recent = rets.tail(5)
-        prior = rets.tail(10).head(5)
+        recent = rets[-5:]
+        prior = rets[-10:-5]
 
-        down_recent = int((recent < 0).sum())
-        avg_down_recent = float(recent[recent < 0].mean()) if down_recent else 0.0
-        avg_down_prior = float(prior[prior < 0].mean()) if (prior < 0).any() else 0.0
+        recent_down = recent[recent < 0]
+        prior_down = prior[prior < 0]
+        down_recent = len(recent_down)
+        avg_down_recent = float(recent_down.mean()) if down_recent else 0.0
+        avg_down_prior = float(prior_down.mean()) if len(prior_down) else 0.0
 
         # Still falling nearly every session: no deceleration credit at all
         if down_recent >= 4:
@@ -264,3 +272,17 @@ class Stabilization:
             'stabilization_grade': 'F',
             'signals': {},
         }
+
+
+def _nanmin(values: np.ndarray) -> float:
+    """Minimum ignoring NaN (NaN when nothing is left), like ``Series.min``."""
+    values = values[~np.isnan(values)]
+    return float(values.min()) if len(values) else np.nan
+
+
+def _tail_mean(values: np.ndarray, window: int) -> float:
+    """Last value of ``Series.rolling(window).mean()``: NaN if the tail has a gap."""
+    tail = values[-window:]
+    if len(tail) < window or np.isnan(tail).any():
+        return np.nan
+    return float(tail.mean())
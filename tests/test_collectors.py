@@ -0,0 +1,633 @@
+"""Phase 1 collector tests (offline - network layers are stubbed)."""
+
+import pytest
+
+import collectors.fundamental_data as fundamental_data
+from collectors.fundamental_data import FundamentalDataCollector
+
+
+class _FakeTicker:
+    """Stands in for market_data.Ticker; records how it was constructed."""
+
+    created = []
+    INFO = {
+        "AAA": {"trailingPE": 12.0, "freeCashflow": 5e8, "marketCap": 1e10,
+                "operatingMargins": 0.2, "sector": "Technology"},
+        "BBB": {"trailingPE": 30.0, "marketCap": 2e9},
+    }
+
+    def __init__(self, symbols, **kwargs):
+        self.symbols = symbols.split()
+        _FakeTicker.created.append(self.symbols)
+
+    def _module(self):
+        return {s: dict(self.INFO.get(s, {})) for s in self.symbols}
+
+    summary_detail = financial_data = key_stats = asset_profile = property(_module)
+
+
+@pytest.fixture
+def collector(monkeypatch, tmp_path):
+    """A DataCollector caching under *tmp_path*, with Finnhub disabled."""
+    import data_collector
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(data_collector, "FinnhubCollector", None)
+    return data_collector.DataCollector()
+
+
+def test_fundamentals_batch_uses_one_ticker(monkeypatch):
+    monkeypatch.setattr(fundamental_data, "Ticker", _FakeTicker)
+    _FakeTicker.created = []
+    collector = FundamentalDataCollector(cache_file=None)
+
+    result = collector.get_fundamental_metrics_batch(["AAA", "BBB", "CCC"])
+
+    assert _FakeTicker.created == [["AAA", "BBB", "CCC"]]
+    assert result["AAA"]["pe_ratio"] == 12.0
+    assert result["AAA"]["fcf_yield"] == 0.05
+    assert result["BBB"]["market_cap"] == 2e9
+    assert result["CCC"]["valuation_score"] == 0
+
+    # Cached tickers are not re-fetched; the single-ticker API wraps the batch
+    assert collector.get_fundamental_metrics("AAA") is result["AAA"]
+    assert len(_FakeTicker.created) == 1
+
+
+def test_fundamentals_persist_across_instances(monkeypatch, tmp_path):
+    monkeypatch.setattr(fundamental_data, "Ticker", _FakeTicker)
+    _FakeTicker.created = []
+    cache_file = str(tmp_path / "fundamentals.json")
+
+    first = FundamentalDataCollector(cache_file=cache_file).get_fundamental_metrics("AAA")
+    second = FundamentalDataCollector(cache_file=cache_file).get_fundamental_metrics("AAA")
+
+    assert len(_FakeTicker.created) == 1   # second instance served from disk
+    assert second["pe_ratio"] == first["pe_ratio"] == 12.0
+
+
+def test_fundamentals_cache_appends_and_compacts(monkeypatch, tmp_path):
+    import json
+
+    monkeypatch.setattr(fundamental_data, "Ticker", _FakeTicker)
+    cache_file = tmp_path / "fundamentals.json"
+    journal = tmp_path / "fundamentals.jsonl"
+
+    collector = FundamentalDataCollector(cache_file=str(cache_file))
+    collector.get_fundamental_metrics("AAA")
+    collector.get_fundamental_metrics("BBB")
+    # misses are appended to the journal; the snapshot is not rewritten
+    assert not cache_file.exists()
+    assert [json.loads(line)["ticker"] for line in journal.read_text().splitlines()] == ["AAA", "BBB"]
+
+    with open(journal, "a") as f:
+        f.write('{"ticker": "CCC", "fetch')           # interrupted append
+    _FakeTicker.created = []
+    reloaded = FundamentalDataCollector(cache_file=str(cache_file))
+    assert reloaded.get_fundamental_metrics("BBB")["market_cap"] == 2e9
+    assert _FakeTicker.created == []
+    # the next load folded the journal into the snapshot
+    assert not journal.exists()
+    assert sorted(json.loads(cache_file.read_text())) == ["AAA", "BBB"]
+    assert [p.name for p in tmp_path.iterdir()] == ["fundamentals.json"]
+
+
+def test_score_frame_matches_scalar_scorers():
+    import numpy as np
+    import pandas as pd
+    from collectors.fundamental_data import score_frame
+
+    rng = np.random.default_rng(0)
+    collector = FundamentalDataCollector(cache_file=None)
+    rows = {}
+    for i in range(200):
+        rows[f"T{i}"] = {
+            'free_cash_flow': rng.normal(0, 1e8), 'operating_margins': rng.uniform(-0.1, 0.3),
+            'gross_margins': rng.uniform(-0.1, 0.6), 'profit_margins': rng.uniform(-0.1, 0.3),
+            'return_on_equity': rng.uniform(-0.1, 0.3), 'current_ratio': rng.uniform(0.5, 2.5),
+            'debt_to_equity': rng.uniform(0, 1.5), 'revenue_growth': rng.normal(0, 0.1),
+            'earnings_growth': rng.normal(0, 0.1), 'total_cash': rng.uniform(0, 2e9),
+            'total_debt': rng.choice([0.0, rng.uniform(1, 2e9)]), 'payout_ratio': rng.uniform(0, 1),
+            'pe_ratio': rng.uniform(-5, 40), 'peg_ratio': rng.uniform(0.2, 3),
+            'price_to_book': rng.uniform(0.2, 4), 'dividend_yield': rng.uniform(0, 0.06),
+            'fcf_yield': rng.uniform(-0.02, 0.12),
+        }
+    # Missing fields must score the same way on both paths
+    rows['T0']['total_debt'] = None
+    rows['T1']['revenue_growth'] = None
+    rows['T2']['operating_margins'] = None
+
+    scores = score_frame(pd.DataFrame.from_dict(rows, orient='index'))
+
+    for ticker, f in rows.items():
+        assert scores.at[ticker, 'quality_score'] == collector._calculate_quality_score(f)
+        assert scores.at[ticker, 'financial_strength'] == collector._calculate_financial_strength(f)
+        assert scores.at[ticker, 'valuation_score'] == collector._calculate_valuation_score(f)
+
+
+@pytest.mark.parametrize("gap", [None, 150, -3])
+def test_macd_kernel_matches_pandas_ewm(dipped_stock, gap):
+    import numpy as np
+    from collectors._technical_numba import A12, ewma, macd_scalars
+
+    close = dipped_stock["Close"].copy()
+    if gap is not None:
+        close.iloc[gap] = np.nan          # one missing bar mid-history
+    macd_line = (close.ewm(span=12, adjust=False).mean()
+                 - close.ewm(span=26, adjust=False).mean())
+    signal_line = macd_line.ewm(span=9, adjust=False).mean()
+    crossed = any(macd_line.iloc[-i - 1] <= signal_line.iloc[-i - 1]
+                  and macd_line.iloc[-i] > signal_line.iloc[-i] for i in range(1, 6))
+
+    macd, signal, hist, bullish_cross, above, hist_pos = macd_scalars(close.to_numpy())
+
+    assert abs(macd - macd_line.iloc[-1]) < 1e-9
+    assert abs(signal - signal_line.iloc[-1]) < 1e-9
+    assert abs(hist - (macd_line - signal_line).iloc[-1]) < 1e-9
+    assert bullish_cross == crossed
+    assert above == (macd > signal) and hist_pos == (hist > 0)
+    # the panel path's EMA carries over the gap the same way
+    np.testing.assert_allclose(ewma(close.to_numpy(), A12),
+                               close.ewm(span=12, adjust=False).mean(), rtol=1e-12)
+
+
+def test_rsi_kernels_match_utils(dipped_stock):
+    import numpy as np
+    from collectors._technical_numba import rsi_last, rsi_tail
+    from utils import calculate_rsi
+
+    close = dipped_stock["Close"].to_numpy()
+    for period in (5, 14):
+        expected = calculate_rsi(dipped_stock["Close"], period=period).to_numpy()
+        assert abs(rsi_last(close, period) - expected[-1]) < 1e-9
+        np.testing.assert_allclose(rsi_tail(close, period, 10), expected[-10:], atol=1e-9)
+    assert np.isnan(rsi_last(close[:10], 14))
+
+
+def test_indicator_panel_matches_per_ticker():
+    import numpy as np
+    import pandas as pd
+    from collectors.technical_indicators import TechnicalIndicators
+    from tests.conftest import make_price_series
+
+    ti = TechnicalIndicators()
+    frames = {f"T{i}": make_price_series(n_days=260, seed=i, dip_at=250 if i % 2 else None)
+              for i in range(6)}
+    frames["SHORT"] = make_price_series(n_days=10, seed=99)
+    frames["MID"] = make_price_series(n_days=60, seed=42)
+    panel = {col: pd.DataFrame({t: f[col].reset_index(drop=True).set_axis(
+                 range(260 - len(f), 260)) for t, f in frames.items()})
+             for col in ("Close", "High", "Low", "Open")}
+
+    result = ti.calculate_all_indicators_panel(panel["Close"], panel["High"],
+                                               panel["Low"], panel["Open"])
+
+    for ticker, frame in frames.items():
+        expected = ti.calculate_all_indicators(frame, ticker)
+        for key, value in expected.items():
+            if key == "rsi_divergence":
+                continue
+            got = result.at[ticker, key]
+            if value is None:   # missing SMA -> NaN, "below" flag -> False
+                assert not got or np.isnan(got), (ticker, key)
+            else:
+                assert np.isclose(float(got), float(value), equal_nan=True), (ticker, key, got, value)
+
+
+def test_indicator_batch_one_row_per_ticker(dipped_stock, flat_market):
+    from collectors.technical_indicators import TechnicalIndicators
+
+    ti = TechnicalIndicators()
+    frame = ti.batch({'DIP': dipped_stock, 'FLAT': flat_market})
+
+    assert list(frame.index) == ['DIP', 'FLAT']
+    assert frame.loc['DIP', 'rsi_14'] == ti.calculate_all_indicators(dipped_stock)['rsi_14']
+
+
+def test_indicator_batch_parallel_matches_serial(dipped_stock, flat_market):
+    import pandas as pd
+    from collectors.technical_indicators import TechnicalIndicators
+
+    ti = TechnicalIndicators()
+    frames = {'DIP': dipped_stock, 'FLAT': flat_market, 'SHORT': dipped_stock.tail(10)}
+
+    pd.testing.assert_frame_equal(ti.batch_parallel(frames, max_workers=2), ti.batch(frames))
+
+
+def test_fundamentals_frame_is_narrowly_typed(monkeypatch):
+    import numpy as np
+
+    monkeypatch.setattr(fundamental_data, "Ticker", _FakeTicker)
+    frame = FundamentalDataCollector(cache_file=None).get_fundamentals_frame(["AAA", "BBB"])
+
+    assert list(frame.index) == ["AAA", "BBB"]
+    assert frame["pe_ratio"].dtype == np.float32
+    assert frame["quality_score"].dtype == np.int8
+    assert frame["sector"].dtype == "category"
+
+
+def test_volume_batch_matches_per_ticker():
+    import numpy as np
+    import pandas as pd
+    from collectors.volume_analysis import VolumeAnalyzer
+    from tests.conftest import make_price_series
+
+    va = VolumeAnalyzer()
+    frames = {f"T{i}": make_price_series(n_days=120, seed=i, dip_at=115 if i % 2 else None)
+              for i in range(6)}
+    frames["SHORT"] = make_price_series(n_days=8, seed=98)
+    frames["MID"] = make_price_series(n_days=17, seed=97)
+    frames["LONGER"] = make_price_series(n_days=40, seed=96)
+    panel = {col: pd.DataFrame({t: f[col].reset_index(drop=True).set_axis(
+                 range(120 - len(f), 120)) for t, f in frames.items()})
+             for col in ("Volume", "Close")}
+
+    result = va.analyze_volume_patterns_batch(panel["Volume"], panel["Close"])
+
+    for ticker, frame in frames.items():
+        for key, value in va.analyze_volume_patterns(frame, ticker).items():
+            got = result.at[ticker, key]
+            if isinstance(value, str):
+                assert got == value, (ticker, key)
+            else:
+                assert np.isclose(float(got), float(value), equal_nan=True), (ticker, key, got, value)
+
+
+def test_volume_analysis_is_memoized_per_history(dipped_stock):
+    from collectors.volume_analysis import VolumeAnalyzer
+
+    va = VolumeAnalyzer()
+    first = va.analyze_volume_patterns(dipped_stock, "DIP")
+    first['current_volume'] = -1          # callers get a copy, not the cache entry
+    again = va.analyze_volume_patterns(dipped_stock, "DIP")
+    shorter = va.analyze_volume_patterns(dipped_stock.iloc[:-1], "DIP")
+
+    assert len(va.cache) == 2
+    assert again == va.analyze_volume_patterns(dipped_stock)
+    assert shorter == VolumeAnalyzer().analyze_volume_patterns(dipped_stock.iloc[:-1], "DIP")
+
+
+def test_volume_analyze_many_matches_serial(dipped_stock, flat_market):
+    from collectors.volume_analysis import VolumeAnalyzer
+
+    frames = {'DIP': dipped_stock, 'FLAT': flat_market, 'SHORT': dipped_stock.tail(5)}
+    va = VolumeAnalyzer()
+
+    result = va.analyze_many(frames, max_workers=2)
+
+    assert list(result) == ['DIP', 'FLAT', 'SHORT']
+    for ticker, frame in frames.items():
+        assert result[ticker] == VolumeAnalyzer().analyze_volume_patterns(frame, ticker)
+    assert len(va.cache) == 2             # worker results merged back
+
+
+def test_failed_bulk_batches_mark_bad_only_after_limit(collector):
+    from data_collector import BATCH_FAILURE_LIMIT, DataCollector
+
+    for _ in range(BATCH_FAILURE_LIMIT - 1):
+        collector._record_batch_failure(["AAA", "BBB"])
+    collector._clear_batch_failures(["BBB"])
+    assert not collector.bad_tickers
+
+    collector._record_batch_failure(["AAA", "BBB"])
+    assert collector.bad_tickers == {"AAA"}
+    assert DataCollector().bad_tickers_attempts == {"BBB": 1}   # persisted
+
+
+def test_partial_records_round_trip(collector):
+    collector._save_partial_record("AAA", {"current_price": 10.0})
+    collector._save_partial_record("BBB", {"current_price": 20.0})
+    assert collector._load_partial_records() == {"AAA": {"current_price": 10.0},
+                                                 "BBB": {"current_price": 20.0}}
+
+    with open(collector.partial_file, "a") as f:
+        f.write('{"ticker": "CCC", "rec')           # interrupted mid-write
+    collector._clear_partial_records(["AAA"])
+    assert list(collector._load_partial_records()) == ["BBB"]
+
+
+def test_legacy_score_panel_matches_scalar(collector):
+    import pandas as pd
+    from tests.conftest import make_price_series
+    from utils import calculate_score, calculate_score_panel
+
+    records = {}
+    for i, n_days in enumerate((10, 21, 22, 60, 120, 230, 260)):
+        frame = make_price_series(n_days=n_days, seed=i, vol=0.04,
+                                  dip_at=n_days - 2 if i % 2 else None)
+        records[f"T{i}"] = {
+            "historical_data": {"close": frame["Close"].tolist(), "volume": frame["Volume"].tolist(),
+                                "high": frame["High"].tolist(), "low": frame["Low"].tolist()},
+            "pe": (None, 12.0, 20.0, 40.0)[i % 4], "dividend_yield": 0.04 if i % 3 else None,
+            "beta": 2.5 if i == 4 else None, "short_percent_float": 0.2 if i == 5 else 0.01,
+        }
+
+    closes, volumes = collector._history_panels(records)
+    panel = calculate_score_panel(
+        closes, volumes, {t: collector._record_fundamentals(r) for t, r in records.items()})
+
+    for ticker, record in records.items():
+        hist = record["historical_data"]
+        frame = pd.DataFrame({"Close": hist["close"], "Volume": hist["volume"],
+                              "High": hist["high"], "Low": hist["low"]})
+        assert panel[ticker] == calculate_score(frame, collector._record_fundamentals(record)), ticker
+
+
+def test_records_without_history_do_not_abort_scoring(collector, dipped_stock):
+    import json
+    import pandas as pd
+    from utils import calculate_score, calculate_score_panel
+
+    hist = dipped_stock.tail(60)
+    good = {"current_price": 10.0, "historical_data": {
+        "close": hist["Close"].tolist(), "volume": hist["Volume"].tolist(),
+        "high": hist["High"].tolist(), "low": hist["Low"].tolist(),
+        "dates": [d.strftime("%Y-%m-%d") for d in hist.index]}}
+    stock_data = {
+        "GOOD": good,
+        "NOHIST": {"current_price": 10.0},
+        "LONGVOL": {"current_price": 10.0, "historical_data": dict(
+            good["historical_data"], volume=[1.0] * 100)},
+        "INFPE": dict(good, pe="Infinity"),          # as Yahoo sends trailingPE
+    }
+    with open(collector.data_file, "w") as f:
+        json.dump(stock_data, f)
+
+    closes, volumes = collector._history_panels(stock_data)
+    assert list(closes.columns) == ["GOOD", "INFPE"]
+    # a non-numeric fundamental falls back like the scalar scorer
+    panel = calculate_score_panel(
+        closes, volumes, {t: collector._record_fundamentals(stock_data[t]) for t in closes})
+    frame = pd.DataFrame({"Close": hist["Close"].tolist(), "Volume": hist["Volume"].tolist()})
+    assert panel["INFPE"] == calculate_score(
+        frame, collector._record_fundamentals(stock_data["INFPE"])) == (0, {})
+
+    # the malformed records go through calculate_score's own fallback
+    scores = collector.update_daily_scores(max_workers=1)["scores"]
+    assert list(scores) == ["GOOD", "NOHIST", "LONGVOL", "INFPE"]
+    assert scores["GOOD"]["score"] > 0
+    with open(collector.scores_file) as f:
+        assert json.load(f)["scores"].keys() == scores.keys()
+
+
+def test_save_by_exchange_rewrites_only_dirty_exchanges(collector, tmp_path):
+    import json
+
+    collector._save_by_exchange({"AAA": {"exchange": "NMS"}, "BBB": {"exchange": "NYQ"}})
+    (tmp_path / "cache/exchanges/NYQ.json").write_text("untouched")
+    collector._save_by_exchange({"CCC": {"exchange": "NMS"}})
+
+    assert json.loads((tmp_path / "cache/exchanges/NMS.json").read_text()) == {
+        "AAA": {"exchange": "NMS"}, "CCC": {"exchange": "NMS"}}
+    assert (tmp_path / "cache/exchanges/NYQ.json").read_text() == "untouched"
+
+
+def test_update_checks_are_memoised(collector):
+    import json
+
+    assert collector.needs_weekly_update() and collector.needs_daily_update()
+
+    with open(collector.last_update_file, "w") as f:
+        json.dump({"last_weekly_update": "2099-01-01T00:00:00"}, f)
+    assert collector.needs_weekly_update()          # cached answer within the TTL
+    collector._update_times.clear()
+    assert not collector.needs_weekly_update()
+
+
+def test_clean_symbol_normalises_yahoo_tickers():
+    from data_collector import _clean_symbol
+
+    assert _clean_symbol("brk.b") == "BRK.B"
+    assert _clean_symbol("abc^a") == "ABC-A"        # preferred shares
+    assert _clean_symbol("BRK-B") == "BRK-B"
+    assert _clean_symbol("A B$C") == "ABC"
+
+
+def test_history_retries_are_budgeted(collector, monkeypatch):
+    import data_collector
+
+    monkeypatch.setattr(data_collector, "HISTORY_RETRY_BUDGET", 2)
+    calls = []
+    monkeypatch.setattr(collector, "_fetch_history", lambda t: calls.append(t))
+
+    result = collector._fetch_history_many(["A", "B", "C", "D"])
+    assert set(result) == {"A", "B", "C", "D"} and all(v is None for v in result.values())
+    assert len(calls) == 4 + 2
+
+
+def test_same_day_fetch_cache_skips_yahoo(collector, monkeypatch):
+    import os
+
+    collector._save_fetch_cache("AAA", {"exchange": "NMS", "current_price": 10.0})
+    stale = os.path.join(collector.fetch_cache_dir, "2000-01-01.jsonl")
+    open(stale, "w").close()
+
+    def no_network(batch):
+        raise AssertionError("cached tickers must not hit Yahoo")
+    monkeypatch.setattr(collector, "_fetch_bulk_info", no_network)
+
+    data = collector.process_ticker_batch(["AAA"])
+    assert data == {"AAA": {"exchange": "NMS", "current_price": 10.0}}
+    assert not os.path.exists(stale)
+
+
+def test_concurrent_batches_match_serial(collector, monkeypatch, dipped_stock):
+    import json
+    import os
+    import data_collector
+    from data_collector import DataCollector
+
+    monkeypatch.setattr(data_collector, "BULK_PRICE_SIZE", 2)
+    tickers = ["AAA", "BBB", "CCC", "DDD", "EEE"]
+
+    def fake_info(batch):
+        price = {t: {"regularMarketPrice": 10.0, "marketCap": 1e9, "exchange": "NMS"}
+                 for t in batch if t != "CCC"}
+        return price, {}, {}, {}, {}
+
+    def run(workers, collector):
+        monkeypatch.setattr(data_collector, "BATCH_WORKERS", workers)
+        monkeypatch.setattr(collector, "_fetch_bulk_info", fake_info)
+        monkeypatch.setattr(collector, "_fetch_history_bulk",
+                            lambda syms: {s: dipped_stock for s in syms})
+        return collector.process_ticker_batch(tickers, use_fetch_cache=False)
+
+    serial = run(1, collector)
+    fresh = DataCollector()
+    parallel = run(3, fresh)
+    assert list(parallel) == list(serial) == ["AAA", "BBB", "DDD", "EEE"]
+    assert parallel == serial
+    assert "CCC" in fresh.bad_tickers
+    # each run compacts its marks itself (no exit hook per instance)
+    assert fresh._load_bad_tickers() == {"CCC"}
+    assert not os.path.exists(fresh.bad_journal_file)
+    with open(fresh.bad_file) as f:
+        assert json.load(f) == ["CCC"]
+
+
+def test_rate_limit_interval_adapts(monkeypatch):
+    import market_data
+    from yfinance.exceptions import YFRateLimitError
+
+    monkeypatch.setattr(market_data, "_interval", market_data._RATE_LIMIT_SECONDS)
+    floor = market_data._RATE_LIMIT_SECONDS
+
+    market_data._adapt_interval(YFRateLimitError())
+    market_data._adapt_interval(YFRateLimitError())
+    assert market_data._interval == floor * 4
+    market_data._adapt_interval(ValueError("bad symbol"))      # not a throttle
+    assert market_data._interval == floor * 4
+    for _ in range(50):
+        market_data._adapt_interval()
+    assert market_data._interval == floor
+
+
+def test_unchanged_quotes_reuse_previous_scores(collector, monkeypatch):
+    import json
+
+    stock_data = {t: {"current_price": 10.0, "last_price_epoch": 1700000000,
+                      "historical_data": {"close": [10.0] * 5, "volume": [1e6] * 5}}
+                  for t in ("AAA", "BBB")}
+    with open(collector.data_file, "w") as f:
+        json.dump(stock_data, f)
+
+    scored = []
+
+    def fake_score(item):
+        ticker, record, _ = item
+        scored.append(ticker)
+        return ticker, {"score": len(scored), "score_details": {}, "price": record["current_price"],
+                        "last_price_epoch": record["last_price_epoch"]}
+    monkeypatch.setattr(collector, "_score_record", fake_score)
+
+    collector.update_daily_scores(max_workers=1)
+    stock_data["BBB"]["last_price_epoch"] += 60
+    with open(collector.data_file, "w") as f:
+        json.dump(stock_data, f)
+    scores = collector.update_daily_scores(max_workers=1)["scores"]
+
+    assert scored == ["AAA", "BBB", "BBB"]
+    assert list(scores) == ["AAA", "BBB"]
+    assert scores["AAA"]["score"] == 1 and scores["BBB"]["score"] == 3
+
+
+def test_write_json_replaces_atomically(tmp_path):
+    import json
+    from data_collector import _write_json
+
+    path = tmp_path / "data.json"
+    path.write_text('{"old": 1}')
+
+    class Unserialisable:
+        pass
+    try:
+        _write_json(str(path), {"new": Unserialisable()})
+    except TypeError:
+        pass
+    assert json.loads(path.read_text()) == {"old": 1}      # failed write left it intact
+
+    _write_json(str(path), {"new": float("nan")})
+    assert list(json.loads(path.read_text())) == ["new"]
+    assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+
+    # concurrent writers each use their own temp file
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda i: _write_json(str(path), {"writer": i, "pad": "x" * 100_000}),
+                          range(40)))
+    assert json.loads(path.read_text())["writer"] in range(40)
+    assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+
+
+def test_unchanged_quotes_reuse_stored_history(collector, dipped_stock):
+    import json
+
+    quote = {"regularMarketPrice": 10.0, "marketCap": 1e9, "exchange": "NMS"}
+    collector._fetch_bulk_info = lambda batch: (
+        {"AAA": dict(quote, regularMarketTime=100), "BBB": dict(quote, regularMarketTime=200)},
+        {}, {}, {}, {})
+    requested = []
+
+    def fake_history(symbols):
+        requested.extend(symbols)
+        return {s: dipped_stock.tail(21) for s in symbols}
+    collector._fetch_history_bulk = fake_history
+
+    first = collector.process_ticker_batch(["AAA", "BBB"], use_fetch_cache=False)
+    requested.clear()
+    collector._fetch_bulk_info = lambda batch: (
+        {"AAA": dict(quote, regularMarketTime=100), "BBB": dict(quote, regularMarketTime=300)},
+        {}, {}, {}, {})
+    second = collector.process_ticker_batch(["AAA", "BBB"], use_fetch_cache=False)
+
+    assert requested == ["BBB"]
+    assert second["AAA"]["historical_data"] == first["AAA"]["historical_data"]
+    assert json.loads(json.dumps(second["AAA"])) == json.loads(json.dumps(first["AAA"]))
+
+
+def test_history_long_frame_matches_stored_history():
+    from data_collector import _history_long_frame
+
+    stock_data = {
+        "AAA": {"historical_data": {"dates": ["2026-01-02", "2026-01-05"],
+                                    "close": [10.0, 11.0], "high": [10.5, 11.5],
+                                    "low": [9.5, 10.5], "volume": [100, 200]}},
+        "BBB": {"historical_data": {"dates": ["2026-01-02"], "close": [5.0]}},
+        "BAD": {"historical_data": {"dates": ["2026-01-02"], "close": [1.0, 2.0]}},
+        "NONE": {},
+    }
+    frame = _history_long_frame(stock_data)
+
+    assert list(frame["ticker"].cat.categories) == ["AAA", "BBB"]
+    aaa = frame[frame["ticker"] == "AAA"]
+    assert aaa["close"].tolist() == [10.0, 11.0]
+    assert aaa["volume"].tolist() == [100, 200]
+    assert str(aaa["date"].iloc[1].date()) == "2026-01-05"
+    bbb = frame[frame["ticker"] == "BBB"]
+    assert bbb[["high", "low"]].iloc[0].tolist() == [5.0, 5.0]
+    assert bbb["volume"].iloc[0] == 0
+    assert len(_history_long_frame({})) == 0
+
+
+def test_stock_snapshots_are_memoised(monkeypatch):
+    from collectors import finnhub_collector
+    from collectors.finnhub_collector import FinnhubCollector, RateLimitError
+
+    collector = FinnhubCollector(api_key="test")
+    calls = []
+
+    def fake_fetch(symbol):
+        calls.append(symbol)
+        if symbol == "ERR":
+            raise ConnectionError("timeout")
+        if symbol == "LIMIT":
+            raise RateLimitError("429")
+        if symbol == "BAD":
+            return None, True                   # unsupported ticker
+        return {"current_price": 1.0}, symbol != "PART"
+    monkeypatch.setattr(collector, "_fetch_snapshot", fake_fetch)
+
+    first = collector.get_stock_snapshots(["AAA", "BAD", "ERR", "PART", "AAA"])
+    assert first == {"AAA": {"current_price": 1.0}, "BAD": None,
+                     "PART": {"current_price": 1.0}}
+    assert sorted(calls) == ["AAA", "BAD", "ERR", "PART"]
+
+    # unsupported misses are remembered; errors and partial snapshots are not
+    calls.clear()
+    second = collector.get_stock_snapshots(["AAA", "BAD", "ERR", "PART", "CCC"])
+    assert sorted(calls) == ["CCC", "ERR", "PART"]
+    assert second["AAA"] == {"current_price": 1.0} and second["BAD"] is None
+
+    # a rate limit keeps the snapshots gathered so far and caches nothing for it
+    calls.clear()
+    third = collector.get_stock_snapshots(["DDD", "LIMIT"], max_workers=1)
+    assert third["DDD"] == {"current_price": 1.0} and "LIMIT" not in third
+    calls.clear()
+    collector.get_stock_snapshots(["DDD", "LIMIT"], max_workers=1)
+    assert calls == ["LIMIT"]
+
+    # expired entries are fetched again
+    calls.clear()
+    monkeypatch.setattr(finnhub_collector, "SNAPSHOT_TTL_SECONDS", 0)
+    collector.get_stock_snapshots(["AAA"])
+    assert calls == ["AAA"]
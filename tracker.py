@@ -105,6 +105,20 @@ class StockTracker:
         timestamp = datetime.now().strftime('%Y%m%d')
         output_file = os.path.join(self.output_dir, f"scan_{timestamp}.csv")
         df_all.to_csv(output_file, index=False)
+        parquet_file = output_file[:-len('.csv')] + '.parquet'
+        try:
+            # Columnar sidecar for the dashboard (needs pyarrow; CSV stays canonical)
+            df_all.assign(score_details=df_all['score_details'].map(
+                lambda d: json.dumps(d, default=str))
+            ).to_parquet(parquet_file, index=False)
+        except ImportError:
+            pass
+        except Exception as e:
+            # e.g. ArrowInvalid on a mixed-type column - the sidecar is optional,
+            # and a half-written one must not shadow the CSV in the dashboard
+            print(f"Warning: could not write Parquet sidecar: {e}")
+            if os.path.exists(parquet_file):
+                os.remove(parquet_file)
         
         # Update watchlist with new opportunities
         self._update_watchlist(watch_df)
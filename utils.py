@@ -299,41 +299,14 @@ def calculate_score(stock_data: pd.DataFrame, fundamentals: dict):
         return 0, {}
 
     try:
-        current_price = stock_data["Close"].iloc[-1]
-        high_5d = stock_data["Close"].tail(5).max()
-        drop_pct = ((high_5d - current_price) / high_5d) * 100
-
-        # RSI 5
-        rsi5 = calculate_rsi(stock_data["Close"], period=5).iloc[-1]
-
-        # Volume spike
-        vol_avg20 = stock_data["Volume"].tail(20).mean()
-        vol_ratio = stock_data["Volume"].iloc[-1] / vol_avg20 * 100
-
-        # SMA200 (if we have ≥200 observations)
-        sma200 = stock_data["Close"].rolling(window=200).mean().iloc[-1] if len(stock_data) >= 200 else None
+        # Technical inputs in one compiled pass over the raw arrays
+        from collectors._score_numba import legacy_technicals
+        close = stock_data["Close"].to_numpy(dtype=float)
+        current_price = close[-1]
+        drop_pct, rsi5, vol_ratio, sma200, sma50, macd_hist = legacy_technicals(
+            close, stock_data["Volume"].to_numpy(dtype=float))
         below_sma = sma200 and current_price < sma200
 
-        # MACD bullish cross last 5 days
-        ema12 = stock_data["Close"].ewm(span=12, adjust=False).mean()
-        ema26 = stock_data["Close"].ewm(span=26, adjust=False).mean()
-        macd = ema12 - ema26
-        signal = macd.ewm(span=9, adjust=False).mean()
-        bullish = (macd.iloc[-2] < signal.iloc[-2]) and (macd.iloc[-1] > signal.iloc[-1])
-
-        # ATR %
-        tr = stock_data[["High", "Low", "Close"]].copy()
-        tr["prev_close"] = tr["Close"].shift(1)
-        tr["tr"] = tr[["High", "prev_close"]].max(axis=1) - tr[["Low", "prev_close"]].min(axis=1)
-        atr14 = tr["tr"].rolling(14).mean().iloc[-1]
-        atr_pct = atr14 / current_price * 100 if atr14 else 0
-
-        # Fundamental fields
-        pe = fundamentals.get("pe") or fundamentals.get("trailingPE")
-        div_yield = fundamentals.get("dividend_yield", 0) or 0
-        beta = fundamentals.get("beta", 1)
-        short_pct = fundamentals.get("short_percent_float", 0) or 0
-
         score = 0
         details = {}
 
@@ -360,7 +333,6 @@ def calculate_score(stock_data: pd.DataFrame, fundamentals: dict):
 
         # Trend filters
         sma_pts = 10 if below_sma else 0
-        sma50 = stock_data["Close"].rolling(window=50).mean().iloc[-1] if len(stock_data) >= 50 else None
         below_sma50 = sma50 and current_price < sma50
         sma50_pts = 5 if below_sma50 else 0
         score += sma_pts + sma50_pts
@@ -368,36 +340,114 @@ def calculate_score(stock_data: pd.DataFrame, fundamentals: dict):
         details["below_sma50"] = sma50_pts
 
         # MACD bullish (positive histogram)
-        macd_hist = macd.iloc[-1] - signal.iloc[-1]
         macd_pts = 5 if macd_hist > 0 else 0
         score += macd_pts; details["macd_bull_cross"] = macd_pts
 
-        # Valuation – PE
-        if pe and pe < 15:
-            pe_pts = 10
-        elif pe and pe < 25:
-            pe_pts = 5
-        else:
-            pe_pts = 0
-        score += pe_pts; details["pe"] = pe_pts
-
-        # Dividend yield bonus
-        div_pts = 5 if div_yield and div_yield > 0.03 else 0
-        score += div_pts; details["div_yield"] = div_pts
-
-        # Beta penalty for high volatility
-        beta_pts = -5 if beta and beta > 2 else 0
-        score += beta_pts; details["beta"] = beta_pts
-
-        # Short interest penalty
-        short_pts = -10 if short_pct and short_pct > 0.15 else 0
-        score += short_pts; details["short_float"] = short_pts
+        fund_pts = _fundamental_points(fundamentals)
+        score += sum(fund_pts.values()); details.update(fund_pts)
 
         return max(score, 0), details
     except Exception as e:
         print("Error calculating score:", e)
         return 0, {}
 
+
+def _fundamental_points(fundamentals: dict) -> dict:
+    """Valuation / risk points of :func:`calculate_score` (PE, yield, beta, short float)."""
+    pe = fundamentals.get("pe") or fundamentals.get("trailingPE")
+    div_yield = fundamentals.get("dividend_yield", 0) or 0
+    beta = fundamentals.get("beta", 1)
+    short_pct = fundamentals.get("short_percent_float", 0) or 0
+
+    # Valuation – PE
+    if pe and pe < 15:
+        pe_pts = 10
+    elif pe and pe < 25:
+        pe_pts = 5
+    else:
+        pe_pts = 0
+
+    return {
+        "pe": pe_pts,
+        # Dividend yield bonus
+        "div_yield": 5 if div_yield and div_yield > 0.03 else 0,
+        # Beta penalty for high volatility
+        "beta": -5 if beta and beta > 2 else 0,
+        # Short interest penalty
+        "short_float": -10 if short_pct and short_pct > 0.15 else 0,
+    }
+
+
+def calculate_score_panel(closes: pd.DataFrame, volumes: pd.DataFrame,
+                          fundamentals: dict) -> dict:
+    """:func:`calculate_score` for many tickers at once.
+
+    *closes* / *volumes* are date x ticker panels aligned on the most recent
+    bar (shorter histories NaN-padded at the top) and *fundamentals* maps
+    ticker -> the dict ``calculate_score`` takes.  The technical factors are
+    column-wise NumPy reductions over the whole universe; only the cheap
+    fundamental lookups stay per ticker.
+
+    Returns:
+        {ticker: (score, details)} with the same values as ``calculate_score``
+    """
+    C = closes.to_numpy(dtype=float)
+    V = volumes.to_numpy(dtype=float)
+    n = len(C)
+    has_data = ~np.isnan(C)
+    lengths = np.where(has_data.any(axis=0), n - has_data.argmax(axis=0), 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        current_price = C[-1]
+        high_5d = closes.iloc[-5:].max().to_numpy()
+        drop_pct = (high_5d - current_price) / high_5d * 100
+        pd_pts = np.where(drop_pct >= 3, np.minimum(30, np.trunc(drop_pct)), 0)
+
+        # RSI 5 (simple means of the last 5 gains / losses, as calculate_rsi)
+        delta = np.diff(C[-6:], axis=0)
+        gain = np.where(delta > 0, delta, 0).mean(axis=0)
+        loss = np.where(delta < 0, -delta, 0).mean(axis=0)
+        rsi5 = 100 - 100 / (1 + gain / loss)
+        rsi_pts = np.where(rsi5 <= 30, 25, np.where(rsi5 <= 40, 10, 0))
+
+        # Volume spike
+        vol_ratio = V[-1] / volumes.iloc[-20:].mean().to_numpy() * 100
+        vol_pts = np.select([vol_ratio >= 200, vol_ratio >= 150, vol_ratio >= 120], [20, 15, 8], 0)
+
+        # Trend filters (a window with any missing bar gives NaN -> no points)
+        def below_sma(window):
+            sma = C[-window:].mean(axis=0) if n >= window else np.full(C.shape[1], np.nan)
+            return (sma != 0) & (current_price < sma)
+        sma_pts = np.where(below_sma(200), 10, 0)
+        sma50_pts = np.where(below_sma(50), 5, 0)
+
+        # MACD histogram
+        macd = (closes.ewm(span=12, adjust=False).mean()
+                - closes.ewm(span=26, adjust=False).mean())
+        signal = macd.ewm(span=9, adjust=False).mean()
+        macd_pts = np.where((macd.iloc[-1] - signal.iloc[-1]).to_numpy() > 0, 5, 0)
+
+    results = {}
+    for j, ticker in enumerate(closes.columns):
+        if lengths[j] < 20:
+            results[ticker] = (0, {})
+            continue
+        details = {
+            "price_drop": int(pd_pts[j]), "rsi5": int(rsi_pts[j]),
+            "volume_spike": int(vol_pts[j]), "below_sma200": int(sma_pts[j]),
+            "below_sma50": int(sma50_pts[j]), "macd_bull_cross": int(macd_pts[j]),
+        }
+        try:
+            details.update(_fundamental_points(fundamentals.get(ticker, {})))
+        except Exception as e:
+            # e.g. Yahoo's trailingPE "Infinity" string - same fallback as
+            # calculate_score, and the rest of the universe still scores
+            print("Error calculating score:", e)
+            results[ticker] = (0, {})
+            continue
+        results[ticker] = (max(sum(details.values()), 0), details)
+    return results
+
 def save_to_json(data, filename):
     """Save data to a JSON file."""
     with open(filename, 'w') as f: